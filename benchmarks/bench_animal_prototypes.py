@@ -0,0 +1,66 @@
+# This file benchmarks the shared species prototypes against constructing a new
+# animal for every encounter, on time and on memory allocated with tracemalloc.
+#
+# Run from the project root with: python -m benchmarks.bench_animal_prototypes [count]
+
+import random
+import sys
+import time
+import tracemalloc
+
+from game.Animal.encounter_table import ENCOUNTER_TABLES
+from utils.day_period import DayPeriod
+
+
+def new_animal(table, rng):
+    """
+    Returns a new animal of a sampled species, as encounters did before the prototypes.
+    """
+    return type(table.sample(rng))()
+
+
+def shared_animal(table, rng):
+    """
+    Returns the shared prototype of a sampled species.
+    """
+    return table.sample(rng)
+
+
+def measure(label, count, encounter):
+    """
+    Times `count` encounters, then measures the memory they keep alive and allocate.
+
+    :param label: The name of the measured strategy.
+    :param count: The number of encounters.
+    :param encounter: A function (table, rng) returning the animal of an encounter.
+    """
+    table = ENCOUNTER_TABLES[DayPeriod.NIGHT]
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(count):
+        encounter(table, rng)
+    elapsed = time.perf_counter() - start
+
+    rng = random.Random(0)
+    animals = [None] * count
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        animals[i] = encounter(table, rng)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<20}{elapsed:>8.3f} s{elapsed / count * 1e9:>9.0f} ns/encounter"
+          f"{(retained - before) / count:>10.1f} B retained/encounter{(peak - before) / count:>9.1f} B peak/encounter")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{count} encounters")
+    measure("new animal", count, new_animal)
+    measure("shared prototype", count, shared_animal)
+
+
+if __name__ == "__main__":
+    main()
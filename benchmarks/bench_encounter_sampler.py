@@ -0,0 +1,79 @@
+# This file benchmarks the sampling of animal encounters.
+# It compares the previous cumulative search, which rebuilt its table on every call,
+# with the precompiled alias tables, then measures how the alias method scales with
+# the number of species.
+#
+# Run from the project root with: python -m benchmarks.bench_encounter_sampler [count]
+
+import random
+import sys
+import time
+
+from game.Animal.animal import ENCOUNTER_PROBABILITIES, Animal
+from game.Animal.encounter_table import ENCOUNTER_TABLES, EncounterTable
+from utils.day_period import DayPeriod
+from utils.range import Range
+
+
+def legacy_sample(day_period, rng):
+    """
+    Samples a species the way `Animal.get_random` did before the precompiled tables.
+    """
+    from game.Animal.jaguar import Jaguar
+    from game.Animal.caiman import Caiman
+    from game.Animal.anaconda import Anaconda
+    from game.Animal.harpy import Harpy
+
+    probabilities = {
+        DayPeriod.DAWN: [0.25, 0.10, 0.15, 0.50],
+        DayPeriod.MORNING: [0.05, 0.25, 0.10, 0.60],
+        DayPeriod.AFTERNOON: [0.10, 0.30, 0.10, 0.50],
+        DayPeriod.NIGHT: [0.20, 0.05, 0.35, 0.40]
+    }
+    current_probs = probabilities[day_period]
+    prob = Range(0, 1.0).get_random(rng=rng)
+
+    cumulative = 0
+    animals = [Jaguar, Caiman, Anaconda, Harpy]
+    for i, animal_prob in enumerate(current_probs):
+        cumulative += animal_prob
+        if prob <= cumulative:
+            return animals[i]
+    return Harpy
+
+
+def measure(label, count, sample):
+    """
+    Times `count` calls of a sampler and prints one result line.
+
+    :return: The sampled species.
+    :rtype: list
+    """
+    start = time.perf_counter()
+    samples = [sample() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:>9.3f} s{elapsed / count * 1e9:>10.0f} ns/sample")
+    return samples
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    table = ENCOUNTER_TABLES[DayPeriod.NIGHT]
+
+    print(f"{count} samples at night")
+    legacy = measure("cumulative search", count, lambda: legacy_sample(DayPeriod.NIGHT, rng))
+    alias = [type(animal) for animal in measure("alias table", count, lambda: table.sample(rng))]
+    for species, probability in zip(Animal.get_species(), ENCOUNTER_PROBABILITIES[DayPeriod.NIGHT]):
+        print(f"    {species.__name__:<10} expected {probability:.4f}   cumulative "
+              f"{legacy.count(species) / count:.4f}   alias {alias.count(species) / count:.4f}")
+    print()
+
+    for size in (4, 40, 400, 4000):
+        weights = [rng.random() for _ in range(size)]
+        synthetic = EncounterTable(list(range(size)), weights)
+        measure(f"alias table, {size} species", count, lambda: synthetic.sample(rng))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# This file benchmarks the cached status panels of GameManager. It prints the
+# three panels of the main screen, as every redraw does, with the panel caches and
+# with the uncached functions they wrap, and for an unchanged and a changing state.
+#
+# Run from the project root with: python -m benchmarks.bench_panels [count]
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+from game import game_manager as game_manager_module
+from game.simulation.simulator import new_game
+
+PANELS = ("format_game_panel", "format_player_panel", "format_inventory_panel")
+
+
+def measure(label, count, game_manager, change_state):
+    """
+    Times `count` redraws of the panels and prints one result line.
+    """
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for i in range(count):
+            if change_state:
+                game_manager.time = i * 0.01 % 24
+            game_manager.print_game_status()
+            game_manager.print_player_status()
+            game_manager.print_player_inventory(under_bar=True)
+        elapsed = time.perf_counter() - start
+    print(f"{label:<36}{elapsed / count * 1e6:>8.2f} us/redraw")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    game_manager = new_game("Hunter")
+    print(f"{count} redraws")
+
+    measure("cached, unchanged state", count, game_manager, False)
+    measure("cached, time changing every redraw", count, game_manager, True)
+
+    cached = {name: getattr(game_manager_module, name) for name in PANELS}
+    try:
+        for name, function in cached.items():
+            setattr(game_manager_module, name, function.__wrapped__)
+        measure("uncached", count, game_manager, False)
+    finally:
+        for name, function in cached.items():
+            setattr(game_manager_module, name, function)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# This file benchmarks PlayerBatch against Player objects on a population of games
+# where every player hunts until death, and compares the days survived.
+#
+# Run from the project root with: python -m benchmarks.bench_player_batch [count]
+
+import random
+import sys
+import time
+
+from game.rules import FIGHT, find_animal, resolve_hunt
+from game.simulation.player_batch import PlayerBatch
+from game.simulation.simulator import PLAYER_CLASSES, new_game
+from game.simulation.vectorized import require_numpy
+
+
+def run_objects(count, seed):
+    """
+    Plays the games one by one with GameManager and Player objects.
+
+    :return: The days survived of every game, and the number of turns played.
+    :rtype: tuple
+    """
+    rng = random.Random(seed)
+    days, turns = [], 0
+    for i in range(count):
+        game_manager = new_game(PLAYER_CLASSES[i % len(PLAYER_CLASSES)], rng)
+        while game_manager.player.hp > 0:
+            resolve_hunt(game_manager, find_animal(game_manager), FIGHT)
+            turns += 1
+        days.append(game_manager.days_survived)
+    return days, turns
+
+
+def run_batch(count, seed):
+    """
+    Plays the games together in a PlayerBatch.
+
+    :return: The batch at the end of the games, and the number of turns played.
+    :rtype: tuple
+    """
+    np = require_numpy()
+    batch = PlayerBatch.new_games(np.arange(count) % len(PLAYER_CLASSES), np.random.default_rng(seed))
+    turns = 0
+    alive = batch.alive
+    while alive.any():
+        turns += int(alive.sum())
+        batch.hunt(True, alive)
+        alive = batch.alive
+    return batch, turns
+
+
+def main():
+    np = require_numpy()
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    start = time.perf_counter()
+    days, object_turns = run_objects(count, 0)
+    object_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch, batch_turns = run_batch(count * 10, 0)
+    batch_time = time.perf_counter() - start
+
+    print(f"{'Player objects':<16}{count:>9} games{object_time:>9.3f} s{object_turns / object_time:>14,.0f} turns/s")
+    print(f"{'PlayerBatch':<16}{count * 10:>9} games{batch_time:>9.3f} s{batch_turns / batch_time:>14,.0f} turns/s")
+    print()
+    for class_id, class_name in enumerate(PLAYER_CLASSES):
+        object_days = days[class_id::len(PLAYER_CLASSES)]
+        batch_days = batch.days_survived[batch.class_ids == class_id]
+        print(f"{class_name:<8} mean days survived: objects {sum(object_days) / len(object_days):.3f}"
+              f"   batch {batch_days.mean():.3f}")
+
+
+if __name__ == "__main__":
+    main()
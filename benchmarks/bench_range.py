@@ -0,0 +1,80 @@
+# This file benchmarks the immutable Range against the previous mutable class.
+# It compares allocating a range on every draw with drawing from a module-level
+# constant, single draws with batch draws, and the memory used per instance.
+#
+# Run from the project root with: python -m benchmarks.bench_range [count]
+
+import random
+import sys
+import time
+import tracemalloc
+
+from utils.range import Range
+
+
+class LegacyRange:
+    """
+    The mutable Range class as it was before it became an immutable value.
+    """
+    def __init__(self, min, max):
+        if min > max:
+            raise ValueError(f"min ({min}) must not be bigger than max ({max})")
+        self.min = min
+        self.max = max
+
+    def get_random(self, as_int=False, rng=None):
+        rng = rng or random
+        if as_int:
+            return rng.randint(self.min, self.max)
+        return rng.uniform(self.min, self.max)
+
+
+CONSTANT = Range(0.3, 0.4)
+INT_CONSTANT = Range(1, 2)
+
+
+def measure(label, count, function):
+    """
+    Times a function drawing `count` values and prints one result line.
+    """
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36}{elapsed:>8.3f} s{elapsed / count * 1e9:>8.0f} ns/value")
+
+
+def instance_size(cls, count):
+    """
+    Returns the memory allocated per instance of a range class, in bytes.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(i, i + 1) for i in range(count)]
+    size = (tracemalloc.get_traced_memory()[0] - before) / count
+    tracemalloc.stop()
+    del instances
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+
+    print(f"{count} draws")
+    measure("legacy, new range per draw", count,
+            lambda: [LegacyRange(0.3, 0.4).get_random(rng=rng) for _ in range(count)])
+    measure("immutable, new range per draw", count,
+            lambda: [Range(0.3, 0.4).get_random(rng=rng) for _ in range(count)])
+    measure("immutable, module constant", count, lambda: [CONSTANT.get_random(rng=rng) for _ in range(count)])
+    measure("immutable, get_random(n=count)", count, lambda: CONSTANT.get_random(rng=rng, n=count))
+    measure("integers, module constant", count,
+            lambda: [INT_CONSTANT.get_random(as_int=True, rng=rng) for _ in range(count)])
+    measure("integers, get_random(n=count)", count, lambda: INT_CONSTANT.get_random(as_int=True, rng=rng, n=count))
+    print()
+
+    print(f"{'legacy instance size':<36}{instance_size(LegacyRange, 100_000):>8.0f} B")
+    print(f"{'immutable instance size':<36}{instance_size(Range, 100_000):>8.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# This file benchmarks drawing the game screen with the frame renderer against
+# clearing the terminal with `os.system`. It draws the main menu of `game_loop`
+# repeatedly, as after a cancelled choice, and reports the time and the bytes
+# written per screen; the output goes to an in-memory terminal, and `clear` to
+# /dev/null.
+#
+# Run from the project root with: python -m benchmarks.bench_renderer [count]
+
+import io
+import os
+import sys
+import time
+
+from game.simulation.simulator import new_game
+from utils.renderer import FrameRenderer
+
+
+class MemoryTerminal(io.StringIO):
+    """
+    An in-memory stream that claims to be a terminal, so the renderer diffs frames.
+    """
+    def isatty(self):
+        return True
+
+
+def draw_screen(game_manager):
+    """
+    Prints the main menu of the game loop.
+    """
+    game_manager.print_game_status()
+    game_manager.print_player_status()
+    game_manager.print_player_inventory(under_bar=True)
+    print()
+    for line in ("1 : Eat", "2 : Sleep", "3 : Fish", "4 : Hunt", "", "5 : Save Game", "6 : Return to Menu", ""):
+        print(line)
+    print("Enter your choice: ", end="")
+
+
+def measure(label, count, draw, stream):
+    """
+    Times `count` screens and prints one result line.
+    """
+    stdout = sys.stdout
+    start = time.perf_counter()
+    try:
+        for _ in range(count):
+            draw()
+    finally:
+        sys.stdout = stdout
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32}{elapsed / count * 1e6:>10.0f} us/screen{len(stream.getvalue()) / count:>10.0f} B/screen")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    game_manager = new_game("Hunter")
+    os.environ.setdefault("TERM", "xterm")
+    print(f"{count} screens")
+
+    legacy = MemoryTerminal()
+
+    def clear_and_print():
+        os.system("clear > /dev/null")
+        sys.stdout = legacy
+        draw_screen(game_manager)
+        sys.stdout.flush()
+
+    measure("os.system('clear') + print", count, clear_and_print, legacy)
+
+    for label, diff in (("renderer, full frames", False), ("renderer, changed lines", True)):
+        stream = MemoryTerminal()
+        renderer = FrameRenderer(stream, diff)
+
+        def render():
+            sys.stdout = renderer
+            renderer.new_frame()
+            draw_screen(game_manager)
+            renderer.flush()
+
+        measure(label, count, render, stream)
+
+
+if __name__ == "__main__":
+    main()
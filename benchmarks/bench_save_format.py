@@ -0,0 +1,78 @@
+# This file benchmarks the save formats on a large number of player profiles.
+# It compares the legacy pretty-printed JSON file, compact JSON records and binary
+# records on total size, encode time and decode time.
+#
+# Run from the project root with: python -m benchmarks.bench_save_format [count]
+
+import json
+import random
+import sys
+import time
+
+from game.data import codec
+from game.game_manager import GameManager
+from game.player import Player
+from game.player_class.fisher import Fisher
+from game.player_class.hunter import Hunter
+from utils.range import Range
+
+
+def make_profiles(count, seed=0):
+    """
+    Generates saved game dictionaries for random player profiles.
+
+    :param count: The number of profiles to generate.
+    :type count: int
+    :param seed: The seed of the random generator.
+    :type seed: int
+    :return: A list of saved game dictionaries.
+    :rtype: list
+    """
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        low = rng.uniform(0.2, 0.5)
+        player = Player(f"P{i:07d}", rng.choice((Fisher(), Hunter())), hp=rng.uniform(0, 20),
+                        hunger=rng.uniform(0, 20), energy=rng.uniform(0, 16),
+                        fish_pull_delay=Range(low, low + 0.1), hunt_success_rate=Range(low, low + 0.2),
+                        run_success_rate=Range(low, low + 0.15), fish_amount=rng.randint(0, 30),
+                        meat_amount=rng.randint(0, 30))
+        profiles.append(GameManager(player, rng.uniform(0, 23.9), rng.randint(0, 500)).to_dict())
+    return profiles
+
+
+def measure(label, encode, decode):
+    """
+    Times an encoder and a decoder and prints one result line.
+
+    :param label: The name of the measured format.
+    :param encode: A function without argument returning the encoded records.
+    :param decode: A function decoding the encoded records.
+    """
+    start = time.perf_counter()
+    encoded = encode()
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decode(encoded)
+    decode_time = time.perf_counter() - start
+
+    size = len(encoded) if isinstance(encoded, (str, bytes)) else sum(len(e) for e in encoded)
+    print(f"{label:<22}{size / 1e6:>10.2f} MB{encode_time:>12.3f} s{decode_time:>12.3f} s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    profiles = make_profiles(count)
+
+    print(f"{count} profiles")
+    print(f"{'format':<22}{'size':>13}{'encode':>14}{'decode':>14}")
+    measure("legacy JSON file", lambda: json.dumps(profiles, indent=4), json.loads)
+    measure("JSON records", lambda: [codec.encode(p, codec.FORMAT_JSON) for p in profiles],
+            lambda records: [codec.decode(r) for r in records])
+    measure("binary records", lambda: [codec.encode(p, codec.FORMAT_BINARY) for p in profiles],
+            lambda records: [codec.decode(r) for r in records])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# This file benchmarks bulk loading of saves through the validated path and the
+# trusted fast path used for records whose checksum matches.
+#
+# Run from the project root with: python -m benchmarks.bench_trusted_load [count]
+
+import sys
+import time
+import zlib
+
+from benchmarks.bench_save_format import make_profiles
+from game.data import codec
+from game.game_manager import GameManager
+
+
+def measure(label, records, load):
+    """
+    Times the decoding and loading of every record and prints one result line.
+
+    :param label: The name of the measured path.
+    :param records: The encoded records.
+    :param load: A function turning an encoded record into a GameManager.
+    """
+    start = time.perf_counter()
+    for record in records:
+        load(record)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed:>9.3f} s{len(records) / elapsed:>14,.0f} loads/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    profiles = make_profiles(count)
+
+    print(f"{count} profiles")
+    for save_format in codec.SAVE_FORMATS:
+        records = [codec.encode(p, save_format) for p in profiles]
+        records = [r.encode("utf-8") if isinstance(r, str) else r for r in records]
+        checksums = [zlib.crc32(r) for r in records]
+        verified = list(zip(records, checksums))
+
+        measure(f"{save_format} validated", records, lambda r: GameManager.from_dict(codec.decode(r)))
+        measure(f"{save_format} checksum + trusted", verified,
+                lambda v: zlib.crc32(v[0]) == v[1] and GameManager.from_trusted_dict(codec.decode(v[0])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# This file benchmarks the vectorized encounter resolver against the scalar rules,
+# and checks that both produce the same distributions of outcomes.
+#
+# Run from the project root with: python -m benchmarks.bench_vectorized_encounters [count]
+
+import random
+import sys
+import time
+
+from game.rules import FIGHT, RUN, find_animal, resolve_hunt
+from game.simulation.simulator import new_game
+from game.simulation.vectorized import DAY_PERIODS, get_species_table, require_numpy, resolve_encounters
+from utils.range import Range
+
+HUNT_RATE = (0.4, 0.5)
+RUN_RATE = (0.45, 0.6)
+
+
+def run_scalar(count, seed):
+    """
+    Resolves encounters one by one with `resolve_hunt`, resetting the player each time.
+
+    :return: The list of (species name, fight, success, meat drop, damage) tuples.
+    :rtype: list
+    """
+    rng = random.Random(seed)
+    game_manager = new_game("Hunter", rng)
+    player = game_manager.player
+    outcomes = []
+    for i in range(count):
+        player.hp = player.max_hp
+        player.hunt_success_rate = Range(*HUNT_RATE)
+        player.run_success_rate = Range(*RUN_RATE)
+        game_manager.time = 6.0 * (i % 4) + 1
+        action = FIGHT if (i // 4) % 2 == 0 else RUN
+        result = resolve_hunt(game_manager, find_animal(game_manager), action)
+        outcomes.append((result.animal.name, action == FIGHT, result.success, result.meat_drop, result.damage))
+    return outcomes
+
+
+def run_vectorized(count, seed):
+    """
+    Resolves the same encounters at once with `resolve_encounters`.
+
+    :return: The batch of outcomes.
+    :rtype: EncounterBatch
+    """
+    np = require_numpy()
+    index = np.arange(count)
+    return resolve_encounters(index % 4, (index // 4) % 2 == 0, np.full(count, HUNT_RATE[0]), np.full(count, HUNT_RATE[1]),
+                              np.full(count, RUN_RATE[0]), np.full(count, RUN_RATE[1]),
+                              np.random.default_rng(seed))
+
+
+def main():
+    np = require_numpy()
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    start = time.perf_counter()
+    scalar = run_scalar(count, 0)
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = run_vectorized(count, 0)
+    vectorized_time = time.perf_counter() - start
+
+    print(f"{count} encounters")
+    print(f"{'scalar resolve_hunt':<24}{scalar_time:>9.3f} s{count / scalar_time:>16,.0f} encounters/s")
+    print(f"{'resolve_encounters':<24}{vectorized_time:>9.3f} s{count / vectorized_time:>16,.0f} encounters/s")
+    print()
+
+    names = get_species_table().names
+    print(f"{'':<24}{'scalar':>10}{'vectorized':>12}")
+    for period in range(len(DAY_PERIODS)):
+        for fight in (True, False):
+            rows = [o for i, o in enumerate(scalar) if i % 4 == period and o[1] == fight]
+            mask = (np.arange(count) % 4 == period) & (batch.fight == fight)
+            label = f"{DAY_PERIODS[period].name} {'fight' if fight else 'run'}"
+            print(f"{label + ' success':<24}{sum(o[2] for o in rows) / len(rows):>10.4f}"
+                  f"{batch.success[mask].mean():>12.4f}")
+            print(f"{label + ' damage':<24}{sum(o[4] for o in rows) / len(rows):>10.4f}"
+                  f"{batch.damage[mask].mean():>12.4f}")
+    for species, name in enumerate(names):
+        print(f"{name + ' share':<24}{sum(o[0] == name for o in scalar) / count:>10.4f}"
+              f"{(batch.species == species).mean():>12.4f}")
+    print(f"{'meat per fight':<24}{sum(o[3] for o in scalar if o[1]) / (count / 2):>10.4f}"
+          f"{batch.meat_drop[batch.fight].mean():>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ class Anaconda(Animal):
     The Anaconda is a dangerous predator with moderate damage and provides a
     decent amount of meat when hunted successfully.
     """
+    __slots__ = ()
 
     def __init__(self):
         """
@@ -1,9 +1,43 @@
 # This file defines the abstract base class for all animals in the game.
+import random
 from abc import ABC
 
 from utils.range import Range
 from utils.day_period import DayPeriod
 
+# The probability of meeting each species of `Animal.get_species`, per period of the day.
+ENCOUNTER_PROBABILITIES = {
+    DayPeriod.DAWN: [0.25, 0.10, 0.15, 0.50],
+    DayPeriod.MORNING: [0.05, 0.25, 0.10, 0.60],
+    DayPeriod.AFTERNOON: [0.10, 0.30, 0.10, 0.50],
+    DayPeriod.NIGHT: [0.20, 0.05, 0.35, 0.40]
+}
+
+_encounter_tables = None
+
+
+def _load_encounter_tables():
+    """
+    Imports the precompiled encounter tables, which depend on every animal class.
+
+    :return: The encounter table of each DayPeriod.
+    :rtype: dict
+    """
+    global _encounter_tables
+    from game.Animal.encounter_table import ENCOUNTER_TABLES
+    _encounter_tables = ENCOUNTER_TABLES
+    return _encounter_tables
+
+
+def _restore_animal(cls, values):
+    """
+    Recreates an animal when it is unpickled or copied, without calling its constructor.
+    """
+    animal = cls.__new__(cls)
+    for name, value in zip(Animal.__slots__, values):
+        object.__setattr__(animal, name, value)
+    return animal
+
 
 class Animal(ABC):
     """
@@ -13,7 +47,12 @@ class Animal(ABC):
     attributes like damage, success rate taxes for hunting and running, meat drop
     amount, and ASCII art. It also includes a static method to get a random
     animal based on the time of day.
+
+    Animals are immutable templates: the game shares one prototype per species,
+    see `game.Animal.registry`, and keeps per-encounter state out of them.
     """
+    __slots__ = ("name", "damage", "hunt_success_rate_tax", "run_success_rate_tax", "meat_drop", "ascii_art")
+
     def __init__(self, name, damage, hunt_success_rate_tax, run_success_rate_tax, meat_drop, ascii_art):
         """
         Initializes a new Animal instance.
@@ -44,51 +83,56 @@ class Animal(ABC):
         if not isinstance(ascii_art, str):
             raise TypeError("ascii_art must be a string")
 
-        self.name = name
-        self.damage = damage
-        self.hunt_success_rate_tax = hunt_success_rate_tax
-        self.run_success_rate_tax = run_success_rate_tax
-        self.meat_drop = meat_drop
-        self.ascii_art = ascii_art
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "damage", damage)
+        object.__setattr__(self, "hunt_success_rate_tax", hunt_success_rate_tax)
+        object.__setattr__(self, "run_success_rate_tax", run_success_rate_tax)
+        object.__setattr__(self, "meat_drop", meat_drop)
+        object.__setattr__(self, "ascii_art", ascii_art)
 
-    @staticmethod
-    def get_random(day_period: DayPeriod):
-        """
-        Returns a random animal instance based on the time of day.
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-        The probability of encountering each type of animal changes depending on
-        whether it is dawn, morning, afternoon, or night.
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-        :param day_period: The current period of the day.
-        :type day_period: DayPeriod
-        :return: An instance of a randomly selected animal class.
-        :rtype: Animal
-        :raises TypeError: If day_period is not a DayPeriod enum.
+    def __reduce__(self):
+        return _restore_animal, (type(self), tuple(getattr(self, name) for name in Animal.__slots__))
+
+    @staticmethod
+    def get_species():
         """
-        if not isinstance(day_period, DayPeriod):
-            raise TypeError("day_period must be a DayPeriod enum")
+        Returns the animal classes, in the order of ENCOUNTER_PROBABILITIES.
 
+        :return: The list of animal classes.
+        :rtype: list
+        """
         from game.Animal.jaguar import Jaguar
         from game.Animal.caiman import Caiman
         from game.Animal.anaconda import Anaconda
         from game.Animal.harpy import Harpy
 
-        probabilities = {
-            DayPeriod.DAWN: [0.25, 0.10, 0.15, 0.50],
-            DayPeriod.MORNING: [0.05, 0.25, 0.10, 0.60],
-            DayPeriod.AFTERNOON: [0.10, 0.30, 0.10, 0.50],
-            DayPeriod.NIGHT: [0.20, 0.05, 0.35, 0.40]
-        }
+        return [Jaguar, Caiman, Anaconda, Harpy]
 
-        current_probs = probabilities[day_period]
-        prob = Range(0, 1.0).get_random()
+    @staticmethod
+    def get_random(day_period: DayPeriod, rng=None):
+        """
+        Returns the shared prototype of a random species based on the time of day.
 
-        cumulative = 0
-        animals = [Jaguar, Caiman, Anaconda, Harpy]
+        The probability of encountering each type of animal changes depending on
+        whether it is dawn, morning, afternoon, or night. The species is sampled from
+        the tables precompiled in `game.Animal.encounter_table`.
 
-        for i, animal_prob in enumerate(current_probs):
-            cumulative += animal_prob
-            if prob <= cumulative:
-                return animals[i]()
+        :param day_period: The current period of the day.
+        :type day_period: DayPeriod
+        :param rng: The random generator to draw from; defaults to the `random` module.
+        :type rng: random.Random
+        :return: The prototype of a randomly selected animal class.
+        :rtype: Animal
+        :raises TypeError: If day_period is not a DayPeriod enum.
+        """
+        if not isinstance(day_period, DayPeriod):
+            raise TypeError("day_period must be a DayPeriod enum")
 
-        return Harpy()
\ No newline at end of file
+        tables = _encounter_tables or _load_encounter_tables()
+        return tables[day_period].sample(rng or random)
@@ -11,6 +11,7 @@ class Caiman(Animal):
     The Caiman is a strong animal, often found near water. It poses a
     significant threat and rewards the player with a good amount of meat.
     """
+    __slots__ = ()
 
     def __init__(self):
         """
@@ -0,0 +1,70 @@
+# This file defines the precompiled encounter tables of the animals.
+# Each table is built once, when the module is imported, with Vose's alias method:
+# sampling a species then takes one random draw, one multiplication and one
+# comparison, whatever the number of species, and allocates nothing. The tables hold
+# the shared species prototypes of `game.Animal.registry`.
+
+from game.Animal.animal import ENCOUNTER_PROBABILITIES
+from game.Animal.registry import SPECIES
+
+
+class EncounterTable:
+    """
+    Samples species according to fixed weights in constant time.
+    """
+    def __init__(self, species, weights):
+        """
+        Initializes a new EncounterTable instance, building its alias table.
+
+        :param species: The species to sample from.
+        :type species: list
+        :param weights: The relative probability of each species.
+        :type weights: list
+        :raises ValueError: If the lengths differ, a weight is negative, or all are zero.
+        """
+        if len(species) != len(weights) or not species:
+            raise ValueError("species and weights must be non-empty and of the same length")
+        if any(weight < 0 for weight in weights) or sum(weights) <= 0:
+            raise ValueError("weights must be non-negative with a positive sum")
+
+        size = len(species)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1 - scaled[low]
+            (small if scaled[high] < 1 else large).append(high)
+
+        self.species = list(species)
+        self.probability = probability
+        self.alias = alias
+        self._size = size
+        # One padding entry guards against random() * size rounding up to size.
+        self._species = self.species + [self.species[-1]]
+        self._alias_species = [self.species[i] for i in alias] + [self.species[-1]]
+        self._probability = probability + [1.0]
+
+    def sample(self, rng):
+        """
+        Returns a random species.
+
+        :param rng: The random generator to draw from.
+        :type rng: random.Random
+        :return: The sampled species.
+        """
+        x = rng.random() * self._size
+        i = int(x)
+        if x - i < self._probability[i]:
+            return self._species[i]
+        return self._alias_species[i]
+
+
+ENCOUNTER_TABLES = {day_period: EncounterTable(SPECIES, probabilities)
+                    for day_period, probabilities in ENCOUNTER_PROBABILITIES.items()}
@@ -10,6 +10,8 @@ class Harpy(Animal):
     The Harpy is a relatively common but still dangerous animal. It is quicker
     to run from but offers less meat compared to larger predators.
     """
+    __slots__ = ()
+
     def __init__(self):
         """
         Initializes a new Harpy instance.
@@ -11,6 +11,7 @@ class Jaguar(Animal):
     The Jaguar is a powerful animal with high damage and a significant challenge
     for players to hunt. It provides a substantial amount of meat when defeated.
     """
+    __slots__ = ()
 
     def __init__(self):
         """
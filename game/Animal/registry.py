@@ -0,0 +1,26 @@
+# This file defines the species registry of the game.
+# Animals are immutable templates, so one prototype per species is created when the
+# module is imported and shared by every encounter, instead of constructing and
+# validating a new animal each time. Anything rolled for a particular encounter,
+# like the damage taken or the meat dropped, belongs to the hunt result instead.
+
+from game.Animal.animal import Animal
+
+SPECIES = tuple(species() for species in Animal.get_species())
+SPECIES_BY_NAME = {animal.name: animal for animal in SPECIES}
+
+
+def get_species_prototype(name):
+    """
+    Returns the shared prototype of a species.
+
+    :param name: The name of the species, e.g. "Jaguar".
+    :type name: str
+    :return: The prototype of the species.
+    :rtype: Animal
+    :raises ValueError: If the species is unknown.
+    """
+    try:
+        return SPECIES_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Unknown species: {name}")
@@ -1,11 +1,11 @@
 # This file contains the logic for the eat action in the game.
-from time import sleep
 
 from ascii_art.food_ascii import FoodAscii
 from game.food.fish import Fish
 from game.food.meat import Meat
 from game.game_manager import GameManager
-from utils.range import Range
+from game.rules import get_food_amount, resolve_eat
+from utils.pacing import pause
 from utils.utils import Utils
 
 
@@ -16,9 +16,7 @@ def start_eat(game_manager):
     This function allows the player to consume food (meat or fish) from their inventory. It handles:
     - The player's choice of food to eat.
     - Checking if the player has enough of the selected food.
-    - Calculating the nutritional value and health benefits.
-    - Updating the player's stats (health, hunger) and inventory.
-    - Advancing the game time after the action is completed.
+    - The display of the outcome, which is resolved by `game.rules.resolve_eat`.
 
     :param game_manager: The main game manager object that holds the game state.
     :type game_manager: GameManager
@@ -50,16 +48,15 @@ def start_eat(game_manager):
 
         if choice == 1:
             food = Meat()
-            food_amount = game_manager.player.meat_amount
             ascii_art = FoodAscii.MEAT.value
         else:
             food = Fish()
-            food_amount = game_manager.player.fish_amount
             ascii_art = FoodAscii.FISH.value
+        food_amount = get_food_amount(game_manager, food)
 
         if food_amount <= 0:
             print(f"You don't have any {food.name}.")
-            sleep(2)
+            pause(2)
             return
 
         print(ascii_art)
@@ -69,35 +66,27 @@ def start_eat(game_manager):
                                      out_of_range_msg=f"You don't have that much food (you have {food_amount}).")
 
         print("You are eating...")
-        sleep(2)
+        pause(2)
         print()
 
+        result = resolve_eat(game_manager, food, amount)
+
         print("You finished eating!")
-        sleep(2)
+        pause(2)
         print()
 
-        nutrition = food.nutritional_value.get_random()
-        heal_amount = nutrition * amount * Range(0.85, 0.95).get_random()
-
-        if food.name == "Meat":
-            game_manager.player.meat_amount -= amount
-        elif food.name == "Fish":
-            game_manager.player.fish_amount -= amount
-
-        print(f"Nutritional gain: {Utils.format_float(amount * nutrition)}")
-        print(f"HP gain: {Utils.format_float(heal_amount)}")
-        sleep(2)
+        print(f"Nutritional gain: {Utils.format_float(result.nutrition)}")
+        print(f"HP gain: {Utils.format_float(result.heal_amount)}")
+        pause(2)
         print()
 
-        game_manager.player.eat(amount * nutrition)
-        game_manager.player.heal(heal_amount)
-        print(game_manager.pass_time(amount * Range(0.25, 0.35).get_random(), tax_hunger=False))
+        print(result.time_report)
         print()
 
         input("Press [ENTER] to continue...")
     except (ValueError, TypeError, AttributeError) as e:
         print(f"Error during eat action: {str(e)}")
-        sleep(2)
+        pause(2)
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
-        sleep(2)
\ No newline at end of file
+        pause(2)
\ No newline at end of file
@@ -1,13 +1,15 @@
 # This file contains the logic for the fish action in the game.
-import time
-from time import sleep
 
 from ascii_art.food_ascii import FoodAscii
 from ascii_art.landscape_ascii import LandScapeAscii
 from game.game_manager import GameManager
+from game.rules import FISH_CAUGHT, FISH_EARLY, FISH_LATE, resolve_fish
+from utils.input_backend import get_input_backend
+from utils.pacing import pause
 from utils.range import Range
 from utils.utils import Utils
-import keyboard
+
+BITE_DELAY = Range(3, 15)
 
 
 def start_fish(game_manager):
@@ -19,9 +21,7 @@ def start_fish(game_manager):
     - The player's choice to start fishing.
     - A random delay before the fish appears to test the player's reaction.
     - Checking for early or late key presses.
-    - Awarding fish and experience points upon a successful catch.
-    - Applying a penalty for failure.
-    - Advancing the game time after the action.
+    - The display of the outcome, which is resolved by `game.rules.resolve_fish`.
 
     :param game_manager: The main game manager object that holds the game state.
     :type game_manager: GameManager
@@ -55,69 +55,54 @@ def start_fish(game_manager):
             return
 
         print("Get ready to fish! Press [SPACE] when the fish shows up.")
-        time.sleep(2)
+        pause(2)
         print()
 
-        failed = False
-        duration = Range(3, 15).get_random()
-        start = time.time()
+        backend = get_input_backend()
+        bite_delay = BITE_DELAY.get_random(rng=game_manager.rng)
+        reaction_time = None
+
+        if backend.wait_for_key(" ", bite_delay) is not None:
+            outcome = FISH_EARLY
+        else:
+            print(FoodAscii.FISH.value)
+
+            # The deadline is rolled once, when the fish shows up.
+            pull_delay = game_manager.player.fish_pull_delay.get_random(rng=game_manager.rng)
+            reaction_time = backend.wait_for_key(" ", pull_delay)
+            outcome = FISH_LATE if reaction_time is None else FISH_CAUGHT
 
-        while time.time() - start < duration:
-            if keyboard.is_pressed("space"):
-                failed = True
-                break
+        result = resolve_fish(game_manager, outcome)
 
-        if failed:
+        if outcome == FISH_EARLY:
             print()
             print("Too early!")
-            exp_amount = Range(0.002, 0.005).get_random()
+        elif outcome == FISH_CAUGHT:
+            print()
+            print(f"Reaction time: {Utils.format_float(reaction_time)}s")
+            print(f"You got {result.fish_caught} fish! New amount: {game_manager.player.fish_amount}")
         else:
-            start = time.time()
-            caught = False
-            fish_to_add = 1
-
-            print(FoodAscii.FISH.value)
+            Utils.clear_lines_above(5)
+            print()
+            print("Too late!")
 
-            while time.time() - start < game_manager.player.fish_pull_delay.get_random():
-                if keyboard.is_pressed("space"):
-                    if game_manager.player.player_class.name == "Fisher":
-                        prob = Range(0, 1).get_random()
-                        if prob < 0.075:
-                            fish_to_add = 2
-
-                    game_manager.player.fish_amount += fish_to_add
-                    caught = True
-                    break
-
-            if caught:
-                print()
-                print(f"You got {fish_to_add} fish! New amount: {game_manager.player.fish_amount}")
-                exp_amount = Range(0.008, 0.012).get_random()
-            else:
-                Utils.clear_lines_above(5)
-                print()
-                print("Too late!")
-                exp_amount = Range(0.002, 0.005).get_random()
-
-        sleep(2)
+        pause(2)
         print()
 
-        game_manager.player.lvl_up_fish(exp_amount)
-
-        print(f"EXP gain: {Utils.format_float(exp_amount, 3)}")
-        sleep(2)
+        print(f"EXP gain: {Utils.format_float(result.exp_amount, 3)}")
+        pause(2)
         print()
 
-        print(game_manager.pass_time(Range(0.8, 1.5).get_random()))
+        print(result.time_report)
         print()
 
         input("Press [ENTER] to continue...")
     except KeyboardInterrupt:
         print("\nFishing interrupted.")
-        sleep(1)
+        pause(1)
     except (ValueError, TypeError, AttributeError) as e:
         print(f"Error during fishing action: {str(e)}")
-        sleep(2)
+        pause(2)
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
-        sleep(2)
\ No newline at end of file
+        pause(2)
\ No newline at end of file
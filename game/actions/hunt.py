@@ -1,10 +1,9 @@
 # This file contains the logic for the hunt action in the game.
-from time import sleep
 
 from ascii_art.landscape_ascii import LandScapeAscii
-from game.Animal.animal import Animal
 from game.game_manager import GameManager
-from utils.range import Range
+from game.rules import FIGHT, RUN, find_animal, resolve_hunt
+from utils.pacing import pause
 from utils.utils import Utils
 
 
@@ -16,8 +15,7 @@ def start_hunt(game_manager):
     - The player's choice to initiate a hunt.
     - The random appearance of an animal based on the time of day.
     - The player's decision to either fight the animal or run away.
-    - The resolution of the chosen action, including calculating success rates,
-      applying damage, awarding meat and experience points, and passing time.
+    - The display of the outcome, which is resolved by `game.rules.resolve_hunt`.
 
     :param game_manager: The main game manager object that holds the game state.
     :type game_manager: GameManager
@@ -50,7 +48,7 @@ def start_hunt(game_manager):
             return
 
         Utils.clear_terminal()
-        animal = Animal.get_random(game_manager.get_day_period())
+        animal = find_animal(game_manager)
 
         game_manager.print_game_status()
         game_manager.print_player_status()
@@ -69,111 +67,47 @@ def start_hunt(game_manager):
         Utils.draw_bar(30, "-", corners="*")
         print()
 
-        action = Utils.get_input_int(1, 2, "Enter your choice: ")
+        action = FIGHT if Utils.get_input_int(1, 2, "Enter your choice: ") == 1 else RUN
 
-        if action == 1:
+        if action == FIGHT:
             print(f"You are fighting the {animal.name}...")
-            sleep(2)
-            print()
-
-            success_rate = game_manager.player.hunt_success_rate.subtract(animal.hunt_success_rate_tax).get_random()
-            print(f"The Success probability is {Utils.format_float(success_rate * 100, 0)}%")
-            sleep(2)
-            print()
-
-            prob = Range(0, 1.0).get_random()
-
-            if prob <= success_rate:
-                print("You killed the animal!")
-                sleep(2)
-                print()
-
-                meat_drop = animal.meat_drop.get_random(as_int=True)
-                game_manager.player.meat_amount += meat_drop
-
-                print(f"You got: {meat_drop} meat!")
-                sleep(2)
-                print()
-
-                exp_amount = Range(0.008, 0.012).get_random()
-                game_manager.player.lvl_up_hunt(exp_amount)
-
-                print(f"EXP gain: {Utils.format_float(exp_amount, 3)}")
-                sleep(2)
-                print()
-
-                print(game_manager.pass_time(Range(2, 2.7).get_random()))
-            else:
-                print("You lost!")
-                sleep(2)
-                print()
-
-                damage = animal.damage.get_random()
-                game_manager.player.take_damage(damage)
-
-                print(f"HP lost: {Utils.format_float(damage)} HP")
-                sleep(2)
-                print()
-
-                exp_amount = Range(0.002, 0.005).get_random()
-                game_manager.player.lvl_up_hunt(exp_amount)
-
-                print(f"EXP gain: {Utils.format_float(exp_amount, 3)}")
-                sleep(2)
-                print()
-
-                print(game_manager.pass_time(Range(2, 2.7).get_random()))
         else:
             print(f"You are running from the {animal.name}...")
-            sleep(2)
-            print()
-
-            success_rate = game_manager.player.run_success_rate.subtract(animal.run_success_rate_tax).get_random()
-            print(f"The Success probability is {Utils.format_float(success_rate * 100, 0)}%")
-            sleep(2)
-            print()
-
-            prob = Range(0, 1.0).get_random()
-
-            if prob <= success_rate:
-                print("You escaped successfully !")
-                sleep(2)
-                print()
-
-                exp_amount = Range(0.008, 0.012).get_random()
-                game_manager.player.lvl_up_run(exp_amount)
-
-                print(f"EXP gain: {Utils.format_float(exp_amount, 3)}")
-                sleep(2)
-                print()
-
-                print(game_manager.pass_time(Range(1.5, 2.0).get_random()))
-            else:
-                print("You couldn't escape!")
-                sleep(2)
-                print()
+        pause(2)
+        print()
 
-                damage = animal.damage.get_random() * 0.5
-                game_manager.player.take_damage(damage)
+        result = resolve_hunt(game_manager, animal, action)
 
-                print(f"HP lost: {Utils.format_float(damage)} HP")
-                sleep(2)
-                print()
+        print(f"The Success probability is {Utils.format_float(result.success_rate * 100, 0)}%")
+        pause(2)
+        print()
 
-                exp_amount = Range(0.002, 0.005).get_random()
-                game_manager.player.lvl_up_run(exp_amount)
+        if action == FIGHT:
+            print("You killed the animal!" if result.success else "You lost!")
+        else:
+            print("You escaped successfully !" if result.success else "You couldn't escape!")
+        pause(2)
+        print()
 
-                print(f"EXP gain: {Utils.format_float(exp_amount, 3)}")
-                sleep(2)
-                print()
+        if action == FIGHT and result.success:
+            print(f"You got: {result.meat_drop} meat!")
+            pause(2)
+            print()
+        if not result.success:
+            print(f"HP lost: {Utils.format_float(result.damage)} HP")
+            pause(2)
+            print()
 
-                print(game_manager.pass_time(Range(2, 2.7).get_random()))
+        print(f"EXP gain: {Utils.format_float(result.exp_amount, 3)}")
+        pause(2)
+        print()
 
+        print(result.time_report)
         print()
         input("Press [ENTER] to continue...")
     except (ValueError, TypeError, AttributeError) as e:
         print(f"Error during hunt action: {str(e)}")
-        sleep(2)
+        pause(2)
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
-        sleep(2)
\ No newline at end of file
+        pause(2)
\ No newline at end of file
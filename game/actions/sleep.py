@@ -1,9 +1,9 @@
 # This file contains the logic for the sleep action in the game.
-from time import sleep
 
 from ascii_art.general_ascii import GeneralAscii
 from game.game_manager import GameManager
-from utils.range import Range
+from game.rules import MAX_SLEEP_HOURS, is_too_hungry_to_sleep, resolve_sleep
+from utils.pacing import pause
 from utils.utils import Utils
 
 
@@ -16,8 +16,7 @@ def start_sleep(game_manager):
     - The player's choice to sleep.
     - Input for the duration of sleep.
     - Checking if the player is too hungry to sleep.
-    - Calculating the amount of health and energy restored.
-    - Updating the player's stats and advancing game time accordingly.
+    - The display of the outcome, which is resolved by `game.rules.resolve_sleep`.
 
     :param game_manager: The main game manager object that holds the game state.
     :type game_manager: GameManager
@@ -50,40 +49,35 @@ def start_sleep(game_manager):
         if choice == 2:
             return
 
-        hours = Utils.get_input_int(1, 48, "How many hours do you want to sleep: ")
+        hours = Utils.get_input_int(1, MAX_SLEEP_HOURS, "How many hours do you want to sleep: ")
 
-        estimated_hunger_loss = hours * 0.55
-        min_hunger_threshold = game_manager.player.max_hunger * 0.1
-
-        if game_manager.player.hunger - estimated_hunger_loss < min_hunger_threshold:
+        if is_too_hungry_to_sleep(game_manager, hours):
             print("You are too hungry to sleep now! Eat first.")
-            sleep(2)
+            pause(2)
             return
 
         print("You are sleeping...")
-        sleep(2)
+        pause(2)
         print()
 
+        result = resolve_sleep(game_manager, hours)
+
         print("You have woken up!")
-        sleep(2)
+        pause(2)
         print()
 
-        heal_amount = hours * Range(0.45, 0.65).get_random()
-
         print(f"energy gain: {hours}")
-        print(f"HP gain: {Utils.format_float(heal_amount)}")
-        sleep(2)
+        print(f"HP gain: {Utils.format_float(result.heal_amount)}")
+        pause(2)
         print()
 
-        game_manager.player.sleep(hours)
-        game_manager.player.heal(heal_amount)
-        print(game_manager.pass_time(hours, tax_energy=False))
+        print(result.time_report)
         print()
 
         input("Press [ENTER] to continue...")
     except (ValueError, TypeError, AttributeError) as e:
         print(f"Error during sleep action: {str(e)}")
-        sleep(2)
+        pause(2)
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
-        sleep(2)
\ No newline at end of file
+        pause(2)
\ No newline at end of file
@@ -0,0 +1,197 @@
+# This file implements the autosave of the game, backed by a write-ahead journal.
+# After every completed action, the fields of the game state that changed are
+# appended to a per-player journal file. The journal is periodically compacted into
+# a snapshot file, which is written to a temporary file and moved into place with
+# `os.replace`, so a crash never leaves a half-written autosave behind. Recovering an
+# autosave loads the snapshot and replays the journal on top of it. Like the save
+# records, the files of a player are named after the SHA-1 digest of the player name
+# and spread over shard directories, so names differing only in case never share
+# an autosave on case-insensitive filesystems.
+
+import hashlib
+import json
+import os
+
+from game.data.files import write_atomic
+from game.data.state_delta import diff_states, flatten_state, unflatten_state
+from game.game_manager import GameManager
+
+BASE_DIR = os.path.dirname(__file__)
+AUTOSAVE_DIR = os.path.join(BASE_DIR, "autosave")
+
+COMPACT_EVERY = 20
+
+
+def _get_paths(player_name):
+    """
+    Returns the snapshot and journal file paths of a player.
+
+    Both files are named after the SHA-1 digest of the player name, inside the
+    shard directory named after its first two hex digits.
+
+    :param player_name: The name of the player.
+    :type player_name: str
+    :return: A tuple (snapshot path, journal path).
+    :rtype: tuple
+    """
+    digest = hashlib.sha1(player_name.encode("utf-8")).hexdigest()
+    directory = os.path.join(AUTOSAVE_DIR, digest[:2])
+    return (os.path.join(directory, f"{digest}.snapshot.json"),
+            os.path.join(directory, f"{digest}.journal"))
+
+
+class ActionJournal:
+    """
+    Records the autosave of one player's game as a snapshot plus a journal of deltas.
+
+    Each call to `record` appends one line holding the fields that changed since the
+    previous call, so persisting a turn costs a small append instead of a full
+    rewrite. Every `compact_every` records, the current state is written as the new
+    snapshot and the journal is emptied. Deltas hold absolute field values, so
+    replaying a journal entry that is already part of the snapshot is harmless.
+    """
+    def __init__(self, player_name, compact_every=COMPACT_EVERY):
+        """
+        Initializes a new ActionJournal instance.
+
+        :param player_name: The name of the player whose game is journaled.
+        :type player_name: str
+        :param compact_every: The number of journal entries after which the journal
+            is compacted into a snapshot.
+        :type compact_every: int
+        """
+        if not isinstance(player_name, str) or not player_name.strip():
+            raise ValueError("player_name must be a non-empty string")
+        if not isinstance(compact_every, int) or compact_every <= 0:
+            raise ValueError("compact_every must be a positive integer")
+
+        self.player_name = player_name
+        self.compact_every = compact_every
+        self.snapshot_path, self.journal_path = _get_paths(player_name)
+        self._state = None
+        self._entries = 0
+
+    def record(self, game_manager):
+        """
+        Persists the state of the game after a completed action.
+
+        The first record of a session writes a fresh snapshot, replacing any older
+        autosave of the player. Later records append the changed fields to the journal.
+
+        :param game_manager: The game manager holding the current game state.
+        :type game_manager: GameManager
+        :raises TypeError: If game_manager is not an instance of GameManager.
+        :raises IOError: For I/O errors during writing.
+        """
+        if not isinstance(game_manager, GameManager):
+            raise TypeError("game_manager must be an instance of GameManager")
+
+        state = flatten_state(game_manager.to_dict())
+        if self._state is None:
+            self._compact(state)
+            return
+
+        delta = diff_states(self._state, state)
+        if not delta:
+            return
+
+        try:
+            with open(self.journal_path, "a") as f:
+                f.write(json.dumps(delta, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except IOError as e:
+            raise IOError(f"Error writing autosave journal: {str(e)}")
+
+        self._state = state
+        self._entries += 1
+        if self._entries >= self.compact_every:
+            self._compact(state)
+
+    def _compact(self, state):
+        """
+        Writes the given state as the new snapshot and empties the journal.
+
+        :param state: The flattened game state.
+        :type state: dict
+        :raises IOError: For I/O errors during writing.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+            write_atomic(self.snapshot_path, json.dumps(unflatten_state(state), separators=(",", ":")))
+            open(self.journal_path, "w").close()
+        except IOError as e:
+            raise IOError(f"Error writing autosave snapshot: {str(e)}")
+
+        self._state = state
+        self._entries = 0
+
+    def clear(self):
+        """
+        Deletes the autosave of the player.
+
+        The next call to `record` starts a new snapshot.
+        """
+        clear_autosave(self.player_name)
+        self._state = None
+        self._entries = 0
+
+
+def has_autosave(player_name):
+    """
+    Checks if an autosave exists for a specific player.
+
+    :param player_name: The name of the player to check for.
+    :type player_name: str
+    :return: True if an autosave exists for the player, False otherwise.
+    :rtype: bool
+    """
+    if not isinstance(player_name, str) or not player_name.strip():
+        raise ValueError("player_name must be a non-empty string")
+    return os.path.exists(_get_paths(player_name)[0])
+
+
+def recover_autosave(player_name):
+    """
+    Restores the autosaved game of a player.
+
+    Loads the snapshot and replays the journal entries in order. A torn last line,
+    left by a crash in the middle of an append, is ignored.
+
+    :param player_name: The name of the player whose game should be recovered.
+    :type player_name: str
+    :return: A GameManager instance populated with the autosaved state.
+    :rtype: GameManager
+    :raises ValueError: If no autosave is found or the autosave is corrupted.
+    """
+    if not has_autosave(player_name):
+        raise ValueError(f"No autosave found for '{player_name}'")
+
+    snapshot_path, journal_path = _get_paths(player_name)
+    try:
+        with open(snapshot_path, "r") as f:
+            state = flatten_state(json.load(f))
+
+        if os.path.exists(journal_path):
+            with open(journal_path, "r") as f:
+                for line in f:
+                    try:
+                        state.update(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+
+        return GameManager.from_dict(unflatten_state(state))
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Corrupted autosave for '{player_name}': {str(e)}")
+
+
+def clear_autosave(player_name):
+    """
+    Deletes the autosave of a player, if any.
+
+    :param player_name: The name of the player whose autosave should be deleted.
+    :type player_name: str
+    """
+    for path in _get_paths(player_name):
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,187 @@
+# This file implements saving games on a background thread, so the game loop never
+# waits for the disk. The game state is captured on the calling thread, then encoded
+# and written by a worker thread. Pending saves are coalesced per player: if several
+# saves of the same player are queued before the worker gets to them, only the
+# latest one is written. Pending saves are flushed when the interpreter exits.
+
+import atexit
+import threading
+import time
+
+from game.data.save import save_snapshot
+from game.game_manager import GameManager
+
+
+class SaveResult:
+    """
+    Reports the outcome of a background save.
+    """
+    def __init__(self, player_name, data, error=None):
+        """
+        Initializes a new SaveResult instance.
+
+        :param player_name: The name of the saved player.
+        :type player_name: str
+        :param data: The serialized game state that was saved.
+        :type data: dict
+        :param error: The exception raised by the save, or None if it succeeded.
+        :type error: Exception
+        """
+        self.player_name = player_name
+        self.data = data
+        self.error = error
+
+
+def _save_verified_snapshot(data, revision):
+    """
+    Writes a game state captured by `BackgroundSaver.submit` from a GameManager,
+    which makes it a verified state.
+
+    :param data: The serialized game state.
+    :type data: dict
+    :param revision: The revision captured at submit time.
+    :type revision: int
+    """
+    save_snapshot(data, revision, verified=True)
+
+
+class BackgroundSaver:
+    """
+    Writes game saves on a worker thread.
+
+    Call `submit` to queue a save, and `poll` from the game loop to collect the
+    results of finished saves.
+    """
+    def __init__(self, save_function=_save_verified_snapshot):
+        """
+        Initializes a new BackgroundSaver instance and starts its worker thread.
+
+        :param save_function: The function writing a serialized game state; it is
+            called with the state and the revision captured at submit time.
+        :type save_function: callable
+        """
+        self._save_function = save_function
+        self._condition = threading.Condition()
+        self._pending = {}
+        self._results = []
+        self._busy = False
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="background-saver", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, game_manager):
+        """
+        Captures the game state and queues it to be saved.
+
+        Replaces any save of the same player that has not been written yet.
+
+        :param game_manager: The game manager holding the state to save.
+        :type game_manager: GameManager
+        :raises TypeError: If game_manager is not an instance of GameManager.
+        :raises RuntimeError: If the saver is closed.
+        """
+        if not isinstance(game_manager, GameManager):
+            raise TypeError("game_manager must be an instance of GameManager")
+
+        data = game_manager.to_dict()
+        revision = time.time_ns()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BackgroundSaver is closed")
+            self._pending[game_manager.player.name] = (data, revision)
+            self._condition.notify_all()
+
+    def poll(self):
+        """
+        Returns the results of the saves finished since the previous call.
+
+        :return: A list of SaveResult objects, in completion order.
+        :rtype: list
+        """
+        with self._condition:
+            results, self._results = self._results, []
+        return results
+
+    def flush(self, timeout=None):
+        """
+        Waits until every queued save has been written.
+
+        :param timeout: The maximum time to wait, in seconds, or None to wait forever.
+        :type timeout: float
+        :return: True if every save was written, False if the timeout expired.
+        :rtype: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self):
+        """
+        Writes the queued saves and stops the worker thread.
+
+        Called automatically when the interpreter exits.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        """
+        The loop of the worker thread.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                self._busy = True
+
+            results = []
+            for player_name, (data, revision) in batch.items():
+                try:
+                    self._save_function(data, revision)
+                    results.append(SaveResult(player_name, data))
+                except Exception as e:
+                    results.append(SaveResult(player_name, data, e))
+
+            with self._condition:
+                self._results.extend(results)
+                self._busy = False
+                self._condition.notify_all()
+
+
+_saver = None
+
+
+def get_background_saver():
+    """
+    Returns the process-wide BackgroundSaver, starting it on first use.
+
+    :return: The shared background saver.
+    :rtype: BackgroundSaver
+    """
+    global _saver
+    if _saver is None:
+        _saver = BackgroundSaver()
+    return _saver
+
+
+def flush_background_saves(timeout=None):
+    """
+    Waits until the saves queued on the process-wide BackgroundSaver are written.
+
+    Does nothing if no background save was ever submitted.
+
+    :param timeout: The maximum time to wait, in seconds, or None to wait forever.
+    :type timeout: float
+    :return: True if every save was written, False if the timeout expired.
+    :rtype: bool
+    """
+    if _saver is None:
+        return True
+    return _saver.flush(timeout)
@@ -0,0 +1,130 @@
+# This file defines the encodings used to store a saved game record.
+# Two formats are supported: compact JSON text, and a binary format that packs the
+# fixed player schema with `struct` behind a magic number and a schema version.
+# Decoding detects the format of a record, so both can coexist in the same store.
+
+import json
+import struct
+
+FORMAT_JSON = "json"
+FORMAT_BINARY = "binary"
+SAVE_FORMATS = (FORMAT_JSON, FORMAT_BINARY)
+
+MAGIC = b"AMZ"
+BINARY_VERSION = 1
+
+_HEADER = struct.Struct("<3sBB")
+_BODY_V1 = struct.Struct("<B12dIIdI")
+
+_CLASS_IDS = {"Fisher": 1, "Hunter": 2}
+_CLASS_NAMES = {class_id: class_name for class_name, class_id in _CLASS_IDS.items()}
+
+_RANGE_KEYS = ("fish_pull_delay", "hunt_success_rate", "run_success_rate")
+_STAT_KEYS = ("hp", "max_hp", "hunger", "max_hunger", "energy", "max_energy")
+
+
+def encode(data, save_format=FORMAT_JSON):
+    """
+    Encodes a saved game dictionary, as produced by `GameManager.to_dict`.
+
+    :param data: The saved game dictionary.
+    :type data: dict
+    :param save_format: The format to encode to, one of SAVE_FORMATS.
+    :type save_format: str
+    :return: The encoded record: a string for JSON, bytes for binary.
+    :rtype: str or bytes
+    :raises ValueError: If the format is unknown or the data does not fit the binary schema.
+    """
+    if save_format == FORMAT_JSON:
+        return json.dumps(data, separators=(",", ":"))
+    if save_format == FORMAT_BINARY:
+        return _encode_binary(data)
+    raise ValueError(f"Unknown save format: {save_format}")
+
+
+def decode(record):
+    """
+    Decodes a saved game record in any supported format.
+
+    :param record: The encoded record.
+    :type record: str or bytes
+    :return: The saved game dictionary.
+    :rtype: dict
+    :raises ValueError: If the record is corrupted or has an unsupported version.
+    """
+    if detect_format(record) == FORMAT_BINARY:
+        return _decode_binary(record)
+
+    try:
+        return json.loads(record)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid JSON record: {str(e)}")
+
+
+def detect_format(record):
+    """
+    Returns the format of an encoded record.
+
+    :param record: The encoded record.
+    :type record: str or bytes
+    :return: FORMAT_BINARY if the record starts with the binary magic number,
+        FORMAT_JSON otherwise.
+    :rtype: str
+    """
+    if isinstance(record, (bytes, bytearray, memoryview)) and bytes(record[:len(MAGIC)]) == MAGIC:
+        return FORMAT_BINARY
+    return FORMAT_JSON
+
+
+def _encode_binary(data):
+    """
+    Packs a saved game dictionary into the binary format.
+
+    Layout (little endian): magic, schema version, name length, UTF-8 name, class id,
+    the six stats, the min and max of the three skill ranges, fish amount, meat
+    amount, time and days survived.
+    """
+    try:
+        player = data["player"]
+        name = player["name"].encode("utf-8")
+        class_name = player["player_class"]["class_name"]
+        if class_name not in _CLASS_IDS:
+            raise ValueError(f"Unknown class: {class_name}")
+        if len(name) > 255:
+            raise ValueError("name is too long for the binary format")
+
+        values = [_CLASS_IDS[class_name]]
+        values.extend(player[key] for key in _STAT_KEYS)
+        for key in _RANGE_KEYS:
+            values.extend((player[key]["min"], player[key]["max"]))
+        values.extend((player["fish_amount"], player["meat_amount"], data["time"], data["days_survived"]))
+
+        return _HEADER.pack(MAGIC, BINARY_VERSION, len(name)) + name + _BODY_V1.pack(*values)
+    except (KeyError, TypeError, struct.error) as e:
+        raise ValueError(f"Save data does not fit the binary format: {str(e)}")
+
+
+def _decode_binary(record):
+    """
+    Unpacks a record in the binary format into a saved game dictionary.
+    """
+    try:
+        magic, version, name_length = _HEADER.unpack_from(record)
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported binary save version: {version}")
+
+        name = bytes(record[_HEADER.size:_HEADER.size + name_length]).decode("utf-8")
+        values = _BODY_V1.unpack_from(record, _HEADER.size + name_length)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid binary record: {str(e)}")
+
+    if values[0] not in _CLASS_NAMES:
+        raise ValueError(f"Unknown class id: {values[0]}")
+
+    player = {"name": name, "player_class": {"class_name": _CLASS_NAMES[values[0]]}}
+    player.update(zip(_STAT_KEYS, values[1:7]))
+    for i, key in enumerate(_RANGE_KEYS):
+        player[key] = {"min": values[7 + 2 * i], "max": values[8 + 2 * i]}
+    player["fish_amount"], player["meat_amount"] = values[13], values[14]
+
+    return {"player": player, "time": values[15], "days_survived": values[16]}
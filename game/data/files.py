@@ -0,0 +1,30 @@
+# This file provides file helpers shared by the save modules.
+
+import os
+import tempfile
+
+
+def write_atomic(path, content):
+    """
+    Writes a file atomically.
+
+    The content is written and synced to a temporary file in the same directory,
+    which then replaces the target with `os.replace`. Readers see either the old or
+    the new file, never a truncated one.
+
+    :param path: The path of the file to write.
+    :type path: str
+    :param content: The content to write.
+    :type content: str or bytes
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(content, bytes) else "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
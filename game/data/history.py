@@ -0,0 +1,189 @@
+# This file implements the save history of a player.
+# Every save appends a checkpoint to a per-player history file, one JSON entry per
+# line. Most checkpoints only store the fields that changed since the previous
+# one; every KEYFRAME_EVERY checkpoints, a keyframe stores the full state. Keeping
+# hundreds of checkpoints therefore stays small, and restoring any checkpoint only
+# replays the deltas since the keyframe before it.
+
+import json
+import os
+
+from game.data.files import write_atomic
+from game.data.state_delta import diff_states, flatten_state, unflatten_state
+
+KEYFRAME_EVERY = 16
+HISTORY_LIMIT = 500
+
+_KEYFRAME_PREFIX = '{"type":"keyframe"'
+
+
+def _read_history(path):
+    """
+    Reads the entries of a history file without decoding them.
+
+    A torn last line, left by a crash in the middle of an append, is dropped.
+
+    :param path: The path of the history file.
+    :type path: str
+    :return: The entry lines without line endings, and whether a torn line was dropped.
+    :rtype: tuple
+    """
+    try:
+        with open(path, "r") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return [], False
+
+    lines = content.split("\n")
+    # The last element is empty when the file ends with a newline, or a torn entry otherwise.
+    return lines[:-1], lines[-1] != ""
+
+
+def _read_lines(path):
+    """
+    Reads the complete entries of a history file without decoding them.
+    """
+    return _read_history(path)[0]
+
+
+def _is_keyframe(line):
+    """
+    Returns True if an entry line is a keyframe.
+    """
+    return line.startswith(_KEYFRAME_PREFIX)
+
+
+def _replay(lines, index):
+    """
+    Rebuilds the flattened state of the checkpoint at an index.
+
+    Only the entries from the keyframe at or before the index are decoded, so the
+    cost is bounded by KEYFRAME_EVERY.
+
+    :param lines: The entry lines of the history.
+    :type lines: list
+    :param index: The index of the checkpoint.
+    :type index: int
+    :return: The revision and flattened state of the checkpoint.
+    :rtype: tuple
+    :raises ValueError: If the history is corrupted.
+    """
+    start = index
+    while start >= 0 and not _is_keyframe(lines[start]):
+        start -= 1
+    if start < 0:
+        raise ValueError("Save history is corrupted: no keyframe before checkpoint")
+
+    try:
+        state = {}
+        revision = None
+        for line in lines[start:index + 1]:
+            entry = json.loads(line)
+            state.update(entry["fields"])
+            revision = entry["revision"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"Save history is corrupted: {str(e)}")
+    return revision, state
+
+
+def append_checkpoint(path, data, revision):
+    """
+    Appends a checkpoint to a history file.
+
+    The caller must hold the player's lock. When the history grows past
+    HISTORY_LIMIT checkpoints, the oldest ones are dropped, up to a keyframe.
+
+    :param path: The path of the history file.
+    :type path: str
+    :param data: The serialized game state, as produced by `GameManager.to_dict`.
+    :type data: dict
+    :param revision: The revision of the save.
+    :type revision: int
+    """
+    lines, torn = _read_history(path)
+    state = flatten_state(data)
+
+    last_keyframe = next((i for i in range(len(lines) - 1, -1, -1) if _is_keyframe(lines[i])), None)
+    if last_keyframe is None or len(lines) - last_keyframe >= KEYFRAME_EVERY:
+        entry = {"type": "keyframe", "revision": revision, "fields": state}
+    else:
+        try:
+            previous = _replay(lines, len(lines) - 1)[1]
+        except ValueError:
+            previous = None
+        if previous is None:
+            entry = {"type": "keyframe", "revision": revision, "fields": state}
+        else:
+            entry = {"type": "delta", "revision": revision, "fields": diff_states(previous, state)}
+
+    line = json.dumps(entry, separators=(",", ":"))
+    if len(lines) < HISTORY_LIMIT and not torn:
+        with open(path, "a") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return
+
+    lines.append(line)
+    start = 0
+    if len(lines) > HISTORY_LIMIT:
+        start = next((i for i in range(len(lines) - HISTORY_LIMIT, len(lines)) if _is_keyframe(lines[i])), 0)
+    write_atomic(path, "\n".join(lines[start:]) + "\n")
+
+
+def count_checkpoints(path):
+    """
+    Returns the number of checkpoints of a history file.
+
+    :param path: The path of the history file.
+    :type path: str
+    :return: The number of checkpoints.
+    :rtype: int
+    """
+    return len(_read_lines(path))
+
+
+def list_checkpoints(path):
+    """
+    Returns a summary of every checkpoint of a history file, oldest first.
+
+    :param path: The path of the history file.
+    :type path: str
+    :return: A list of dictionaries with the 'revision', 'time' and
+        'days_survived' of each checkpoint.
+    :rtype: list
+    :raises ValueError: If the history is corrupted.
+    """
+    checkpoints = []
+    state = {}
+    try:
+        for line in _read_lines(path):
+            entry = json.loads(line)
+            state.update(entry["fields"])
+            checkpoints.append({"revision": entry["revision"], "time": state.get("time"),
+                                "days_survived": state.get("days_survived")})
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"Save history is corrupted: {str(e)}")
+    return checkpoints
+
+
+def read_checkpoint(path, index):
+    """
+    Returns the serialized game state of a checkpoint.
+
+    :param path: The path of the history file.
+    :type path: str
+    :param index: The index of the checkpoint, 0 being the oldest; negative
+        indexes count from the most recent.
+    :type index: int
+    :return: The revision and serialized game state of the checkpoint.
+    :rtype: tuple
+    :raises IndexError: If there is no checkpoint at that index.
+    :raises ValueError: If the history is corrupted.
+    """
+    lines = _read_lines(path)
+    if not -len(lines) <= index < len(lines):
+        raise IndexError(f"No checkpoint at index {index}")
+
+    revision, state = _replay(lines, index % len(lines))
+    return revision, unflatten_state(state)
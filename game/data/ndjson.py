@@ -0,0 +1,232 @@
+# This file implements the bulk import, export and validation of saves as
+# newline-delimited JSON (NDJSON), one serialized game state per line. Records are
+# processed in chunks by a pool of worker processes, which decode and validate
+# them through `GameManager.from_dict`, so throughput scales with the number of
+# cores. Corrupted records are reported instead of aborting the whole run.
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from game.data.save import get_save_data, import_saves, iter_player_names
+from game.game_manager import GameManager
+
+CHUNK_SIZE = 1000
+
+
+class BulkReport:
+    """
+    Summarizes a bulk operation on saves.
+    """
+    def __init__(self):
+        """
+        Initializes an empty BulkReport instance.
+        """
+        self.processed = 0
+        self.valid = 0
+        self.errors = []
+
+    def add_error(self, location, message):
+        """
+        Records a corrupted entry.
+
+        :param location: Where the entry was found, e.g. "line 12" or a player name.
+        :type location: str
+        :param message: The description of the problem.
+        :type message: str
+        """
+        self.errors.append((location, message))
+
+
+def validate_record(data):
+    """
+    Checks that a serialized game state can be loaded.
+
+    :param data: The serialized game state.
+    :return: None if the record is valid, otherwise the error message.
+    :rtype: str or None
+    """
+    if not isinstance(data, dict):
+        return "record must be a JSON object"
+    try:
+        GameManager.from_dict(data)
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        return f"{type(e).__name__}: {str(e)}"
+    return None
+
+
+def _validate_lines(chunk):
+    """
+    Parses and validates a chunk of NDJSON lines; runs in a worker process.
+
+    :param chunk: A list of (line number, line) pairs.
+    :type chunk: list
+    :return: A list of (line number, record or None, error or None) triples.
+    :rtype: list
+    """
+    results = []
+    for line_number, line in chunk:
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            results.append((line_number, None, f"invalid JSON: {str(e)}"))
+            continue
+        error = validate_record(data)
+        results.append((line_number, data if error is None else None, error))
+    return results
+
+
+def _read_saves(chunk):
+    """
+    Reads and validates the saves of a chunk of players; runs in a worker process.
+
+    Saves are read around the process-wide cache, so a worker only holds the saves
+    of its current chunk.
+
+    :param chunk: A list of player names.
+    :type chunk: list
+    :return: A list of (player name, NDJSON line or None, error or None) triples.
+    :rtype: list
+    """
+    results = []
+    for player_name in chunk:
+        try:
+            data = get_save_data(player_name, cached=False)
+        except (ValueError, IOError) as e:
+            results.append((player_name, None, str(e)))
+            continue
+        if data is None:
+            results.append((player_name, None, "indexed but no save file found"))
+            continue
+        error = validate_record(data)
+        line = json.dumps(data, separators=(",", ":")) if error is None else None
+        results.append((player_name, line, error))
+    return results
+
+
+def _chunked(iterable, size):
+    """
+    Splits an iterable into lists of at most `size` items.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_ordered(function, chunks, workers):
+    """
+    Applies a function to chunks in a process pool, yielding results in order.
+
+    At most two chunks per worker are in flight, so arbitrarily large inputs are
+    streamed without being held in memory.
+
+    :param function: The function applied to each chunk; must be picklable.
+    :param chunks: An iterable of chunks.
+    :param workers: The number of worker processes, or None for one per core.
+    :return: An iterator over the results of each chunk.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = iter(chunks)
+        in_flight = [executor.submit(function, chunk) for chunk in islice(chunks, 2 * workers)]
+        while in_flight:
+            yield in_flight.pop(0).result()
+            for chunk in islice(chunks, 1):
+                in_flight.append(executor.submit(function, chunk))
+
+
+def _iter_lines(stream):
+    """
+    Yields (line number, line) pairs for the non-blank lines of a stream.
+    """
+    for line_number, line in enumerate(stream, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def import_ndjson(stream, workers=None, chunk_size=CHUNK_SIZE, dry_run=False):
+    """
+    Imports the saves of an NDJSON stream into the save directory.
+
+    Every record is validated before being written; corrupted records are skipped
+    and reported. Existing saves for the same players are overwritten.
+
+    :param stream: A text stream with one serialized game state per line.
+    :param workers: The number of worker processes, or None for one per core.
+    :type workers: int
+    :param chunk_size: The number of lines validated per task.
+    :type chunk_size: int
+    :param dry_run: If True, only validates the records without writing them.
+    :type dry_run: bool
+    :return: The report of the import.
+    :rtype: BulkReport
+    """
+    report = BulkReport()
+    for results in _map_ordered(_validate_lines, _chunked(_iter_lines(stream), chunk_size), workers):
+        valid = []
+        for line_number, data, error in results:
+            report.processed += 1
+            if error is None:
+                valid.append(data)
+            else:
+                report.add_error(f"line {line_number}", error)
+        if valid and not dry_run:
+            import_saves(valid, validated=True)
+        report.valid += len(valid)
+    return report
+
+
+def export_ndjson(stream, prefix="", workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Writes every save of the save directory to an NDJSON stream, in name order.
+
+    Saves that cannot be decoded or do not validate are reported and left out.
+
+    :param stream: The text stream to write to.
+    :param prefix: Only exports players whose name starts with this prefix.
+    :type prefix: str
+    :param workers: The number of worker processes, or None for one per core.
+    :type workers: int
+    :param chunk_size: The number of saves read per task.
+    :type chunk_size: int
+    :return: The report of the export.
+    :rtype: BulkReport
+    """
+    report = BulkReport()
+    for results in _map_ordered(_read_saves, _chunked(iter_player_names(prefix), chunk_size), workers):
+        for player_name, line, error in results:
+            report.processed += 1
+            if error is None:
+                stream.write(line + "\n")
+                report.valid += 1
+            else:
+                report.add_error(player_name, error)
+    return report
+
+
+def validate_store(prefix="", workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Validates every save of the save directory.
+
+    :param prefix: Only validates players whose name starts with this prefix.
+    :type prefix: str
+    :param workers: The number of worker processes, or None for one per core.
+    :type workers: int
+    :param chunk_size: The number of saves read per task.
+    :type chunk_size: int
+    :return: The report of the validation.
+    :rtype: BulkReport
+    """
+    report = BulkReport()
+    for results in _map_ordered(_read_saves, _chunked(iter_player_names(prefix), chunk_size), workers):
+        for player_name, line, error in results:
+            report.processed += 1
+            if error is None:
+                report.valid += 1
+            else:
+                report.add_error(player_name, error)
+    return report
@@ -1,105 +1,690 @@
 # This file handles all operations related to saving and loading game data.
-# It manages a JSON file (`save_data.json`) that stores the state of one or more games.
-# Functions are provided to load, save, check for, and list saved games.
-
+# Each player's save is stored in its own record file inside a sharded directory
+# (`saves/<shard>/<digest>.sav`), named after the SHA-1 digest of the player name so
+# names differing only in case never share a file on case-insensitive filesystems;
+# the name itself is kept in the index and in the record. Writes take an advisory
+# `fcntl` lock on the player's lock file and replace the record atomically, so game
+# processes saving different players never contend, and each record carries a
+# revision so a race on the same player always keeps the newest save. An SQLite
+# database (`save_data.db`) indexes the player names for listing. Saves from the
+# legacy JSON file (`save_data.json`) are imported when the index is first created.
+# Decoded saves are kept in a process-wide cache so repeated lookups of the same
+# player do not re-read nor re-decode the record.
+# Every save also appends a checkpoint to the player's save history (`history`), so
+# overwriting a save never loses the previous states.
+# Records are encoded with `codec`, either as JSON or in the compact binary format.
+# Records written from a validated game state carry a CRC32 checksum; when it
+# matches on load, the game is rebuilt through the trusted fast path that skips the
+# per-field validation. Unverified and legacy records are fully validated.
+
+import hashlib
 import json
 import os
-
+import sqlite3
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Advisory locks are not available on Windows; saves still replace atomically.
+    fcntl = None
+
+from game.data import codec, history
+from game.data.files import write_atomic
 from game.game_manager import GameManager
 
 BASE_DIR = os.path.dirname(__file__)
-SAVE_FILE = os.path.join(BASE_DIR, "save_data.json")
+SAVE_DIR = os.path.join(BASE_DIR, "saves")
+INDEX_FILE = os.path.join(BASE_DIR, "save_data.db")
+LEGACY_SAVE_FILE = os.path.join(BASE_DIR, "save_data.json")
+
+SCHEMA_VERSION = 1
+PAGE_SIZE = 10
+
+_REVISION = struct.Struct(">Q")
+_ENVELOPE = struct.Struct(">3sBQI")
+_ENVELOPE_MAGIC = b"AMS"
+_FLAG_CHECKSUM = 1
+
+_connection = None
+_save_format = codec.FORMAT_JSON
+
+_cache = {}
+_generation = 0
+
+
+def _get_connection():
+    """
+    Returns the shared connection to the player index, opening it if needed.
+
+    On first use, the schema is created and the saves of the legacy JSON file are
+    imported. The schema version is tracked with SQLite's `user_version` pragma and
+    upgraded inside an immediate transaction, so only one process ever runs the
+    import.
+
+    :return: An open connection to the player index, in autocommit mode.
+    :rtype: sqlite3.Connection
+    :raises IOError: If the index cannot be opened or initialized.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
+
+    try:
+        connection = sqlite3.connect(INDEX_FILE, timeout=5.0, isolation_level=None, check_same_thread=False)
+        if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                _upgrade_schema(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+    except sqlite3.Error as e:
+        raise IOError(f"Error opening save index: {str(e)}")
+
+    _connection = connection
+    return _connection
+
+
+def _upgrade_schema(connection):
+    """
+    Upgrades the player index to the current schema version.
+
+    Must be called inside a transaction holding the database write lock.
+
+    :param connection: The connection to the player index.
+    :type connection: sqlite3.Connection
+    """
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+
+    connection.execute("CREATE TABLE IF NOT EXISTS players (name TEXT PRIMARY KEY)")
+
+    if version == 0 and os.path.exists(LEGACY_SAVE_FILE):
+        _import_records(connection, _read_json_saves(LEGACY_SAVE_FILE), revision=0)
+
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _get_record_path(player_name):
+    """
+    Returns the path of a player's record file.
+
+    The file is named after the SHA-1 digest of the player name, which is unique
+    whatever the case sensitivity of the filesystem, and records are spread over 256
+    shard directories named after the first two hex digits of the digest.
+
+    :param player_name: The name of the player.
+    :type player_name: str
+    :return: The path of the record file.
+    :rtype: str
+    """
+    digest = hashlib.sha1(player_name.encode("utf-8")).hexdigest()
+    return os.path.join(SAVE_DIR, digest[:2], f"{digest}.sav")
+
+
+@contextmanager
+def _player_lock(player_name):
+    """
+    Holds the exclusive advisory lock of a player's record while in the context.
+
+    Each player has its own lock file, so writers of different players never wait
+    for each other.
+
+    :param player_name: The name of the player to lock.
+    :type player_name: str
+    """
+    lock_path = _get_record_path(player_name)[:-len(".sav")] + ".lock"
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _read_envelope(path):
+    """
+    Reads the raw content of a record file.
+
+    Record files start with a header holding a magic number, flags, the revision
+    and the CRC32 checksum of the encoded record. Files written before checksums
+    existed only start with the revision, and are never verified.
+
+    :param path: The path of the record file.
+    :type path: str
+    :return: The revision, the encoded record, and whether the record carries a
+        checksum that matches its content; or None if the file does not exist.
+    :rtype: tuple or None
+    :raises ValueError: If the file is too short to hold its header.
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+
+    if content.startswith(_ENVELOPE_MAGIC):
+        if len(content) < _ENVELOPE.size:
+            raise ValueError(f"Save record is truncated: {path}")
+        magic, flags, revision, checksum = _ENVELOPE.unpack_from(content)
+        record = content[_ENVELOPE.size:]
+        return revision, record, bool(flags & _FLAG_CHECKSUM) and zlib.crc32(record) == checksum
+
+    if len(content) < _REVISION.size:
+        raise ValueError(f"Save record is truncated: {path}")
+    return _REVISION.unpack_from(content)[0], content[_REVISION.size:], False
+
 
+def _write_envelope(path, revision, record, verified=False):
+    """
+    Atomically writes a record file through a temporary file and `os.replace`.
+
+    :param path: The path of the record file.
+    :type path: str
+    :param revision: The revision of the record.
+    :type revision: int
+    :param record: The encoded record.
+    :type record: bytes
+    :param verified: If True, the record comes from a validated game state and is
+        stored with its checksum, which allows it to be loaded without validation.
+    :type verified: bool
+    """
+    flags = _FLAG_CHECKSUM if verified else 0
+    checksum = zlib.crc32(record) if verified else 0
+    write_atomic(path, _ENVELOPE.pack(_ENVELOPE_MAGIC, flags, revision, checksum) + record)
+
+
+def _get_history_path(player_name):
+    """
+    Returns the path of a player's save history file, next to the record file.
+    """
+    return _get_record_path(player_name)[:-len(".sav")] + ".hist"
+
+
+def _store_record(player_name, record, revision=None, on_write=None, verified=False):
+    """
+    Writes a player's record unless a newer one is already stored.
+
+    Under the player's lock, the stored record is replaced only if the new one has
+    a higher (revision, record bytes) pair. Concurrent saves of the same player
+    therefore always end with the same winner, whatever order they reach the lock.
+
+    :param player_name: The name of the player.
+    :type player_name: str
+    :param record: The encoded record.
+    :type record: str or bytes
+    :param revision: The revision of the record; defaults to the current time in nanoseconds.
+    :type revision: int
+    :param on_write: An optional function called with the revision, still under the
+        player's lock, once the record is written.
+    :type on_write: callable
+    :param verified: If True, the record comes from a validated game state and is
+        stored with its checksum.
+    :type verified: bool
+    :return: True if the record was written, False if a newer record was kept.
+    :rtype: bool
+    :raises IOError: For I/O errors during writing.
+    """
+    global _generation
+    if isinstance(record, str):
+        record = record.encode("utf-8")
+    if revision is None:
+        revision = time.time_ns()
+
+    path = _get_record_path(player_name)
+    try:
+        with _player_lock(player_name):
+            try:
+                current = _read_envelope(path)
+            except ValueError:
+                current = None
+            if current is not None and current[:2] >= (revision, record):
+                return False
+            _write_envelope(path, revision, record, verified)
+            if on_write is not None:
+                on_write(revision)
+            return True
+    except PermissionError:
+        raise PermissionError(f"No permission to write save file: {path}")
+    except OSError as e:
+        raise IOError(f"Error writing save file: {str(e)}")
+    finally:
+        _generation += 1
 
-def _load_saves():
+
+def _store_save(player_name, data, record, revision=None, verified=False, on_write=None):
+    """
+    Writes a player's record and, if it was written, appends it to the save history.
+
+    :param player_name: The name of the player.
+    :type player_name: str
+    :param data: The serialized game state.
+    :type data: dict
+    :param record: The encoded game state.
+    :type record: str or bytes
+    :param revision: The revision of the record; defaults to the current time in nanoseconds.
+    :type revision: int
+    :param verified: If True, the game state was validated and the record is
+        stored with its checksum.
+    :type verified: bool
+    :param on_write: An optional function called with the revision, still under the
+        player's lock, once the record and its checkpoint are written.
+    :type on_write: callable
+    :return: True if the record was written, False if a newer record was kept.
+    :rtype: bool
+    :raises IOError: For I/O errors during writing.
     """
-    Loads all save data from the JSON file.
+    history_path = _get_history_path(player_name)
+
+    def write_checkpoint(written_revision):
+        history.append_checkpoint(history_path, data, written_revision)
+        if on_write is not None:
+            on_write(written_revision)
 
-    This is an internal helper function that reads the save file, handles potential
-    errors like a missing or corrupted file, and returns the content.
+    return _store_record(player_name, record, revision, on_write=write_checkpoint, verified=verified)
 
+
+def _read_json_saves(path):
+    """
+    Reads a list of saves from a JSON file in the legacy format.
+
+    :param path: The path of the JSON file.
+    :type path: str
     :return: A list of dictionaries, where each dictionary represents a saved game.
     :rtype: list
-    :raises FileNotFoundError: If the save file does not exist.
-    :raises ValueError: If the save file is corrupted and cannot be decoded from JSON.
+    :raises ValueError: If the file is corrupted and cannot be decoded from JSON.
     :raises PermissionError: If the script lacks permissions to read the file.
     :raises IOError: For other I/O errors during file reading.
     """
-    if not os.path.exists(SAVE_FILE):
-        raise FileNotFoundError(f"Save file not found at: {SAVE_FILE}")
-
     try:
-        with open(SAVE_FILE, "r") as f:
+        with open(path, "r") as f:
             content = f.read().strip()
-            return json.loads(content) if content else []
+            saves = json.loads(content) if content else []
     except json.JSONDecodeError as e:
         raise ValueError(f"Save file is corrupted: {str(e)}")
     except PermissionError:
-        raise PermissionError(f"No permission to read save file: {SAVE_FILE}")
+        raise PermissionError(f"No permission to read save file: {path}")
     except IOError as e:
         raise IOError(f"Error reading save file: {str(e)}")
 
+    if not isinstance(saves, list):
+        raise ValueError(f"Save file is corrupted: expected a list of saves in {path}")
+    return saves
+
+
+def _import_records(connection, saves, revision=None, validated=False):
+    """
+    Writes a list of save dictionaries to record files and indexes their names.
+
+    Entries without a player name are skipped. When several entries share a name,
+    the last one wins, mirroring how the legacy file was appended to.
+
+    :param connection: The connection to the player index.
+    :type connection: sqlite3.Connection
+    :param saves: The save dictionaries to import.
+    :type saves: list
+    :param revision: The revision given to the imported records; defaults to the
+        current time, which overwrites existing saves.
+    :type revision: int
+    :param validated: If True, the saves were validated and are stored with a checksum.
+    :type validated: bool
+    :return: The number of imported saves.
+    :rtype: int
+    """
+    records = {}
+    for s in saves:
+        player_name = s.get("player", {}).get("name") if isinstance(s, dict) else None
+        if isinstance(player_name, str) and player_name.strip():
+            records[player_name] = s
+
+    for player_name, data in records.items():
+        _store_save(player_name, data, codec.encode(data, _save_format), revision, validated)
+    connection.executemany("INSERT OR IGNORE INTO players (name) VALUES (?)",
+                           ((player_name,) for player_name in records))
+    return len(records)
+
+
+def import_json_saves(path=LEGACY_SAVE_FILE):
+    """
+    Imports saves from a JSON file in the legacy format into the save directory.
+
+    Existing saves for the same players are overwritten.
+
+    :param path: The path of the JSON file to import.
+    :type path: str
+    :return: The number of imported saves.
+    :rtype: int
+    :raises FileNotFoundError: If the JSON file does not exist.
+    :raises ValueError: If the JSON file is corrupted.
+    :raises IOError: For I/O or database errors during the import.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Save file not found at: {path}")
+
+    return import_saves(_read_json_saves(path))
+
+
+def import_saves(saves, validated=False):
+    """
+    Writes a batch of serialized game states and indexes their player names.
+
+    The names are indexed in a single transaction, which makes this much faster
+    than calling `save_snapshot` for each state when importing many saves. Existing
+    saves for the same players are overwritten.
+
+    :param saves: The serialized game states, as produced by `GameManager.to_dict`.
+    :type saves: list
+    :param validated: If True, the states were already validated through
+        `GameManager.from_dict`, so their records get a checksum and later load
+        through the trusted fast path.
+    :type validated: bool
+    :return: The number of imported saves.
+    :rtype: int
+    :raises IOError: For I/O or database errors during the import.
+    """
+    connection = _get_connection()
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            count = _import_records(connection, saves, validated=validated)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+    except sqlite3.Error as e:
+        raise IOError(f"Error importing saves: {str(e)}")
+    return count
+
+
+def _get_save(player_name):
+    """
+    Returns the decoded save of a player, using the process-wide cache.
+
+    A cached save is reused as long as the record file has the same inode, size
+    and modification time, and no save was made by this process since, so repeated
+    lookups cost a `stat` and a dictionary lookup.
+
+    :param player_name: The name of the player to look up.
+    :type player_name: str
+    :return: The saved game as a dictionary, or None if the player has no save, and
+        whether the record's checksum was verified.
+    :rtype: tuple
+    :raises ValueError: If the save data cannot be decoded.
+    :raises IOError: For I/O errors during reading.
+    """
+    _get_connection()
+    path = _get_record_path(player_name)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None, False
+    except OSError as e:
+        raise IOError(f"Error reading save file: {str(e)}")
+
+    token = (_generation, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    cached = _cache.get(player_name)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    entry = _read_save(player_name)
+    _cache[player_name] = (token, entry)
+    return entry
+
+
+def _read_save(player_name):
+    """
+    Reads and decodes the save of a player, without using the process-wide cache.
+
+    :param player_name: The name of the player to look up.
+    :type player_name: str
+    :return: The saved game as a dictionary, or None if the player has no save, and
+        whether the record's checksum was verified.
+    :rtype: tuple
+    :raises ValueError: If the save data cannot be decoded.
+    :raises IOError: For I/O errors during reading.
+    """
+    try:
+        envelope = _read_envelope(_get_record_path(player_name))
+        return (codec.decode(envelope[1]), envelope[2]) if envelope is not None else (None, False)
+    except ValueError as e:
+        raise ValueError(f"Corrupted save data for '{player_name}': {str(e)}")
+    except OSError as e:
+        raise IOError(f"Error reading save file: {str(e)}")
+
+
+def get_save_data(player_name, cached=True):
+    """
+    Returns the serialized game state saved for a player, without validating it.
+
+    :param player_name: The name of the player to look up.
+    :type player_name: str
+    :param cached: If False, the save is decoded from its record file and not kept
+        in the process-wide cache, so reading every save of a large store does not
+        grow the memory of the process.
+    :type cached: bool
+    :return: The saved game as a dictionary, or None if the player has no save.
+    :rtype: dict or None
+    :raises ValueError: If player_name is invalid or the save data cannot be decoded.
+    :raises IOError: For I/O errors during reading.
+    """
+    if not isinstance(player_name, str) or not player_name.strip():
+        raise ValueError("player_name must be a non-empty string")
+    if not cached:
+        _get_connection()
+        return _read_save(player_name)[0]
+    return _get_save(player_name)[0]
+
+
+def set_save_format(save_format):
+    """
+    Sets the format used to encode the saves written by this process.
+
+    Saves in any format can always be loaded, whatever the current format is.
+
+    :param save_format: The format to use, one of `codec.SAVE_FORMATS`.
+    :type save_format: str
+    :raises ValueError: If the format is unknown.
+    """
+    global _save_format
+    if save_format not in codec.SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {save_format}")
+    _save_format = save_format
+
+
+def migrate_saves(save_format):
+    """
+    Re-encodes every save to the given format.
+
+    Player names are streamed from the index, and each record is rewritten under
+    its player's lock, keeping its revision. Saves that are already in the target
+    format are left untouched.
+
+    :param save_format: The format to migrate to, one of `codec.SAVE_FORMATS`.
+    :type save_format: str
+    :return: The number of migrated saves.
+    :rtype: int
+    :raises ValueError: If the format is unknown or a save is corrupted.
+    :raises IOError: For I/O or database errors during the migration.
+    """
+    global _generation
+    if save_format not in codec.SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {save_format}")
+
+    migrated = 0
+    try:
+        for player_name in iter_player_names():
+            path = _get_record_path(player_name)
+            with _player_lock(player_name):
+                try:
+                    envelope = _read_envelope(path)
+                    if envelope is None or codec.detect_format(envelope[1]) == save_format:
+                        continue
+                    record = codec.encode(codec.decode(envelope[1]), save_format)
+                except ValueError as e:
+                    raise ValueError(f"Corrupted save data for '{player_name}': {str(e)}")
+
+                if isinstance(record, str):
+                    record = record.encode("utf-8")
+                _write_envelope(path, envelope[0], record, envelope[2])
+                migrated += 1
+    except OSError as e:
+        raise IOError(f"Error migrating save files: {str(e)}")
+    finally:
+        _generation += 1
+
+    return migrated
+
 
 def save_game(game_manager):
     """
-    Saves the current game state to the save file.
+    Saves the current game state to the player's record file.
 
     This function serializes the GameManager object into a dictionary and writes it
-    to the save file. If a save for the same player already exists, it is overwritten.
+    as the record of its player. If a save for the same player already exists, it is
+    overwritten, unless another process stored a newer save meanwhile. Other players'
+    saves are not read nor rewritten, and the player index is only written to on the
+    first save of a player.
 
     :param game_manager: The main game manager object to be saved.
     :type game_manager: GameManager
     :raises TypeError: If game_manager is not an instance of GameManager.
-    :raises PermissionError: If the script lacks permissions to write to the file.
-    :raises IOError: For other I/O errors during file writing.
+    :raises ValueError: If the game state cannot be encoded in the current save format.
+    :raises IOError: For I/O or database errors during writing.
     """
     if not isinstance(game_manager, GameManager):
         raise TypeError("game_manager must be an instance of GameManager")
 
-    try:
-        saves = _load_saves()
-    except FileNotFoundError:
-        saves = []
+    save_snapshot(game_manager.to_dict(), verified=True)
+
+
+def save_snapshot(data, revision=None, verified=False):
+    """
+    Saves a game state already serialized with `GameManager.to_dict`.
+
+    This is the encode-and-write half of `save_game`, which lets the state be
+    captured on one thread and written on another. The state is also appended to
+    the player's save history.
+
+    :param data: The serialized game state.
+    :type data: dict
+    :param revision: The revision of the save; defaults to the current time in
+        nanoseconds. Pass the time the state was captured so a delayed write never
+        replaces a newer save.
+    :type revision: int
+    :param verified: If True, the state comes from a valid GameManager: its record
+        is stored with a checksum and later loads without validation. Leave it False
+        for states from any other source.
+    :type verified: bool
+    :return: True if the save was written, False if a newer save was kept.
+    :rtype: bool
+    :raises ValueError: If the game state cannot be encoded in the current save format.
+    :raises IOError: For I/O or database errors during writing.
+    """
+    player_name = data.get("player", {}).get("name") if isinstance(data, dict) else None
+    if not isinstance(player_name, str) or not player_name.strip():
+        raise ValueError("data must be a serialized game state with a player name")
+
+    record = codec.encode(data, _save_format)
+    if revision is None:
+        revision = time.time_ns()
 
-    player_name = game_manager.player.name
-    saves = [s for s in saves if s.get("player", {}).get("name") != player_name]
-    saves.append(game_manager.to_dict())
+    connection = _get_connection()
+    first_save = not os.path.exists(_get_record_path(player_name))
+
+    def index_player(written_revision):
+        # The name is indexed only once its record is written, so a failed first
+        # save never leaves the player listed without a save.
+        if first_save:
+            connection.execute("INSERT OR IGNORE INTO players (name) VALUES (?)", (player_name,))
 
     try:
-        with open(SAVE_FILE, "w") as f:
-            json.dump(saves, f, indent=4)
-    except PermissionError:
-        raise PermissionError(f"No permission to write to save file: {SAVE_FILE}")
-    except IOError as e:
-        raise IOError(f"Error writing to save file: {str(e)}")
+        return _store_save(player_name, data, record, revision, verified, on_write=index_player)
+    except sqlite3.Error as e:
+        raise IOError(f"Error writing to save index: {str(e)}")
 
 
 def load_game(player_name):
     """
-    Loads a game state for a specific player from the save file.
+    Loads a game state for a specific player from the player's record file.
 
-    It searches for a save entry matching the given player name and reconstructs
-    the GameManager object from the stored data.
+    It reads the save record of the given player name and reconstructs the
+    GameManager object from the stored data. Records whose checksum matches skip
+    the per-field validation; other records are fully validated.
 
     :param player_name: The name of the player whose game should be loaded.
     :type player_name: str
     :return: A GameManager instance populated with the saved state.
     :rtype: GameManager
     :raises ValueError: If player_name is invalid, no save is found, or the save data is corrupted.
+    :raises IOError: For I/O errors during reading.
     """
     if not isinstance(player_name, str) or not player_name.strip():
         raise ValueError("player_name must be a non-empty string")
 
-    saves = _load_saves()
+    data, verified = _get_save(player_name)
+    if data is None:
+        raise ValueError(f"No save found for '{player_name}'")
 
-    for s in saves:
-        if s.get("player", {}).get("name") == player_name:
-            try:
-                return GameManager.from_dict(s)
-            except (KeyError, ValueError, TypeError) as e:
-                raise ValueError(f"Corrupted save data for '{player_name}': {str(e)}")
+    try:
+        if verified:
+            return GameManager.from_trusted_dict(data)
+        return GameManager.from_dict(data)
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Corrupted save data for '{player_name}': {str(e)}")
+
+
+def get_save_history(player_name):
+    """
+    Returns a summary of the checkpoints in a player's save history, oldest first.
+
+    :param player_name: The name of the player.
+    :type player_name: str
+    :return: A list of dictionaries with the 'revision' (save time in nanoseconds),
+        'time' and 'days_survived' of each checkpoint.
+    :rtype: list
+    :raises ValueError: If player_name is invalid or the history is corrupted.
+    """
+    if not isinstance(player_name, str) or not player_name.strip():
+        raise ValueError("player_name must be a non-empty string")
+    return history.list_checkpoints(_get_history_path(player_name))
+
+
+def load_checkpoint(player_name, index):
+    """
+    Loads the game state of a checkpoint in a player's save history.
 
-    raise ValueError(f"No save found for '{player_name}'")
+    Restoring a checkpoint only replays the deltas since the keyframe before it.
+    Saving the loaded game makes it the current save and adds a new checkpoint.
+
+    :param player_name: The name of the player.
+    :type player_name: str
+    :param index: The index of the checkpoint, 0 being the oldest; negative indexes
+        count from the most recent.
+    :type index: int
+    :return: A GameManager instance populated with the checkpoint state.
+    :rtype: GameManager
+    :raises ValueError: If player_name is invalid, the checkpoint does not exist, or
+        the history is corrupted.
+    """
+    if not isinstance(player_name, str) or not player_name.strip():
+        raise ValueError("player_name must be a non-empty string")
+
+    try:
+        data = history.read_checkpoint(_get_history_path(player_name), index)[1]
+        return GameManager.from_dict(data)
+    except IndexError:
+        raise ValueError(f"No checkpoint {index} for '{player_name}'")
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Corrupted save history for '{player_name}': {str(e)}")
 
 
 def has_save(player_name):
@@ -115,31 +700,98 @@ def has_save(player_name):
     if not isinstance(player_name, str) or not player_name.strip():
         raise ValueError("player_name must be a non-empty string")
 
+    _get_connection()
+    return os.path.exists(_get_record_path(player_name))
+
+
+def get_player_names(prefix="", after="", limit=PAGE_SIZE):
+    """
+    Returns the names of players with a saved game, in alphabetical order.
+
+    Names are read from the primary key index only, without decoding the saved
+    states, and the lookup seeks directly to the first matching name, so its cost
+    does not grow with the size of the store.
+
+    :param prefix: Only names starting with this prefix are returned.
+    :type prefix: str
+    :param after: Only names sorting strictly after this one are returned, which
+        allows paging through the names.
+    :type after: str
+    :param limit: The maximum number of names to return.
+    :type limit: int
+    :return: The list of player names.
+    :rtype: list
+    :raises IOError: For I/O or database errors during reading.
+    """
+    if not isinstance(prefix, str) or not isinstance(after, str):
+        raise TypeError("prefix and after must be strings")
+    if not isinstance(limit, int) or limit <= 0:
+        raise ValueError("limit must be a positive integer")
+
+    lower = max(prefix, after)
+    upper = prefix + "\U0010ffff" if prefix else None
+    query = "SELECT name FROM players WHERE name >= ? AND name != ?"
+    params = [lower, after]
+    if upper is not None:
+        query += " AND name < ?"
+        params.append(upper)
+    query += " ORDER BY name LIMIT ?"
+    params.append(limit)
+
     try:
-        saves = _load_saves()
-    except FileNotFoundError:
-        return False
+        rows = _get_connection().execute(query, params).fetchall()
+    except sqlite3.Error as e:
+        raise IOError(f"Error reading save index: {str(e)}")
 
-    return any(s.get("player", {}).get("name") == player_name for s in saves)
+    return [player_name for (player_name,) in rows]
+
+
+def iter_player_names(prefix="", batch_size=PAGE_SIZE * 10):
+    """
+    Iterates over the names of players with a saved game, in alphabetical order.
 
+    Names are fetched lazily in batches, so the whole list is never held in memory.
 
-def print_player_list():
+    :param prefix: Only names starting with this prefix are returned.
+    :type prefix: str
+    :param batch_size: The number of names fetched per query.
+    :type batch_size: int
+    :return: An iterator over the player names.
+    :rtype: Iterator[str]
     """
-    Prints a list of all players who have a saved game.
+    after = ""
+    while True:
+        names = get_player_names(prefix, after, batch_size)
+        yield from names
+        if len(names) < batch_size:
+            return
+        after = names[-1]
 
-    This function reads the save file and prints the name of each player found.
+
+def print_player_list(prefix="", after="", page_size=PAGE_SIZE):
+    """
+    Prints one page of the players who have a saved game.
+
+    Only the player names are read from the database; the saved states are not decoded.
     If no saves are found, it prints a corresponding message.
+
+    :param prefix: Only names starting with this prefix are printed.
+    :type prefix: str
+    :param after: The page starts after this name.
+    :type after: str
+    :param page_size: The maximum number of names printed.
+    :type page_size: int
+    :return: The printed names, and whether more names follow the page.
+    :rtype: tuple
     """
-    try:
-        saves = _load_saves()
-    except FileNotFoundError:
-        print("No saves found...")
-        return
+    names = get_player_names(prefix, after, page_size + 1)
+    has_more = len(names) > page_size
+    names = names[:page_size]
 
-    if not saves:
+    if not names:
         print("No saves found...")
-        return
 
-    for s in saves:
-        player_name = s.get("player", {}).get("name", "Unknown")
-        print(player_name)
\ No newline at end of file
+    for player_name in names:
+        print(player_name)
+
+    return names, has_more
@@ -0,0 +1,57 @@
+# This file provides helpers to compute and apply field-level deltas between
+# serialized game states, as produced by `GameManager.to_dict`. States are
+# flattened to a single level with dotted keys, so a delta only holds the leaf
+# values that changed.
+
+
+def flatten_state(data, prefix=""):
+    """
+    Flattens a nested dictionary into a single level with dotted keys.
+
+    :param data: The dictionary to flatten.
+    :type data: dict
+    :param prefix: The prefix prepended to every key.
+    :type prefix: str
+    :return: The flattened dictionary, e.g. {"player.fish_pull_delay.min": 0.3}.
+    :rtype: dict
+    """
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten_state(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def unflatten_state(flat):
+    """
+    Rebuilds a nested dictionary from a dictionary with dotted keys.
+
+    :param flat: The flattened dictionary.
+    :type flat: dict
+    :return: The nested dictionary.
+    :rtype: dict
+    """
+    data = {}
+    for key, value in flat.items():
+        node = data
+        *parents, leaf = key.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return data
+
+
+def diff_states(old, new):
+    """
+    Returns the fields of a flattened state that differ from a previous one.
+
+    :param old: The previous flattened state.
+    :type old: dict
+    :param new: The new flattened state.
+    :type new: dict
+    :return: The changed fields with their new values.
+    :rtype: dict
+    """
+    return {key: value for key, value in new.items() if old.get(key) != value}
@@ -4,7 +4,7 @@
 # player actions and game state changes.
 
 import sys
-from time import sleep
+from datetime import datetime
 
 from ascii_art.animal_ascii import AnimalAscii
 from ascii_art.general_ascii import GeneralAscii
@@ -13,13 +13,19 @@ from game.actions.eat import start_eat
 from game.actions.fish import start_fish
 from game.actions.sleep import start_sleep
 from game.actions.hunt import start_hunt
-from game.data.save import print_player_list, has_save, load_game, save_game
+from game.data.autosave import ActionJournal, has_autosave, recover_autosave
+from game.data.background_save import flush_background_saves, get_background_saver
+from game.data.save import (print_player_list, get_player_names, get_save_history, has_save, load_checkpoint,
+                            load_game)
 from game.game_manager import GameManager
 from game.player import Player
 from game.player_class.fisher import Fisher
 from game.player_class.hunter import Hunter
+from utils.pacing import pause
 from utils.utils import Utils
 
+CHECKPOINTS_SHOWN = 9
+
 
 def launch_game():
     """
@@ -74,7 +80,7 @@ def create_player():
     print("#  Welcome to Player Creation #")
     print()
 
-    name = Utils.get_input_str(8, "Enter your name: ", invalid_enters=["return"])
+    name = Utils.get_input_str(8, "Enter your name: ", invalid_enters=["return", "next", "prev", "all"])
 
     print()
     print("Choose your class:")
@@ -112,13 +118,19 @@ def load_game_choice():
     """
     Manages the game loading process.
 
-    Displays a list of saved player profiles and prompts the user to enter a name
+    Displays one page of saved player profiles and prompts the user to enter a name
     to load. It handles user input, validates if a save exists, and loads the
-    corresponding game state. It also allows the user to return to the main menu.
+    corresponding game state. The user can browse the pages with "next" and "prev",
+    filter the list by entering the start of a name, and clear the filter with "all".
+    It also allows the user to return to the main menu.
 
     :return: A GameManager instance loaded from the selected save file.
     :rtype: GameManager
     """
+    flush_background_saves()
+    prefix = ""
+    page_starts = [""]
+
     while True:
         Utils.clear_terminal()
         Utils.draw_bar(125, "*", corners="#")
@@ -127,10 +139,16 @@ def load_game_choice():
 
         Utils.draw_bar(30, "-", label=" Saved Players List ", corners="*")
         print()
-        print_player_list()
+        if prefix:
+            print(f"Names starting with: {prefix}")
+            print()
+        names, has_more = print_player_list(prefix, page_starts[-1])
         print()
+        print(f"Page {len(page_starts)}")
         Utils.draw_bar(30, "-", corners="*")
         print()
+        print(""""next" / "prev" : browse pages    |    start of a name : search    |    "all" : clear search""")
+        print()
 
         Utils.draw_bar(125, "*", corners="#")
         print()
@@ -141,13 +159,81 @@ def load_game_choice():
         if name == "return":
             launch_game()
 
+        if not has_save(name) and not has_autosave(name):
+            if name == "next":
+                if has_more:
+                    page_starts.append(names[-1])
+                continue
+            if name == "prev":
+                if len(page_starts) > 1:
+                    page_starts.pop()
+                continue
+            if name == "all":
+                prefix = ""
+                page_starts = [""]
+                continue
+            if get_player_names(name, limit=1):
+                prefix = name
+                page_starts = [""]
+                continue
+
+        if has_autosave(name):
+            print("An autosave with unsaved progress was found, do you want to restore it?")
+            print()
+            Utils.draw_bar(20, "-", corners="*")
+            print("1 : Yes")
+            print("2 : No")
+            Utils.draw_bar(20, "-", corners="*")
+            print()
+
+            confirm = Utils.get_input_int(1, 2, "Enter your choice: ")
+            print()
+            if confirm == 1:
+                print("Autosave restored successfully!")
+                pause(2)
+                return recover_autosave(name)
+
         if has_save(name):
+            game_manager = choose_checkpoint(name)
             print("Game loaded successfully!")
-            sleep(2)
-            return load_game(name)
+            pause(2)
+            return game_manager
         else:
             print("No game saved on this name! Try again.")
-            sleep(2)
+            pause(2)
+
+
+def choose_checkpoint(player_name):
+    """
+    Lets the player choose which checkpoint of their save history to load.
+
+    Lists the most recent checkpoints of the player's save history, newest first,
+    and loads the chosen one. If the player only has one save, it is loaded directly.
+
+    :param player_name: The name of the player to load.
+    :type player_name: str
+    :return: A GameManager instance loaded from the chosen checkpoint.
+    :rtype: GameManager
+    """
+    checkpoints = get_save_history(player_name)[-CHECKPOINTS_SHOWN:]
+    if len(checkpoints) <= 1:
+        return load_game(player_name)
+
+    print("Which save do you want to load?")
+    print()
+    Utils.draw_bar(30, "-", corners="*")
+    for i, checkpoint in enumerate(reversed(checkpoints), 1):
+        saved_at = datetime.fromtimestamp(checkpoint["revision"] / 1e9).strftime("%Y-%m-%d %H:%M")
+        print(f"{i} : Day {checkpoint['days_survived']} at {Utils.format_time(checkpoint['time'])} "
+              f"(saved on {saved_at})")
+    Utils.draw_bar(30, "-", corners="*")
+    print()
+
+    choice = Utils.get_input_int(1, len(checkpoints), "Enter your choice: ")
+    print()
+    if choice == 1:
+        return load_game(player_name)
+    return load_checkpoint(player_name, -choice)
 
 
 def game_loop(game_manager):
@@ -157,13 +243,20 @@ def game_loop(game_manager):
     This function runs continuously, presenting the player with a menu of actions
     (Eat, Sleep, Fish, Hunt, Save, etc.). It captures the player's choice and
     calls the appropriate function to handle the action. It also checks for the
-    player's death to trigger the end-game sequence.
+    player's death to trigger the end-game sequence. Every completed action is
+    autosaved to the player's journal. Manual saves are written in the background,
+    and their outcome is shown on the next screen, or before leaving the loop.
 
     :param game_manager: The main game manager object that holds the game state.
     :type game_manager: GameManager
     """
+    journal = ActionJournal(game_manager.player.name)
+    saver = get_background_saver()
+
     while True:
         if game_manager.player.hp <= 0:
+            finish_background_saves(saver, game_manager, journal)
+            journal.clear()
             end_game(game_manager)
 
         Utils.clear_terminal()
@@ -173,6 +266,8 @@ def game_loop(game_manager):
         game_manager.print_player_inventory(under_bar=True)
         print()
 
+        print_save_results(saver, game_manager, journal)
+
         Utils.draw_bar(30, "-", corners="*")
         print()
 
@@ -193,15 +288,22 @@ def game_loop(game_manager):
 
         if choice == 1:
             start_eat(game_manager)
+            journal.record(game_manager)
         elif choice == 2:
             start_sleep(game_manager)
+            journal.record(game_manager)
         elif choice == 3:
             start_fish(game_manager)
+            journal.record(game_manager)
         elif choice == 4:
             start_hunt(game_manager)
+            journal.record(game_manager)
         elif choice == 5:
+            # A save of this player may still be pending: wait for it, so the first
+            # save of a player is known before asking to overwrite it.
+            saver.flush()
             if has_save(game_manager.player.name):
-                print("Previous save on this name will be overwritten, are you sure?")
+                print("Previous save on this name will be replaced (it stays in the save history), are you sure?")
                 print()
                 Utils.draw_bar(20, "-", corners="*")
                 print("1 : Yes")
@@ -213,9 +315,7 @@ def game_loop(game_manager):
                 if confirm == 2:
                     continue
 
-            save_game(game_manager)
-            print("Game saved successfully!")
-            sleep(2)
+            saver.submit(game_manager)
         else:
             print("Unsaved progress will be lost, are you sure?")
             print()
@@ -227,9 +327,58 @@ def game_loop(game_manager):
 
             confirm = Utils.get_input_int(1, 2, "Enter your choice: ")
             if confirm == 1:
+                finish_background_saves(saver, game_manager, journal)
+                journal.clear()
                 launch_game()
 
 
+def print_save_results(saver, game_manager, journal):
+    """
+    Prints the outcome of the background saves finished since the previous call.
+
+    A successful save of the current game state also clears the player's autosave
+    journal, as the save now holds the same progress.
+
+    :param saver: The background saver the saves were submitted to.
+    :type saver: BackgroundSaver
+    :param game_manager: The game manager of the current game.
+    :type game_manager: GameManager
+    :param journal: The autosave journal of the current game.
+    :type journal: ActionJournal
+    :return: True if any outcome was printed.
+    :rtype: bool
+    """
+    results = saver.poll()
+    for result in results:
+        if result.error is not None:
+            print(f"Error while saving the game: {str(result.error)}")
+        else:
+            print("Game saved successfully!")
+            if result.data == game_manager.to_dict():
+                journal.clear()
+        print()
+    return bool(results)
+
+
+def finish_background_saves(saver, game_manager, journal):
+    """
+    Waits for the pending saves of the current game and prints their outcome.
+
+    Called before leaving the game loop, so the outcome of a save is never reported
+    in, nor checked against, a game loaded afterwards.
+
+    :param saver: The background saver the saves were submitted to.
+    :type saver: BackgroundSaver
+    :param game_manager: The game manager of the current game.
+    :type game_manager: GameManager
+    :param journal: The autosave journal of the current game.
+    :type journal: ActionJournal
+    """
+    saver.flush()
+    if print_save_results(saver, game_manager, journal):
+        input("Press [ENTER] to continue...")
+
+
 def end_game(game_manager):
     """
     Handles the end-game sequence when the player dies.
@@ -2,11 +2,155 @@
 # manager for the game. It holds the player object, tracks game time, and provides
 # methods for manipulating and displaying the game state.
 
+import random
+from functools import lru_cache
+
 from game.player import Player
 from utils.day_period import DayPeriod
 from utils.range import Range
 from utils.utils import Utils
 
+ENERGY_HP_TAX_RATE = Range(0.3, 0.4)
+HUNGER_HP_TAX_RATE = Range(0.4, 0.45)
+HUNGER_TAX_RATE = Range(0.45, 0.65)
+PANEL_WIDTH = 125
+PANEL_CACHE_SIZE = 64
+# Below this share of its maximum, energy or hunger costs HP over time.
+LOW_STATUS_RATIO = 0.2
+
+
+def get_hours_below(level, threshold, drain_rate, hours):
+    """
+    Returns how many of the given hours a draining stat spends under a threshold.
+
+    The stat loses drain_rate per hour, so it crosses the threshold after
+    (level - threshold) / drain_rate hours, or is already under it.
+
+    :param level: The value of the stat at the start of the interval.
+    :type level: float
+    :param threshold: The value under which the stat is critically low.
+    :type threshold: float
+    :param drain_rate: The amount the stat loses per hour; 0 if it is not taxed.
+    :type drain_rate: float
+    :param hours: The length of the interval.
+    :type hours: float
+    :return: The hours spent under the threshold, between 0 and hours.
+    :rtype: float
+    """
+    if level < threshold:
+        return hours
+    if drain_rate <= 0:
+        return 0
+    return max(0, hours - (level - threshold) / drain_rate)
+
+
+def get_day_period(time):
+    """
+    Determines the period of the day of an in-game time.
+
+    :param time: The in-game time, between 0 and 24.
+    :type time: float
+    :return: The DayPeriod enum (DAWN, MORNING, AFTERNOON, or NIGHT).
+    :rtype: DayPeriod
+    """
+    if 0 <= time < 6:
+        return DayPeriod.DAWN
+    elif 6 <= time < 12:
+        return DayPeriod.MORNING
+    elif 12 <= time < 18:
+        return DayPeriod.AFTERNOON
+    else:
+        return DayPeriod.NIGHT
+
+
+# The status panels are rebuilt only when the state they show changes: each one is
+# cached on the values it displays, so redrawing an unchanged screen is a lookup.
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def format_game_panel(time, days_survived, under_bar=False):
+    """
+    Returns the game status panel, as printed by `GameManager.print_game_status`.
+
+    :param time: The in-game time.
+    :type time: float
+    :param days_survived: The number of days survived.
+    :type days_survived: int
+    :param under_bar: If True, ends the panel with a separator bar.
+    :type under_bar: bool
+    :return: The panel, ending with a line break.
+    :rtype: str
+    """
+    lines = [
+        Utils.format_bar(PANEL_WIDTH, "-", "Game Status: ", "*"),
+        "",
+        f"                         Time: {Utils.format_time(time)}       |       "
+        f"Day Period: {get_day_period(time).name}       |       "
+        f"Days Survived: {days_survived}",
+        "",
+    ]
+    return _end_panel(lines, under_bar)
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def format_player_panel(name, class_name, hp, max_hp, hunger, max_hunger, energy, max_energy, fish_pull_delay,
+                        hunt_success_rate, run_success_rate, under_bar=False):
+    """
+    Returns the player status panel, as printed by `GameManager.print_player_status`.
+
+    The arguments are the matching attributes of the player; the skill ranges can
+    be used as keys since they are immutable.
+
+    :param under_bar: If True, ends the panel with a separator bar.
+    :type under_bar: bool
+    :return: The panel, ending with a line break.
+    :rtype: str
+    """
+    lines = [
+        Utils.format_bar(PANEL_WIDTH, "-", f"{name} ({class_name}) Status: ", "*"),
+        "",
+        f"               HP: {Utils.format_float(hp)} / {int(max_hp)}          |          "
+        f"Hunger: {Utils.format_float(hunger)} / {int(max_hunger)}           |          "
+        f"Energy: {Utils.format_float(energy)} / {int(max_energy)}",
+        "",
+        f"Fishing Average Delay: {Utils.format_float(fish_pull_delay.get_average())}s       |       "
+        f"Hunt Average Success Rate: {Utils.format_float(hunt_success_rate.get_average() * 100)}%       |       "
+        f"Run Average Success Rate: {Utils.format_float(run_success_rate.get_average() * 100)}%",
+        "",
+    ]
+    return _end_panel(lines, under_bar)
+
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def format_inventory_panel(fish_amount, meat_amount, under_bar=False):
+    """
+    Returns the inventory panel, as printed by `GameManager.print_player_inventory`.
+
+    :param fish_amount: The amount of fish carried.
+    :type fish_amount: int
+    :param meat_amount: The amount of meat carried.
+    :type meat_amount: int
+    :param under_bar: If True, ends the panel with a separator bar.
+    :type under_bar: bool
+    :return: The panel, ending with a line break.
+    :rtype: str
+    """
+    lines = [
+        Utils.format_bar(PANEL_WIDTH, "-", "Player Inventory: ", "*"),
+        "",
+        f"                                   Fish: {fish_amount}                 |                 "
+        f"Meat: {meat_amount}",
+        "",
+    ]
+    return _end_panel(lines, under_bar)
+
+
+def _end_panel(lines, under_bar):
+    """
+    Joins the lines of a panel, adding the bottom separator bar if requested.
+    """
+    if under_bar:
+        lines += [Utils.format_bar(PANEL_WIDTH, "-", corners="*"), ""]
+    return "\n".join(lines) + "\n"
+
 
 class GameManager:
     """
@@ -18,7 +162,7 @@ class GameManager:
     It also handles its own serialization and deserialization for saving and
     loading games.
     """
-    def __init__(self, player, time=8.0, days_survived=0):
+    def __init__(self, player, time=8.0, days_survived=0, rng=None):
         """
         Initializes a new GameManager instance.
 
@@ -28,6 +172,8 @@ class GameManager:
         :type time: float
         :param days_survived: The initial number of days survived.
         :type days_survived: int
+        :param rng: The random generator of the game; a new unseeded one by default.
+        :type rng: random.Random
         """
         if not isinstance(player, Player):
             raise TypeError("Player must be an instance of Player class")
@@ -39,14 +185,16 @@ class GameManager:
         self.player = player
         self.time = time
         self.days_survived = days_survived
+        self.rng = rng or random.Random()
 
     def pass_time(self, time, tax_energy=True, tax_hunger=True):
         """
         Advances the game time and applies associated status effects.
 
         Increments the in-game time, handles day rollovers, and applies penalties
-        to the player's energy and hunger. It also inflicts HP damage if the
-        player's energy or hunger are critically low.
+        to the player's energy and hunger. It also inflicts HP damage for the part
+        of the interval during which the player's energy or hunger are critically
+        low, see `get_hours_below`, so one long call matches many short ones.
 
         :param time: The amount of time (in hours) to pass.
         :type time: float
@@ -60,33 +208,37 @@ class GameManager:
         if not isinstance(time, (int, float)) or time <= 0:
             raise ValueError("Time must be a positive number")
 
-        self.time += time
-        if self.time >= 24.0:
-            self.days_survived += int(self.time // 24.0)
-            self.time = self.time % 24
+        days, self.time = divmod(self.time + time, 24.0)
+        self.days_survived += int(days)
+
+        # Energy drains 1 per hour and hunger at a rate rolled once for the whole
+        # interval, so the moment each one drops under its threshold is known upfront
+        # and the HP tax only covers the hours spent under it.
+        hunger_rate = HUNGER_TAX_RATE.get_random(rng=self.rng)
+        hunger_tax = time * hunger_rate
 
-        tax_energy_hp = False
+        tired_hours = get_hours_below(self.player.energy, self.player.max_energy * LOW_STATUS_RATIO,
+                                      1 if tax_energy else 0, time)
+        tax_energy_hp = tired_hours > 0
         energy_hp_tax = 0
-        if self.player.energy < self.player.max_energy * 0.2:
-            tax_energy_hp = True
-            energy_hp_tax = time * Range(0.3, 0.4).get_random()
+        if tax_energy_hp:
+            energy_hp_tax = tired_hours * ENERGY_HP_TAX_RATE.get_random(rng=self.rng)
             self.player.take_damage(energy_hp_tax)
 
-        tax_hunger_hp = False
+        hungry_hours = get_hours_below(self.player.hunger, self.player.max_hunger * LOW_STATUS_RATIO,
+                                       hunger_rate if tax_hunger else 0, time)
+        tax_hunger_hp = hungry_hours > 0
         hunger_hp_tax = 0
-        if self.player.hunger < self.player.max_hunger * 0.2:
-            tax_hunger_hp = True
-            hunger_hp_tax = time * Range(0.4, 0.45).get_random()
+        if tax_hunger_hp:
+            hunger_hp_tax = hungry_hours * HUNGER_HP_TAX_RATE.get_random(rng=self.rng)
             self.player.take_damage(hunger_hp_tax)
 
         if tax_energy:
             self.player.take_energy(time)
-
-        hunger_tax = time * Range(0.45, 0.65).get_random()
         if tax_hunger:
             self.player.take_hunger(hunger_tax)
 
-        display = f"{Utils.format_time(time)} have passed: "
+        display = f"{Utils.format_duration(time)} have passed: "
         if tax_energy:
             display += f"\n    * Energy lost: {Utils.format_float(time)}"
         if tax_hunger:
@@ -103,61 +255,39 @@ class GameManager:
         Prints the current status of the game world to the console.
 
         Displays the current time, day period, and days survived in a formatted panel.
+        The panel is cached by `format_game_panel`.
 
         :param under_bar: If True, prints a separator bar at the bottom.
         :type under_bar: bool
         """
-        Utils.draw_bar(125, "-", "Game Status: ", "*")
-        print()
-        print(f"                         Time: {self.get_time()}       |       "
-              f"Day Period: {self.get_day_period().name}       |       "
-              f"Days Survived: {self.days_survived}")
-        print()
-        if under_bar:
-            Utils.draw_bar(125, "-", corners="*")
-            print()
+        print(format_game_panel(self.time, self.days_survived, under_bar), end="")
 
     def print_player_status(self, under_bar=False):
         """
         Prints the current status of the player to the console.
 
         Displays the player's name, class, core stats (HP, Hunger, Energy), and
-        skill levels in a formatted panel.
+        skill levels in a formatted panel. The panel is cached by `format_player_panel`.
 
         :param under_bar: If True, prints a separator bar at the bottom.
         :type under_bar: bool
         """
-        Utils.draw_bar(125, "-", f"{self.player.name} ({self.player.player_class.name}) Status: ", "*")
-        print()
-        print(f"               HP: {self.player.format_hp()} / {int(self.player.max_hp)}          |          "
-              f"Hunger: {self.player.format_hunger()} / {int(self.player.max_hunger)}           |          "
-              f"Energy: {self.player.format_energy()} / {int(self.player.max_energy)}")
-        print()
-        print(f"Fishing Average Delay: {self.player.format_fish_pull_delay()}       |       "
-              f"Hunt Average Success Rate: {self.player.format_hunt_success_rate()}       |       "
-              f"Run Average Success Rate: {self.player.format_run_success_rate()}")
-        print()
-        if under_bar:
-            Utils.draw_bar(125, "-", corners="*")
-            print()
+        player = self.player
+        print(format_player_panel(player.name, player.player_class.name, player.hp, player.max_hp, player.hunger,
+                                  player.max_hunger, player.energy, player.max_energy, player.fish_pull_delay,
+                                  player.hunt_success_rate, player.run_success_rate, under_bar), end="")
 
     def print_player_inventory(self, under_bar=False):
         """
         Prints the player's inventory to the console.
 
-        Displays the amount of fish and meat the player is carrying.
+        Displays the amount of fish and meat the player is carrying. The panel is
+        cached by `format_inventory_panel`.
 
         :param under_bar: If True, prints a separator bar at the bottom.
         :type under_bar: bool
         """
-        Utils.draw_bar(125, "-", "Player Inventory: ", "*")
-        print()
-        print(f"                                   Fish: {self.player.fish_amount}                 |                 "
-              f"Meat: {self.player.meat_amount}")
-        print()
-        if under_bar:
-            Utils.draw_bar(125, "-", corners="*")
-            print()
+        print(format_inventory_panel(self.player.fish_amount, self.player.meat_amount, under_bar), end="")
 
     def get_time(self):
         """
@@ -172,14 +302,7 @@ class GameManager:
         :return: The current DayPeriod enum (DAWN, MORNING, AFTERNOON, or NIGHT).
         :rtype: DayPeriod
         """
-        if 0 <= self.time < 6:
-            return DayPeriod.DAWN
-        elif 6 <= self.time < 12:
-            return DayPeriod.MORNING
-        elif 12 <= self.time < 18:
-            return DayPeriod.AFTERNOON
-        else:
-            return DayPeriod.NIGHT
+        return get_day_period(self.time)
 
     def to_dict(self):
         """
@@ -195,12 +318,14 @@ class GameManager:
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, rng=None):
         """
         Creates a GameManager instance from a dictionary.
 
         :param data: The dictionary containing the game's state.
         :type data: dict
+        :param rng: The random generator of the game; a new unseeded one by default.
+        :type rng: random.Random
         :return: A new GameManager instance.
         :rtype: GameManager
         :raises KeyError: If required keys are missing from the data.
@@ -213,5 +338,28 @@ class GameManager:
         return cls(
             player=Player.from_dict(data["player"]),
             time=data["time"],
-            days_survived=data["days_survived"]
-        )
\ No newline at end of file
+            days_survived=data["days_survived"],
+            rng=rng
+        )
+
+    @classmethod
+    def from_trusted_dict(cls, data, rng=None):
+        """
+        Creates a GameManager instance from a dictionary without validating it.
+
+        Only use this for data known to come from `to_dict`, such as a save record
+        whose checksum was verified; anything else must go through `from_dict`.
+
+        :param data: The dictionary containing the game's state.
+        :type data: dict
+        :param rng: The random generator of the game; a new unseeded one by default.
+        :type rng: random.Random
+        :return: A new GameManager instance.
+        :rtype: GameManager
+        """
+        game_manager = cls.__new__(cls)
+        game_manager.player = Player.from_trusted_dict(data["player"])
+        game_manager.time = data["time"]
+        game_manager.days_survived = data["days_survived"]
+        game_manager.rng = rng or random.Random()
+        return game_manager
\ No newline at end of file
@@ -6,6 +6,12 @@ from game.player_class.player_class import PlayerClass
 from utils.range import Range
 from utils.utils import Utils
 
+DEFAULT_FISH_PULL_DELAY = Range(0.3, 0.4)
+DEFAULT_HUNT_SUCCESS_RATE = Range(0.3, 0.4)
+DEFAULT_RUN_SUCCESS_RATE = Range(0.35, 0.5)
+CLASS_SKILL_MULTIPLIER = Range(1.01, 1.8)
+SKILL_SIDE = Range(1, 2)
+
 
 class Player:
     """
@@ -18,8 +24,8 @@ class Player:
     deserialization.
     """
     def __init__(self, name, player_class, hp=20.0, max_hp=20.0, hunger=20.0, max_hunger=20.0, energy=16.0,
-                 max_energy=16.0, fish_pull_delay=Range(0.3, 0.4), hunt_success_rate=Range(0.3, 0.4),
-                 run_success_rate=Range(0.35, 0.5), fish_amount=0, meat_amount=0):
+                 max_energy=16.0, fish_pull_delay=DEFAULT_FISH_PULL_DELAY, hunt_success_rate=DEFAULT_HUNT_SUCCESS_RATE,
+                 run_success_rate=DEFAULT_RUN_SUCCESS_RATE, fish_amount=0, meat_amount=0):
         """
         Initializes a new Player instance.
 
@@ -180,78 +186,87 @@ class Player:
             raise ValueError("Eat amount must be a non-negative number")
         self.hunger = min(self.max_hunger, self.hunger + amount)
 
-    def lvl_up_fish(self, amount):
+    def lvl_up_fish(self, amount, rng=None):
         """
         Increases the player's fishing skill.
 
         The skill gain is multiplied if the player has the 'Fisher' class.
-        The amount is added to either the min or max of the fish_pull_delay range.
+        The fish_pull_delay range is replaced by one with the amount added to its min or max.
 
         :param amount: The base amount to increase the skill by.
         :type amount: float
+        :param rng: The random generator to draw from; defaults to the `random` module.
+        :type rng: random.Random
         """
         if not isinstance(amount, (int, float)) or amount < 0:
             raise ValueError("Amount must be a non-negative number")
 
         if self.player_class.name == "Fisher":
-            amount *= Range(1.01, 1.8).get_random()
+            amount *= CLASS_SKILL_MULTIPLIER.get_random(rng=rng)
 
-        prob = Range(1, 2).get_random(as_int=True)
+        prob = SKILL_SIDE.get_random(as_int=True, rng=rng)
 
-        if prob == 1 and self.fish_pull_delay.min + amount < self.fish_pull_delay.max:
-            self.fish_pull_delay.min += amount
+        skill = self.fish_pull_delay
+        if prob == 1 and skill.min + amount < skill.max:
+            self.fish_pull_delay = Range(skill.min + amount, skill.max)
         else:
-            self.fish_pull_delay.max += amount
+            self.fish_pull_delay = Range(skill.min, skill.max + amount)
 
-    def lvl_up_hunt(self, amount):
+    def lvl_up_hunt(self, amount, rng=None):
         """
         Increases the player's hunting skill.
 
         The skill gain is multiplied if the player has the 'Hunter' class.
-        The amount is added to either the min or max of the hunt_success_rate range.
+        The hunt_success_rate range is replaced by one with the amount added to its min or max.
 
         :param amount: The base amount to increase the skill by.
         :type amount: float
+        :param rng: The random generator to draw from; defaults to the `random` module.
+        :type rng: random.Random
         """
         if not isinstance(amount, (int, float)) or amount < 0:
             raise ValueError("Amount must be a non-negative number")
 
         if self.player_class.name == "Hunter":
-            amount *= Range(1.01, 1.8).get_random()
+            amount *= CLASS_SKILL_MULTIPLIER.get_random(rng=rng)
 
-        prob = Range(1, 2).get_random(as_int=True)
+        prob = SKILL_SIDE.get_random(as_int=True, rng=rng)
 
-        if prob == 1 and self.hunt_success_rate.min + amount < self.hunt_success_rate.max:
-            if self.hunt_success_rate.min + amount < 1:
-                self.hunt_success_rate.min += amount
+        skill = self.hunt_success_rate
+        if prob == 1 and skill.min + amount < skill.max:
+            if skill.min + amount < 1:
+                self.hunt_success_rate = Range(skill.min + amount, skill.max)
         else:
-            if self.hunt_success_rate.max + amount < 1:
-                self.hunt_success_rate.max += amount
+            if skill.max + amount < 1:
+                self.hunt_success_rate = Range(skill.min, skill.max + amount)
 
-    def lvl_up_run(self, amount):
+    def lvl_up_run(self, amount, rng=None):
         """
         Increases the player's running skill.
 
         The skill gain is multiplied if the player has the 'Hunter' class.
-        The amount is added to either the min or max of the run_success_rate range.
+        The run_success_rate range is replaced by one with the amount added to its min or max.
 
         :param amount: The base amount to increase the skill by.
         :type amount: float
+        :param rng: The random generator to draw from; defaults to the `random` module.
+        :type rng: random.Random
         """
         if not isinstance(amount, (int, float)) or amount < 0:
             raise ValueError("Amount must be a non-negative number")
 
         if self.player_class.name == "Hunter":
-            amount *= Range(1.01, 1.8).get_random()
+            amount *= CLASS_SKILL_MULTIPLIER.get_random(rng=rng)
 
-        prob = Range(1, 2).get_random(as_int=True)
+        prob = SKILL_SIDE.get_random(as_int=True, rng=rng)
 
-        if prob == 1 and self.run_success_rate.min + amount < self.run_success_rate.max:
-            if self.run_success_rate.min + amount <= 1:
-                self.run_success_rate.min += amount
+        skill = self.run_success_rate
+        if prob == 1 and skill.min + amount < skill.max:
+            if skill.min + amount <= 1:
+                self.run_success_rate = Range(skill.min + amount, skill.max)
         else:
-            if self.run_success_rate.max + amount <= 1:
-                self.run_success_rate.max += amount
+            if skill.max + amount <= 1:
+                self.run_success_rate = Range(skill.min, skill.max + amount)
 
     def format_hunger(self):
         """
@@ -333,4 +348,34 @@ class Player:
             run_success_rate=Range.from_dict(data["run_success_rate"]),
             fish_amount=data["fish_amount"],
             meat_amount=data["meat_amount"],
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_trusted_dict(cls, data):
+        """
+        Creates a Player instance from a dictionary without validating it.
+
+        This fast path skips the checks of `__init__` and shares the player class
+        instance. Only use it for data known to come from `to_dict`, such as a save
+        record whose checksum was verified; anything else must go through `from_dict`.
+
+        :param data: The dictionary containing the player's state.
+        :type data: dict
+        :return: A new Player instance.
+        :rtype: Player
+        """
+        player = cls.__new__(cls)
+        player.name = data["name"]
+        player.player_class = PlayerClass.get_shared(data["player_class"]["class_name"])
+        player.hp = data["hp"]
+        player.max_hp = data["max_hp"]
+        player.hunger = data["hunger"]
+        player.max_hunger = data["max_hunger"]
+        player.energy = data["energy"]
+        player.max_energy = data["max_energy"]
+        player.fish_pull_delay = Range(data["fish_pull_delay"]["min"], data["fish_pull_delay"]["max"])
+        player.hunt_success_rate = Range(data["hunt_success_rate"]["min"], data["hunt_success_rate"]["max"])
+        player.run_success_rate = Range(data["run_success_rate"]["min"], data["run_success_rate"]["max"])
+        player.fish_amount = data["fish_amount"]
+        player.meat_amount = data["meat_amount"]
+        return player
\ No newline at end of file
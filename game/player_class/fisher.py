@@ -2,6 +2,8 @@
 from game.player_class.player_class import PlayerClass
 from utils.range import Range
 
+FISHER_BONUS = Range(0.2, 0.2)
+
 
 class Fisher(PlayerClass):
     """
@@ -26,4 +28,4 @@ class Fisher(PlayerClass):
         :param player: The player instance to apply the buffs to.
         :type player: Player
         """
-        player.fish_pull_delay = player.fish_pull_delay.add(Range(0.2, 0.2))
+        player.fish_pull_delay = player.fish_pull_delay.add(FISHER_BONUS)
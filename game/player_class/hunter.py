@@ -2,6 +2,8 @@
 from game.player_class.player_class import PlayerClass
 from utils.range import Range
 
+HUNTER_BONUS = Range(0.1, 0.1)
+
 
 class Hunter(PlayerClass):
     """
@@ -26,5 +28,5 @@ class Hunter(PlayerClass):
         :param player: The player instance to apply the buffs to.
         :type player: Player
         """
-        player.hunt_success_rate = player.hunt_success_rate.add(Range(0.1, 0.1))
-        player.run_success_rate = player.run_success_rate.add(Range(0.1, 0.1))
\ No newline at end of file
+        player.hunt_success_rate = player.hunt_success_rate.add(HUNTER_BONUS)
+        player.run_success_rate = player.run_success_rate.add(HUNTER_BONUS)
\ No newline at end of file
@@ -11,6 +11,8 @@ class PlayerClass(ABC):
     This class defines the common interface for all player classes, ensuring they
     can be applied to a player to grant specific buffs and can be saved and loaded.
     """
+    _shared_instances = {}
+
     def __init__(self, name):
         """
         Initializes the player class.
@@ -74,4 +76,24 @@ class PlayerClass(ABC):
             from game.player_class.fisher import Fisher
             return Fisher()
         else:
-            raise ValueError(f"Unknown class: {class_name}")
\ No newline at end of file
+            raise ValueError(f"Unknown class: {class_name}")
+
+    @classmethod
+    def get_shared(cls, class_name):
+        """
+        Returns a shared instance of the player class with the given name.
+
+        Player classes hold no per-player state, so every player of a class can use
+        the same instance. Instances are created through `from_dict` on first use.
+
+        :param class_name: The name of the class (e.g., "Hunter").
+        :type class_name: str
+        :return: The shared instance of the corresponding subclass.
+        :rtype: PlayerClass
+        :raises ValueError: If the class name is unknown.
+        """
+        instance = PlayerClass._shared_instances.get(class_name)
+        if instance is None:
+            instance = PlayerClass.from_dict({"class_name": class_name})
+            PlayerClass._shared_instances[class_name] = instance
+        return instance
\ No newline at end of file
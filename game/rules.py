@@ -0,0 +1,389 @@
+# This file implements the rules of the game actions, independently of the terminal.
+# Each `resolve_*` function applies one action to a GameManager and returns a result
+# object describing what happened, without printing, sleeping or reading input. The
+# `start_*` functions of `game.actions` render these results for the player, and the
+# simulation runs them directly to play thousands of turns per second.
+
+from game.Animal.animal import Animal
+from game.food.fish import Fish
+from game.food.meat import Meat
+from game.game_manager import GameManager
+from utils.range import Range
+
+FIGHT = "fight"
+RUN = "run"
+HUNT_ACTIONS = (FIGHT, RUN)
+
+FISH_EARLY = "early"
+FISH_CAUGHT = "caught"
+FISH_LATE = "late"
+FISH_OUTCOMES = (FISH_EARLY, FISH_CAUGHT, FISH_LATE)
+
+MAX_SLEEP_HOURS = 48
+
+SUCCESS_ROLL = Range(0, 1.0)
+SUCCESS_EXP = Range(0.008, 0.012)
+FAILURE_EXP = Range(0.002, 0.005)
+ESCAPE_DURATION = Range(1.5, 2.0)
+HUNT_DURATION = Range(2, 2.7)
+# The share of an animal's damage taken when failing to run away.
+RUN_DAMAGE_FACTOR = 0.5
+FISH_DURATION = Range(0.8, 1.5)
+EAT_HEAL_RATE = Range(0.85, 0.95)
+EAT_DURATION_PER_FOOD = Range(0.25, 0.35)
+SLEEP_HEAL_RATE = Range(0.45, 0.65)
+
+
+class HuntResult:
+    """
+    Describes the outcome of a hunt.
+
+    This is the per-encounter record: the animal is the shared prototype of its
+    species, and everything rolled during the encounter is stored here.
+    """
+    __slots__ = ("animal", "action", "success_rate", "success", "meat_drop", "damage", "exp_amount", "time_report")
+
+    def __init__(self, animal, action, success_rate, success, meat_drop, damage, exp_amount, time_report):
+        """
+        Initializes a new HuntResult instance.
+
+        :param animal: The animal that was encountered.
+        :type animal: Animal
+        :param action: The action of the player, FIGHT or RUN.
+        :type action: str
+        :param success_rate: The probability of success that was rolled.
+        :type success_rate: float
+        :param success: True if the animal was killed or escaped.
+        :type success: bool
+        :param meat_drop: The amount of meat gained.
+        :type meat_drop: int
+        :param damage: The HP lost.
+        :type damage: float
+        :param exp_amount: The experience gained.
+        :type exp_amount: float
+        :param time_report: The description of the time passed, from `GameManager.pass_time`.
+        :type time_report: str
+        """
+        self.animal = animal
+        self.action = action
+        self.success_rate = success_rate
+        self.success = success
+        self.meat_drop = meat_drop
+        self.damage = damage
+        self.exp_amount = exp_amount
+        self.time_report = time_report
+
+
+class FishResult:
+    """
+    Describes the outcome of a fishing attempt.
+    """
+    __slots__ = ("outcome", "fish_caught", "exp_amount", "time_report")
+
+    def __init__(self, outcome, fish_caught, exp_amount, time_report):
+        """
+        Initializes a new FishResult instance.
+
+        :param outcome: The reaction of the player: FISH_EARLY, FISH_CAUGHT or FISH_LATE.
+        :type outcome: str
+        :param fish_caught: The amount of fish gained.
+        :type fish_caught: int
+        :param exp_amount: The experience gained.
+        :type exp_amount: float
+        :param time_report: The description of the time passed, from `GameManager.pass_time`.
+        :type time_report: str
+        """
+        self.outcome = outcome
+        self.fish_caught = fish_caught
+        self.exp_amount = exp_amount
+        self.time_report = time_report
+
+
+class EatResult:
+    """
+    Describes the outcome of a meal.
+    """
+    __slots__ = ("food", "amount", "nutrition", "heal_amount", "time_report")
+
+    def __init__(self, food, amount, nutrition, heal_amount, time_report):
+        """
+        Initializes a new EatResult instance.
+
+        :param food: The food that was eaten.
+        :type food: Food
+        :param amount: The amount of food eaten.
+        :type amount: int
+        :param nutrition: The hunger restored.
+        :type nutrition: float
+        :param heal_amount: The HP restored.
+        :type heal_amount: float
+        :param time_report: The description of the time passed, from `GameManager.pass_time`.
+        :type time_report: str
+        """
+        self.food = food
+        self.amount = amount
+        self.nutrition = nutrition
+        self.heal_amount = heal_amount
+        self.time_report = time_report
+
+
+class SleepResult:
+    """
+    Describes the outcome of a sleep.
+    """
+    __slots__ = ("hours", "too_hungry", "heal_amount", "time_report")
+
+    def __init__(self, hours, too_hungry, heal_amount=0, time_report=None):
+        """
+        Initializes a new SleepResult instance.
+
+        :param hours: The hours the player wanted to sleep.
+        :type hours: int
+        :param too_hungry: True if the player was too hungry to sleep, in which case
+            nothing changed.
+        :type too_hungry: bool
+        :param heal_amount: The HP restored.
+        :type heal_amount: float
+        :param time_report: The description of the time passed, from `GameManager.pass_time`.
+        :type time_report: str
+        """
+        self.hours = hours
+        self.too_hungry = too_hungry
+        self.heal_amount = heal_amount
+        self.time_report = time_report
+
+
+def _check_game_manager(game_manager):
+    """
+    Raises a TypeError if game_manager is not an instance of GameManager.
+    """
+    if not isinstance(game_manager, GameManager):
+        raise TypeError("game_manager must be an instance of GameManager")
+
+
+def find_animal(game_manager, rng=None):
+    """
+    Returns the animal encountered when hunting at the current time of day.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param rng: The random generator to draw from; defaults to the generator of the game.
+    :type rng: random.Random
+    :return: The shared prototype of a randomly selected species.
+    :rtype: Animal
+    """
+    _check_game_manager(game_manager)
+    return Animal.get_random(game_manager.get_day_period(), rng=rng or game_manager.rng)
+
+
+def resolve_hunt(game_manager, animal, action, rng=None):
+    """
+    Resolves a fight against, or an escape from, an animal.
+
+    A won fight grants meat, a lost one costs HP; a failed escape costs half the
+    damage of a lost fight. Experience is gained either way, and time passes.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param animal: The encountered animal.
+    :type animal: Animal
+    :param action: The action of the player, FIGHT or RUN.
+    :type action: str
+    :param rng: The random generator to draw from; defaults to the generator of the game.
+    :type rng: random.Random
+    :return: The outcome of the hunt.
+    :rtype: HuntResult
+    :raises TypeError: If game_manager or animal have the wrong type.
+    :raises ValueError: If the action is unknown.
+    """
+    _check_game_manager(game_manager)
+    if not isinstance(animal, Animal):
+        raise TypeError("animal must be an instance of Animal")
+    if action not in HUNT_ACTIONS:
+        raise ValueError(f"action must be one of {HUNT_ACTIONS}")
+
+    rng = rng or game_manager.rng
+    player = game_manager.player
+
+    if action == FIGHT:
+        success_rate = player.hunt_success_rate.subtract(animal.hunt_success_rate_tax).get_random(rng=rng)
+    else:
+        success_rate = player.run_success_rate.subtract(animal.run_success_rate_tax).get_random(rng=rng)
+    success = SUCCESS_ROLL.get_random(rng=rng) <= success_rate
+
+    meat_drop = 0
+    damage = 0
+    if success:
+        if action == FIGHT:
+            meat_drop = animal.meat_drop.get_random(as_int=True, rng=rng)
+            player.meat_amount += meat_drop
+        exp_amount = SUCCESS_EXP.get_random(rng=rng)
+    else:
+        damage = animal.damage.get_random(rng=rng)
+        if action == RUN:
+            damage *= RUN_DAMAGE_FACTOR
+        player.take_damage(damage)
+        exp_amount = FAILURE_EXP.get_random(rng=rng)
+
+    if action == FIGHT:
+        player.lvl_up_hunt(exp_amount, rng)
+    else:
+        player.lvl_up_run(exp_amount, rng)
+
+    if action == RUN and success:
+        time_report = game_manager.pass_time(ESCAPE_DURATION.get_random(rng=rng))
+    else:
+        time_report = game_manager.pass_time(HUNT_DURATION.get_random(rng=rng))
+
+    return HuntResult(animal, action, success_rate, success, meat_drop, damage, exp_amount, time_report)
+
+
+def resolve_fish(game_manager, outcome, rng=None):
+    """
+    Resolves a fishing attempt given the reaction of the player.
+
+    A catch grants one fish, or two for a lucky Fisher. Experience is gained
+    either way, and time passes.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param outcome: The reaction of the player: FISH_EARLY if they pulled before the
+        fish showed up, FISH_CAUGHT if they pulled in time, FISH_LATE otherwise.
+    :type outcome: str
+    :param rng: The random generator to draw from; defaults to the generator of the game.
+    :type rng: random.Random
+    :return: The outcome of the fishing attempt.
+    :rtype: FishResult
+    :raises TypeError: If game_manager is not an instance of GameManager.
+    :raises ValueError: If the outcome is unknown.
+    """
+    _check_game_manager(game_manager)
+    if outcome not in FISH_OUTCOMES:
+        raise ValueError(f"outcome must be one of {FISH_OUTCOMES}")
+
+    rng = rng or game_manager.rng
+    player = game_manager.player
+
+    fish_caught = 0
+    if outcome == FISH_CAUGHT:
+        fish_caught = 1
+        if player.player_class.name == "Fisher" and SUCCESS_ROLL.get_random(rng=rng) < 0.075:
+            fish_caught = 2
+        player.fish_amount += fish_caught
+        exp_amount = SUCCESS_EXP.get_random(rng=rng)
+    else:
+        exp_amount = FAILURE_EXP.get_random(rng=rng)
+
+    player.lvl_up_fish(exp_amount, rng)
+    time_report = game_manager.pass_time(FISH_DURATION.get_random(rng=rng))
+
+    return FishResult(outcome, fish_caught, exp_amount, time_report)
+
+
+def get_food_amount(game_manager, food):
+    """
+    Returns the amount of a food in the player's inventory.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param food: The food to count.
+    :type food: Food
+    :return: The amount of that food.
+    :rtype: int
+    :raises ValueError: If the food is unknown.
+    """
+    if isinstance(food, Meat):
+        return game_manager.player.meat_amount
+    if isinstance(food, Fish):
+        return game_manager.player.fish_amount
+    raise ValueError(f"Unknown food: {food.name}")
+
+
+def resolve_eat(game_manager, food, amount, rng=None):
+    """
+    Resolves a meal, restoring hunger and HP.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param food: The food to eat, an instance of Meat or Fish.
+    :type food: Food
+    :param amount: The amount of food to eat.
+    :type amount: int
+    :param rng: The random generator to draw from; defaults to the generator of the game.
+    :type rng: random.Random
+    :return: The outcome of the meal.
+    :rtype: EatResult
+    :raises TypeError: If game_manager is not an instance of GameManager.
+    :raises ValueError: If the food is unknown or the player does not have that much.
+    """
+    _check_game_manager(game_manager)
+    food_amount = get_food_amount(game_manager, food)
+    if not isinstance(amount, int) or not 1 <= amount <= food_amount:
+        raise ValueError(f"You don't have that much food (you have {food_amount}).")
+
+    rng = rng or game_manager.rng
+    player = game_manager.player
+
+    nutrition = food.nutritional_value.get_random(rng=rng)
+    heal_amount = nutrition * amount * EAT_HEAL_RATE.get_random(rng=rng)
+
+    if isinstance(food, Meat):
+        player.meat_amount -= amount
+    else:
+        player.fish_amount -= amount
+
+    player.eat(amount * nutrition)
+    player.heal(heal_amount)
+    time_report = game_manager.pass_time(amount * EAT_DURATION_PER_FOOD.get_random(rng=rng), tax_hunger=False)
+
+    return EatResult(food, amount, amount * nutrition, heal_amount, time_report)
+
+
+def is_too_hungry_to_sleep(game_manager, hours):
+    """
+    Checks if the player would get too hungry while sleeping.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param hours: The hours to sleep.
+    :type hours: int
+    :return: True if the estimated hunger after sleeping is under 10% of the maximum.
+    :rtype: bool
+    """
+    estimated_hunger_loss = hours * 0.55
+    min_hunger_threshold = game_manager.player.max_hunger * 0.1
+    return game_manager.player.hunger - estimated_hunger_loss < min_hunger_threshold
+
+
+def resolve_sleep(game_manager, hours, rng=None):
+    """
+    Resolves a sleep, restoring energy and HP.
+
+    Nothing happens if the player is too hungry to sleep that long.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param hours: The hours to sleep, between 1 and MAX_SLEEP_HOURS.
+    :type hours: int
+    :param rng: The random generator to draw from; defaults to the generator of the game.
+    :type rng: random.Random
+    :return: The outcome of the sleep.
+    :rtype: SleepResult
+    :raises TypeError: If game_manager is not an instance of GameManager.
+    :raises ValueError: If hours is out of range.
+    """
+    _check_game_manager(game_manager)
+    if not isinstance(hours, int) or not 1 <= hours <= MAX_SLEEP_HOURS:
+        raise ValueError(f"hours must be an integer between 1 and {MAX_SLEEP_HOURS}")
+
+    if is_too_hungry_to_sleep(game_manager, hours):
+        return SleepResult(hours, too_hungry=True)
+
+    rng = rng or game_manager.rng
+    heal_amount = hours * SLEEP_HEAL_RATE.get_random(rng=rng)
+
+    game_manager.player.sleep(hours)
+    game_manager.player.heal(heal_amount)
+    time_report = game_manager.pass_time(hours, tax_energy=False)
+
+    return SleepResult(hours, False, heal_amount, time_report)
@@ -0,0 +1,365 @@
+# This file implements the strategy optimizer built on top of the survival simulator.
+# A candidate strategy is a point of a ParameterSpace, which maps it to a
+# ThresholdPolicy: when to eat and how much, when to sleep and when to hunt in each
+# period of the day, and when to flee. A candidate is scored by the mean days
+# survived over a fixed set of simulated games. The shards of every candidate of a
+# round are played together by one pool of worker processes, and scores are cached
+# by parameters and seed, so a candidate met twice is only simulated once. Two
+# searches are provided: random search, and an evolution strategy that adapts the
+# mean and per-parameter step size of its sampling distribution (a diagonal variant
+# of CMA-ES).
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from game.rules import MAX_SLEEP_HOURS
+from game.simulation.policies import DAY_PERIODS, ThresholdPolicy
+from game.simulation.simulator import MAX_DAYS, SHARD_SIZE, make_shard_tasks, run_shard
+from utils.rng import SeedSequence
+
+RANDOM_SEARCH = "random"
+EVOLUTION = "evolution"
+SEARCH_METHODS = (RANDOM_SEARCH, EVOLUTION)
+
+# Parameters are rounded to this many decimals, so that equal candidates share a cache entry.
+PARAMETER_DECIMALS = 3
+
+
+class Parameter:
+    """
+    A tunable option of ThresholdPolicy and the bounds of its values.
+    """
+    def __init__(self, name, low, high, integer=False):
+        """
+        Initializes a new Parameter instance.
+
+        :param name: The name of the parameter.
+        :type name: str
+        :param low: The smallest value.
+        :type low: float
+        :param high: The largest value.
+        :type high: float
+        :param integer: If True, values are rounded to integers.
+        :type integer: bool
+        """
+        if low >= high:
+            raise ValueError("low must be smaller than high")
+
+        self.name = name
+        self.low = low
+        self.high = high
+        self.integer = integer
+
+    def from_unit(self, unit):
+        """
+        Maps a value between 0 and 1 to the bounds of the parameter.
+
+        :param unit: The value between 0 and 1; clipped if outside.
+        :type unit: float
+        :return: The value of the parameter.
+        :rtype: float or int
+        """
+        value = self.low + min(1.0, max(0.0, unit)) * (self.high - self.low)
+        return round(value) if self.integer else round(value, PARAMETER_DECIMALS)
+
+
+class ParameterSpace:
+    """
+    The search space of the optimizer: candidates are tuples of values in [0, 1],
+    one per parameter, which `make_policy` turns into a ThresholdPolicy.
+    """
+    def __init__(self):
+        """
+        Initializes the ParameterSpace of ThresholdPolicy.
+        """
+        periods = [period.name.lower() for period in DAY_PERIODS]
+        self.parameters = [
+            Parameter("eat_below", 0.1, 0.95),
+            Parameter("eat_share", 0.1, 1.0),
+            Parameter("sleep_hours", 1, MAX_SLEEP_HOURS // 4, integer=True),
+            Parameter("flee_below", 0.0, 0.8),
+            *(Parameter(f"sleep_below_{period}", 0.0, 0.9) for period in periods),
+            *(Parameter(f"hunt_share_{period}", 0.0, 1.0) for period in periods),
+        ]
+
+    def __len__(self):
+        return len(self.parameters)
+
+    def to_values(self, candidate):
+        """
+        Returns the parameter values of a candidate.
+
+        :param candidate: The candidate, one value in [0, 1] per parameter.
+        :type candidate: tuple
+        :return: The values, keyed by parameter name.
+        :rtype: dict
+        """
+        return {parameter.name: parameter.from_unit(unit) for parameter, unit in zip(self.parameters, candidate)}
+
+    def make_policy(self, candidate, name="optimized"):
+        """
+        Returns the ThresholdPolicy of a candidate.
+
+        :param candidate: The candidate, one value in [0, 1] per parameter.
+        :type candidate: tuple
+        :param name: The name of the policy.
+        :type name: str
+        :rtype: ThresholdPolicy
+        """
+        values = self.to_values(candidate)
+        return ThresholdPolicy(
+            name,
+            eat_below=values["eat_below"],
+            eat_share=values["eat_share"],
+            sleep_hours=values["sleep_hours"],
+            flee_below=values["flee_below"],
+            sleep_below=tuple(values[f"sleep_below_{period.name.lower()}"] for period in DAY_PERIODS),
+            hunt_share=tuple(values[f"hunt_share_{period.name.lower()}"] for period in DAY_PERIODS),
+        )
+
+    def cache_key(self, candidate):
+        """
+        Returns the parameter values of a candidate as a hashable tuple.
+
+        Candidates giving the same policy give the same key.
+        """
+        return tuple(parameter.from_unit(unit) for parameter, unit in zip(self.parameters, candidate))
+
+
+class OptimizationResult:
+    """
+    Holds the best candidate found for a player class.
+    """
+    def __init__(self, class_name, method, policy, values, score, validation_score, evaluations, cache_hits):
+        """
+        Initializes a new OptimizationResult instance.
+
+        :param class_name: The name of the player class.
+        :param method: The search method, RANDOM_SEARCH or EVOLUTION.
+        :param policy: The best policy found.
+        :param values: The parameter values of the best policy, keyed by name.
+        :param score: The mean days survived by the best policy during the search.
+        :param validation_score: The mean days survived by the best policy on fresh games.
+        :param evaluations: The number of candidates simulated.
+        :param cache_hits: The number of candidates answered from the cache.
+        """
+        self.class_name = class_name
+        self.method = method
+        self.policy = policy
+        self.values = values
+        self.score = score
+        self.validation_score = validation_score
+        self.evaluations = evaluations
+        self.cache_hits = cache_hits
+
+
+class Optimizer:
+    """
+    Searches the ParameterSpace for the policy surviving the longest, per player class.
+
+    All the candidates of a search are scored on the same games (common random
+    numbers), so differences in score come from the policies and not from luck.
+    The best candidate is then scored again on games it was not selected on.
+    """
+    def __init__(self, games=200, seed=0, max_days=MAX_DAYS, workers=None, shard_size=SHARD_SIZE):
+        """
+        Initializes a new Optimizer instance.
+
+        :param games: The number of games played to score a candidate.
+        :type games: int
+        :param seed: The seed of the search; the same seed and arguments give the same results.
+        :type seed: int
+        :param max_days: The number of days after which a game is stopped.
+        :type max_days: int
+        :param workers: The number of worker processes, or None for one per core.
+        :type workers: int
+        :param shard_size: The number of games played per worker task.
+        :type shard_size: int
+        """
+        if not isinstance(games, int) or games <= 0:
+            raise ValueError("games must be a positive integer")
+        if not isinstance(shard_size, int) or shard_size <= 0:
+            raise ValueError("shard_size must be a positive integer")
+
+        self.space = ParameterSpace()
+        self.games = games
+        self.seed = seed
+        self.max_days = max_days
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.cache = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._executor.shutdown()
+        self._executor = None
+
+    def evaluate(self, class_name, candidates, seed=None):
+        """
+        Returns the mean days survived by each candidate, simulating the uncached ones in parallel.
+
+        :param class_name: The name of the player class.
+        :type class_name: str
+        :param candidates: The candidates to score.
+        :type candidates: list
+        :param seed: The seed of the games; the seed of the optimizer by default.
+        :type seed: int
+        :return: The score of each candidate.
+        :rtype: list
+        """
+        seed = self.seed if seed is None else seed
+        keys = [(class_name, self.space.cache_key(candidate), seed, self.games, self.max_days)
+                for candidate in candidates]
+
+        tasks, owners = [], []
+        pending = {}
+        for key, candidate in zip(keys, candidates):
+            if key in self.cache or key in pending:
+                self.cache_hits += 1
+                continue
+            pending[key] = [0, 0]
+            self.evaluations += 1
+            # Every candidate is named alike, so all of them play the same games, and a
+            # score is the mean `run_simulation` would report for that policy and seed.
+            policy = self.space.make_policy(candidate)
+            for task in make_shard_tasks(class_name, policy, self.games, seed, self.max_days, self.shard_size):
+                tasks.append(task)
+                owners.append(key)
+
+        if tasks:
+            executor = self._executor or ProcessPoolExecutor(max_workers=self.workers)
+            try:
+                for key, (_, _, days) in zip(owners, executor.map(run_shard, tasks)):
+                    pending[key][0] += sum(value * count for value, count in days.items())
+                    pending[key][1] += sum(days.values())
+            finally:
+                if executor is not self._executor:
+                    executor.shutdown()
+            for key, (total, games) in pending.items():
+                self.cache[key] = total / games
+
+        return [self.cache[key] for key in keys]
+
+    def random_search(self, class_name, budget, batch_size=16, rng=None):
+        """
+        Scores candidates drawn uniformly from the ParameterSpace.
+
+        :param class_name: The name of the player class.
+        :type class_name: str
+        :param budget: The number of candidates to draw.
+        :type budget: int
+        :param batch_size: The number of candidates scored in parallel at once.
+        :type batch_size: int
+        :param rng: The random generator drawing the candidates.
+        :type rng: random.Random
+        :return: The best candidate and its score.
+        :rtype: tuple
+        """
+        rng = rng or random.Random(self.seed)
+        best, best_score = None, -math.inf
+        for start in range(0, budget, batch_size):
+            candidates = [tuple(rng.random() for _ in range(len(self.space)))
+                          for _ in range(min(batch_size, budget - start))]
+            for candidate, score in zip(candidates, self.evaluate(class_name, candidates)):
+                if score > best_score:
+                    best, best_score = candidate, score
+        return best, best_score
+
+    def evolution_search(self, class_name, budget, population=16, step_size=0.3, rng=None):
+        """
+        Scores candidates drawn from a Gaussian distribution that moves towards the best ones.
+
+        Every generation, `population` candidates are drawn around the mean; the mean
+        moves to the weighted average of the best half, and the step size of each
+        parameter follows the spread of the best half along it, as the diagonal of
+        the covariance matrix of CMA-ES would.
+
+        :param class_name: The name of the player class.
+        :type class_name: str
+        :param budget: The number of candidates to draw.
+        :type budget: int
+        :param population: The number of candidates per generation; lowered to the
+            budget if it is larger.
+        :type population: int
+        :param step_size: The initial standard deviation of each parameter, in [0, 1] units.
+        :type step_size: float
+        :param rng: The random generator drawing the candidates.
+        :type rng: random.Random
+        :return: The best candidate and its score.
+        :rtype: tuple
+        """
+        if population < 2:
+            raise ValueError("population must be at least 2")
+        if budget < 2:
+            raise ValueError("budget must be at least 2")
+
+        # A generation never draws more candidates than the whole budget.
+        population = min(population, budget)
+        rng = rng or random.Random(self.seed)
+        dimensions = len(self.space)
+        mean = [0.5] * dimensions
+        steps = [step_size] * dimensions
+        parents = population // 2
+        weights = [math.log(parents + 0.5) - math.log(rank + 1) for rank in range(parents)]
+        weights = [weight / sum(weights) for weight in weights]
+        # The step sizes are blended with their previous values, so they shrink gradually.
+        learning_rate = 0.5
+
+        best, best_score = None, -math.inf
+        for _ in range(max(1, budget // population)):
+            candidates = [tuple(min(1.0, max(0.0, rng.gauss(mean[i], steps[i]))) for i in range(dimensions))
+                          for _ in range(population)]
+            scores = self.evaluate(class_name, candidates)
+            ranked = sorted(zip(scores, candidates), key=lambda pair: pair[0], reverse=True)[:parents]
+            if ranked[0][0] > best_score:
+                best_score, best = ranked[0]
+
+            new_mean = [sum(weight * candidate[i] for weight, (_, candidate) in zip(weights, ranked))
+                        for i in range(dimensions)]
+            for i in range(dimensions):
+                spread = math.sqrt(sum(weight * (candidate[i] - mean[i]) ** 2
+                                       for weight, (_, candidate) in zip(weights, ranked)))
+                steps[i] = max(0.01, (1 - learning_rate) * steps[i] + learning_rate * spread)
+            mean = new_mean
+        return best, best_score
+
+    def optimize(self, class_name, method=EVOLUTION, budget=128, population=16):
+        """
+        Searches the best policy for a player class and validates it on fresh games.
+
+        :param class_name: The name of the player class.
+        :type class_name: str
+        :param method: The search method, RANDOM_SEARCH or EVOLUTION.
+        :type method: str
+        :param budget: The number of candidates to draw.
+        :type budget: int
+        :param population: The number of candidates scored in parallel at once.
+        :type population: int
+        :return: The best policy found.
+        :rtype: OptimizationResult
+        :raises ValueError: If the method is unknown.
+        """
+        if method not in SEARCH_METHODS:
+            raise ValueError(f"method must be one of {SEARCH_METHODS}")
+
+        evaluations, cache_hits = self.evaluations, self.cache_hits
+        rng = random.Random(f"{self.seed}:{class_name}:{method}")
+        if method == RANDOM_SEARCH:
+            best, score = self.random_search(class_name, budget, population, rng)
+        else:
+            best, score = self.evolution_search(class_name, budget, population, rng=rng)
+
+        # A seed derived from the search seed, so the validation games differ from the search games.
+        validation_seed = SeedSequence(self.seed).spawn(1)[0].generate_seed()
+        validation_score = self.evaluate(class_name, [best], validation_seed)[0]
+        return OptimizationResult(class_name, method, self.space.make_policy(best, f"{class_name.lower()}-{method}"),
+                                  self.space.to_values(best), score, validation_score,
+                                  self.evaluations - evaluations, self.cache_hits - cache_hits)
@@ -0,0 +1,401 @@
+# This file implements PlayerBatch, the population-scale counterpart of Player.
+# Instead of one object per player, a batch stores each attribute of N games as a
+# NumPy array (a struct of arrays), and applies the player and game manager rules to
+# all of them with a few array operations. A mask selects which players an operation
+# applies to, so players taking different actions on the same turn can share one
+# batch. Batches convert to and from Player and GameManager objects.
+
+from game.game_manager import (ENERGY_HP_TAX_RATE, HUNGER_HP_TAX_RATE, HUNGER_TAX_RATE, LOW_STATUS_RATIO,
+                               GameManager)
+from game.player import CLASS_SKILL_MULTIPLIER, SKILL_SIDE, Player
+from game.player_class.player_class import PlayerClass
+from game.simulation.simulator import PLAYER_CLASSES, SIMULATED_NAME, new_game
+from game.simulation.vectorized import get_day_period_indexes, require_numpy, resolve_encounters
+from utils.range import Range
+
+FLOAT_COLUMNS = ("hp", "max_hp", "hunger", "max_hunger", "energy", "max_energy", "fish_min", "fish_max",
+                 "hunt_min", "hunt_max", "run_min", "run_max", "time")
+INT_COLUMNS = ("fish_amount", "meat_amount", "days_survived", "class_ids")
+COLUMNS = FLOAT_COLUMNS + INT_COLUMNS
+
+FISHER_ID = PLAYER_CLASSES.index("Fisher")
+HUNTER_ID = PLAYER_CLASSES.index("Hunter")
+
+
+class PlayerBatch:
+    """
+    Holds the state of N games as arrays, one column per attribute.
+
+    The skill ranges are split into min and max columns (e.g. hunt_min and
+    hunt_max), and the player classes are stored as indexes into PLAYER_CLASSES.
+    """
+    def __init__(self, columns, names=None, rng=None):
+        """
+        Initializes a new PlayerBatch instance.
+
+        :param columns: An array for every name of COLUMNS, all of the same length.
+        :type columns: dict
+        :param names: The names of the players; SIMULATED_NAME for all by default.
+        :type names: list
+        :param rng: The NumPy random generator; a fresh unseeded one by default.
+        :type rng: numpy.random.Generator
+        :raises KeyError: If a column is missing.
+        :raises ValueError: If the columns do not have the same length.
+        """
+        np = require_numpy()
+        missing_columns = [column for column in COLUMNS if column not in columns]
+        if missing_columns:
+            raise KeyError(f"Missing required columns: {missing_columns}")
+
+        for column in FLOAT_COLUMNS:
+            setattr(self, column, np.array(columns[column], dtype=float))
+        for column in INT_COLUMNS:
+            setattr(self, column, np.array(columns[column], dtype=np.int64))
+
+        self.size = len(self.hp)
+        if any(len(getattr(self, column)) != self.size for column in COLUMNS):
+            raise ValueError("All columns must have the same length")
+        if names is not None and len(names) != self.size:
+            raise ValueError("names must have one entry per player")
+
+        self.names = names
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def alive(self):
+        """
+        Returns a mask of the players whose HP is above zero.
+        """
+        return self.hp > 0
+
+    @classmethod
+    def new_games(cls, class_ids, rng=None):
+        """
+        Creates a batch of new games, as the game does on character creation.
+
+        :param class_ids: The player class of every game, as indexes into PLAYER_CLASSES.
+        :type class_ids: numpy.ndarray
+        :param rng: The NumPy random generator.
+        :type rng: numpy.random.Generator
+        :return: The new batch.
+        :rtype: PlayerBatch
+        """
+        np = require_numpy()
+        templates = cls.from_game_managers([new_game(class_name) for class_name in PLAYER_CLASSES])
+        class_ids = np.asarray(class_ids, dtype=np.intp)
+        return cls({column: getattr(templates, column)[class_ids] for column in COLUMNS}, rng=rng)
+
+    @classmethod
+    def from_game_managers(cls, game_managers, rng=None):
+        """
+        Creates a batch from the state of GameManager instances.
+
+        :param game_managers: The games to copy.
+        :type game_managers: list
+        :param rng: The NumPy random generator.
+        :type rng: numpy.random.Generator
+        :return: The new batch.
+        :rtype: PlayerBatch
+        :raises ValueError: If a player class is not in PLAYER_CLASSES.
+        """
+        players = [game_manager.player for game_manager in game_managers]
+        columns = {
+            "hp": [p.hp for p in players],
+            "max_hp": [p.max_hp for p in players],
+            "hunger": [p.hunger for p in players],
+            "max_hunger": [p.max_hunger for p in players],
+            "energy": [p.energy for p in players],
+            "max_energy": [p.max_energy for p in players],
+            "fish_min": [p.fish_pull_delay.min for p in players],
+            "fish_max": [p.fish_pull_delay.max for p in players],
+            "hunt_min": [p.hunt_success_rate.min for p in players],
+            "hunt_max": [p.hunt_success_rate.max for p in players],
+            "run_min": [p.run_success_rate.min for p in players],
+            "run_max": [p.run_success_rate.max for p in players],
+            "fish_amount": [p.fish_amount for p in players],
+            "meat_amount": [p.meat_amount for p in players],
+            "time": [game_manager.time for game_manager in game_managers],
+            "days_survived": [game_manager.days_survived for game_manager in game_managers],
+        }
+        try:
+            columns["class_ids"] = [PLAYER_CLASSES.index(p.player_class.name) for p in players]
+        except ValueError:
+            raise ValueError(f"Player classes must be one of {PLAYER_CLASSES}")
+        return cls(columns, [p.name for p in players], rng)
+
+    @classmethod
+    def from_players(cls, players, rng=None):
+        """
+        Creates a batch from Player instances, starting their games at the default time.
+
+        :param players: The players to copy.
+        :type players: list
+        :param rng: The NumPy random generator.
+        :type rng: numpy.random.Generator
+        :return: The new batch.
+        :rtype: PlayerBatch
+        """
+        return cls.from_game_managers([GameManager(player) for player in players], rng)
+
+    def to_game_managers(self):
+        """
+        Creates a GameManager instance for every game of the batch.
+
+        :return: The list of games.
+        :rtype: list
+        """
+        columns = {column: getattr(self, column).tolist() for column in COLUMNS}
+        names = self.names or [SIMULATED_NAME] * self.size
+        game_managers = []
+        for i in range(self.size):
+            player = Player(names[i], PlayerClass.from_dict({"class_name": PLAYER_CLASSES[columns["class_ids"][i]]}),
+                            hp=columns["hp"][i], max_hp=columns["max_hp"][i], hunger=columns["hunger"][i],
+                            max_hunger=columns["max_hunger"][i], energy=columns["energy"][i],
+                            max_energy=columns["max_energy"][i],
+                            fish_pull_delay=Range(columns["fish_min"][i], columns["fish_max"][i]),
+                            hunt_success_rate=Range(columns["hunt_min"][i], columns["hunt_max"][i]),
+                            run_success_rate=Range(columns["run_min"][i], columns["run_max"][i]),
+                            fish_amount=columns["fish_amount"][i], meat_amount=columns["meat_amount"][i])
+            game_managers.append(GameManager(player, columns["time"][i], columns["days_survived"][i]))
+        return game_managers
+
+    def to_players(self):
+        """
+        Creates a Player instance for every player of the batch.
+
+        :return: The list of players.
+        :rtype: list
+        """
+        return [game_manager.player for game_manager in self.to_game_managers()]
+
+    def _amounts(self, amount, name):
+        """
+        Broadcasts an amount to one value per player, checking it is non-negative.
+
+        :raises ValueError: If any amount is negative.
+        """
+        np = require_numpy()
+        amount = np.broadcast_to(np.asarray(amount, dtype=float), (self.size,))
+        if np.any(amount < 0):
+            raise ValueError(f"{name} must be non-negative")
+        return amount
+
+    def _mask(self, mask):
+        """
+        Returns the mask of the players an operation applies to; all of them by default.
+        """
+        np = require_numpy()
+        if mask is None:
+            return np.ones(self.size, dtype=bool)
+        return np.asarray(mask, dtype=bool)
+
+    def take_damage(self, damage, mask=None):
+        """
+        Reduces the HP of the players by a given amount; HP cannot go below zero.
+
+        :param damage: The damage, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        np = require_numpy()
+        damage = self._amounts(damage, "Damage")
+        self.hp = np.where(self._mask(mask), np.maximum(0, self.hp - damage), self.hp)
+
+    def heal(self, amount, mask=None):
+        """
+        Increases the HP of the players by a given amount; HP cannot exceed max_hp.
+
+        :param amount: The health restored, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        np = require_numpy()
+        amount = self._amounts(amount, "Heal amount")
+        self.hp = np.where(self._mask(mask), np.minimum(self.max_hp, self.hp + amount), self.hp)
+
+    def take_energy(self, energy, mask=None):
+        """
+        Reduces the energy of the players by a given amount; energy cannot go below zero.
+
+        :param energy: The energy consumed, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        np = require_numpy()
+        energy = self._amounts(energy, "Energy")
+        self.energy = np.where(self._mask(mask), np.maximum(0, self.energy - energy), self.energy)
+
+    def sleep(self, amount, mask=None):
+        """
+        Increases the energy of the players by a given amount; energy cannot exceed max_energy.
+
+        :param amount: The energy restored, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        np = require_numpy()
+        amount = self._amounts(amount, "Sleep amount")
+        self.energy = np.where(self._mask(mask), np.minimum(self.max_energy, self.energy + amount), self.energy)
+
+    def take_hunger(self, amount, mask=None):
+        """
+        Reduces the hunger of the players by a given amount; hunger cannot go below zero.
+
+        :param amount: The hunger inflicted, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        np = require_numpy()
+        amount = self._amounts(amount, "Hunger amount")
+        self.hunger = np.where(self._mask(mask), np.maximum(0, self.hunger - amount), self.hunger)
+
+    def eat(self, amount, mask=None):
+        """
+        Increases the hunger of the players by a given amount; hunger cannot exceed max_hunger.
+
+        :param amount: The hunger restored, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        np = require_numpy()
+        amount = self._amounts(amount, "Eat amount")
+        self.hunger = np.where(self._mask(mask), np.minimum(self.max_hunger, self.hunger + amount), self.hunger)
+
+    def _lvl_up(self, low, high, amount, mask, class_id, cap=None, inclusive=False):
+        """
+        Increases a skill range of the players, as the `Player.lvl_up_*` methods do.
+
+        :param low: The name of the min column of the skill.
+        :param high: The name of the max column of the skill.
+        :param amount: The base amounts.
+        :param mask: The players to apply it to.
+        :param class_id: The player class whose skill gain is multiplied.
+        :param cap: The value the skill cannot reach, or None.
+        :param inclusive: If True, the skill may reach the cap.
+        """
+        np = require_numpy()
+        amount = self._amounts(amount, "Amount")
+        mask = self._mask(mask)
+        multiplier = self.rng.uniform(CLASS_SKILL_MULTIPLIER.min, CLASS_SKILL_MULTIPLIER.max, self.size)
+        amount = np.where(self.class_ids == class_id, amount * multiplier, amount)
+
+        low_values, high_values = getattr(self, low), getattr(self, high)
+        side = self.rng.integers(SKILL_SIDE.min, SKILL_SIDE.max, self.size, endpoint=True)
+        raise_low = (side == SKILL_SIDE.min) & (low_values + amount < high_values)
+
+        new_low, new_high = low_values + amount, high_values + amount
+        if cap is None:
+            low_allowed = high_allowed = True
+        elif inclusive:
+            low_allowed, high_allowed = new_low <= cap, new_high <= cap
+        else:
+            low_allowed, high_allowed = new_low < cap, new_high < cap
+
+        setattr(self, low, np.where(mask & raise_low & low_allowed, new_low, low_values))
+        setattr(self, high, np.where(mask & ~raise_low & high_allowed, new_high, high_values))
+
+    def lvl_up_fish(self, amount, mask=None):
+        """
+        Increases the fishing skill of the players; multiplied for Fishers.
+
+        :param amount: The base amount, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        self._lvl_up("fish_min", "fish_max", amount, mask, FISHER_ID)
+
+    def lvl_up_hunt(self, amount, mask=None):
+        """
+        Increases the hunting skill of the players; multiplied for Hunters.
+
+        :param amount: The base amount, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        self._lvl_up("hunt_min", "hunt_max", amount, mask, HUNTER_ID, cap=1)
+
+    def lvl_up_run(self, amount, mask=None):
+        """
+        Increases the running skill of the players; multiplied for Hunters.
+
+        :param amount: The base amount, as one value or one value per player.
+        :param mask: The players to apply it to; all of them by default.
+        """
+        self._lvl_up("run_min", "run_max", amount, mask, HUNTER_ID, cap=1, inclusive=True)
+
+    def pass_time(self, hours, tax_energy=True, tax_hunger=True, mask=None):
+        """
+        Advances the time of the games, as `GameManager.pass_time` does.
+
+        :param hours: The hours to pass, as one value or one value per game.
+        :param tax_energy: If True, reduces the energy of the players.
+        :type tax_energy: bool
+        :param tax_hunger: If True, reduces the hunger of the players.
+        :type tax_hunger: bool
+        :param mask: The games to apply it to; all of them by default.
+        :raises ValueError: If the hours are not positive for the selected games.
+        """
+        np = require_numpy()
+        hours = np.broadcast_to(np.asarray(hours, dtype=float), (self.size,))
+        mask = self._mask(mask)
+        if np.any(hours[mask] <= 0):
+            raise ValueError("Time must be a positive number")
+
+        time = self.time + hours
+        self.days_survived = np.where(mask, self.days_survived + (time // 24).astype(np.int64), self.days_survived)
+        self.time = np.where(mask, time % 24, self.time)
+
+        hunger_rate = self.rng.uniform(HUNGER_TAX_RATE.min, HUNGER_TAX_RATE.max, self.size)
+        hunger_tax = hours * hunger_rate
+        tired_hours = self._hours_below(self.energy, self.max_energy, 1.0 if tax_energy else 0.0, hours)
+        hungry_hours = self._hours_below(self.hunger, self.max_hunger, hunger_rate if tax_hunger else 0.0, hours)
+        energy_hp_rate = self.rng.uniform(ENERGY_HP_TAX_RATE.min, ENERGY_HP_TAX_RATE.max, self.size)
+        hunger_hp_rate = self.rng.uniform(HUNGER_HP_TAX_RATE.min, HUNGER_HP_TAX_RATE.max, self.size)
+        energy_hp_tax = np.where(mask, tired_hours * energy_hp_rate, 0)
+        hunger_hp_tax = np.where(mask, hungry_hours * hunger_hp_rate, 0)
+        self.hp = np.maximum(0, self.hp - energy_hp_tax - hunger_hp_tax)
+
+        if tax_energy:
+            self.take_energy(np.where(mask, hours, 0))
+        if tax_hunger:
+            self.take_hunger(np.where(mask, hunger_tax, 0))
+
+    @staticmethod
+    def _hours_below(level, maximum, drain_rate, hours):
+        """
+        Returns the hours each stat spends under LOW_STATUS_RATIO of its maximum, as
+        `game.game_manager.get_hours_below` does.
+        """
+        np = require_numpy()
+        threshold = maximum * LOW_STATUS_RATIO
+        drain_rate = np.broadcast_to(drain_rate, level.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = np.where(drain_rate > 0, (level - threshold) / drain_rate, np.inf)
+        return np.where(level < threshold, hours, np.clip(hours - crossing, 0, None))
+
+    def hunt(self, fight, mask=None):
+        """
+        Plays a hunting encounter for the selected players, as `game.rules.resolve_hunt` does.
+
+        :param fight: True where the player fights, False where they run, as one
+            value or one value per player.
+        :param mask: The players who hunt; all of them by default.
+        :return: The indexes of the players who hunted and their encounters.
+        :rtype: tuple
+        """
+        np = require_numpy()
+        fight = np.broadcast_to(np.asarray(fight, dtype=bool), (self.size,))
+        indexes = np.flatnonzero(self._mask(mask))
+        encounters = resolve_encounters(get_day_period_indexes(self.time[indexes]), fight[indexes],
+                                        self.hunt_min[indexes], self.hunt_max[indexes],
+                                        self.run_min[indexes], self.run_max[indexes], self.rng)
+
+        def scatter(values):
+            full = np.zeros(self.size, dtype=values.dtype)
+            full[indexes] = values
+            return full
+
+        hunted = scatter(np.ones(len(indexes), dtype=bool))
+        fought = scatter(encounters.fight)
+        self.meat_amount += scatter(encounters.meat_drop)
+        self.take_damage(scatter(encounters.damage))
+        exp_amount = scatter(encounters.exp_amount)
+        self.lvl_up_hunt(exp_amount, hunted & fought)
+        self.lvl_up_run(exp_amount, hunted & ~fought)
+        self.pass_time(scatter(encounters.duration), mask=hunted)
+        return indexes, encounters
@@ -0,0 +1,215 @@
+# This file defines the decision policies used by the survival simulator.
+# A policy plays the role of the player: it picks the next action from the game
+# state, decides whether to fight or run from an animal, and models the reaction
+# of the player in the fishing minigame. Policies are plain picklable objects, so
+# they can be sent to the worker processes of the simulator.
+
+import math
+from abc import ABC, abstractmethod
+
+from game.food.fish import Fish
+from game.food.meat import Meat
+from game.rules import FIGHT, FISH_CAUGHT, FISH_EARLY, FISH_LATE, MAX_SLEEP_HOURS, RUN, is_too_hungry_to_sleep
+from utils.day_period import DayPeriod
+
+EAT = "eat"
+SLEEP = "sleep"
+HUNT = "hunt"
+FISH = "fish"
+
+MEAT = Meat()
+FISH_FOOD = Fish()
+
+# The order of the per-period values of ThresholdPolicy.
+DAY_PERIODS = (DayPeriod.DAWN, DayPeriod.MORNING, DayPeriod.AFTERNOON, DayPeriod.NIGHT)
+
+
+def _per_period(name, value):
+    """
+    Returns a value given for the whole day or per period as a dictionary keyed by DayPeriod.
+
+    :param name: The name of the option, used in error messages.
+    :type name: str
+    :param value: One number, or one number per entry of DAY_PERIODS.
+    :return: The value of each DayPeriod.
+    :rtype: dict
+    :raises ValueError: If a sequence does not hold one number per period.
+    """
+    if isinstance(value, (int, float)):
+        return {period: value for period in DAY_PERIODS}
+    values = tuple(value)
+    if len(values) != len(DAY_PERIODS):
+        raise ValueError(f"{name} must be a number or one number per period of the day")
+    return dict(zip(DAY_PERIODS, values))
+
+
+class Policy(ABC):
+    """
+    The abstract base class of the simulation policies.
+
+    A decision is a tuple whose first item is the action: (EAT, food, amount),
+    (SLEEP, hours), (HUNT,) or (FISH,). Policies must only return decisions that
+    can be carried out, e.g. never eat food the player does not have.
+    """
+    def __init__(self, name, early_rate=0.1, reaction_time=0.3, reaction_jitter=0.06):
+        """
+        Initializes a new Policy instance.
+
+        :param name: The name of the policy, used in simulation reports.
+        :type name: str
+        :param early_rate: The probability of pulling before the fish shows up.
+        :type early_rate: float
+        :param reaction_time: The mean reaction time of the player, in seconds.
+        :type reaction_time: float
+        :param reaction_jitter: The standard deviation of the reaction time, in seconds.
+        :type reaction_jitter: float
+        """
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("name must be a non-empty string")
+        if not 0 <= early_rate <= 1:
+            raise ValueError("early_rate must be between 0 and 1")
+
+        self.name = name
+        self.early_rate = early_rate
+        self.reaction_time = reaction_time
+        self.reaction_jitter = reaction_jitter
+
+    @abstractmethod
+    def choose_action(self, game_manager, rng):
+        """
+        Returns the next decision of the player.
+
+        :param game_manager: The game manager holding the game state.
+        :type game_manager: GameManager
+        :param rng: The random generator of the game.
+        :type rng: random.Random
+        :return: The decision tuple.
+        :rtype: tuple
+        """
+        pass
+
+    def choose_hunt_action(self, game_manager, animal, rng):
+        """
+        Returns FIGHT or RUN when an animal appears; fights by default.
+        """
+        return FIGHT
+
+    def react_to_fish(self, game_manager, rng):
+        """
+        Returns the outcome of the fishing minigame.
+
+        The player pulls too early with probability `early_rate`; otherwise the fish
+        is caught if the reaction time is within the player's pull delay.
+
+        :param game_manager: The game manager holding the game state.
+        :type game_manager: GameManager
+        :param rng: The random generator of the game.
+        :type rng: random.Random
+        :return: FISH_EARLY, FISH_CAUGHT or FISH_LATE.
+        :rtype: str
+        """
+        if rng.random() < self.early_rate:
+            return FISH_EARLY
+        pull_delay = game_manager.player.fish_pull_delay.get_random(rng=rng)
+        if rng.gauss(self.reaction_time, self.reaction_jitter) <= pull_delay:
+            return FISH_CAUGHT
+        return FISH_LATE
+
+
+class RandomPolicy(Policy):
+    """
+    Picks a random feasible action every turn, as a baseline.
+    """
+    def __init__(self, name="random", **kwargs):
+        super().__init__(name, **kwargs)
+
+    def choose_action(self, game_manager, rng):
+        player = game_manager.player
+        decisions = [(HUNT,), (FISH,)]
+        if player.meat_amount > 0:
+            decisions.append((EAT, MEAT, rng.randint(1, player.meat_amount)))
+        if player.fish_amount > 0:
+            decisions.append((EAT, FISH_FOOD, rng.randint(1, player.fish_amount)))
+        hours = rng.randint(1, 12)
+        if not is_too_hungry_to_sleep(game_manager, hours):
+            decisions.append((SLEEP, hours))
+        return rng.choice(decisions)
+
+    def choose_hunt_action(self, game_manager, animal, rng):
+        return rng.choice((FIGHT, RUN))
+
+
+class ThresholdPolicy(Policy):
+    """
+    Eats and sleeps when hunger or energy fall under a threshold, and forages otherwise.
+
+    The sleep threshold and the hunting share may be given per period of the day,
+    in the order of DAY_PERIODS, to sleep or hunt at some times of the day only.
+    """
+    def __init__(self, name, eat_below=0.5, sleep_below=0.25, sleep_hours=8, hunt_share=0.5, flee_below=0.25,
+                 eat_share=1.0, **kwargs):
+        """
+        Initializes a new ThresholdPolicy instance.
+
+        :param name: The name of the policy, used in simulation reports.
+        :type name: str
+        :param eat_below: Eats when hunger falls under this share of the maximum.
+        :type eat_below: float
+        :param sleep_below: Sleeps when energy falls under this share of the maximum;
+            one value, or one value per period of the day.
+        :type sleep_below: float or tuple
+        :param sleep_hours: The hours slept at once, shortened if the player is too hungry.
+        :type sleep_hours: int
+        :param hunt_share: The probability of hunting rather than fishing when foraging;
+            one value, or one value per period of the day.
+        :type hunt_share: float or tuple
+        :param flee_below: Runs from animals when HP is under this share of the maximum.
+        :type flee_below: float
+        :param eat_share: The share of the missing hunger restored per meal.
+        :type eat_share: float
+        :param kwargs: The reaction model options of `Policy`.
+        """
+        super().__init__(name, **kwargs)
+        if not isinstance(sleep_hours, int) or not 1 <= sleep_hours <= MAX_SLEEP_HOURS:
+            raise ValueError(f"sleep_hours must be an integer between 1 and {MAX_SLEEP_HOURS}")
+        hunt_shares = _per_period("hunt_share", hunt_share)
+        if not all(0 <= share <= 1 for share in hunt_shares.values()):
+            raise ValueError("hunt_share must be between 0 and 1")
+        if not 0 < eat_share <= 1:
+            raise ValueError("eat_share must be greater than 0 and at most 1")
+
+        self.eat_below = eat_below
+        self.sleep_below = _per_period("sleep_below", sleep_below)
+        self.sleep_hours = sleep_hours
+        self.hunt_share = hunt_shares
+        self.flee_below = flee_below
+        self.eat_share = eat_share
+
+    def choose_action(self, game_manager, rng):
+        player = game_manager.player
+        day_period = game_manager.get_day_period()
+
+        if player.hunger < player.max_hunger * self.eat_below and (player.meat_amount or player.fish_amount):
+            food, stock = (MEAT, player.meat_amount) if player.meat_amount else (FISH_FOOD, player.fish_amount)
+            missing = (player.max_hunger - player.hunger) * self.eat_share
+            needed = math.ceil(missing / food.nutritional_value.get_average())
+            return EAT, food, max(1, min(stock, needed))
+
+        if player.energy < player.max_energy * self.sleep_below[day_period]:
+            for hours in range(self.sleep_hours, 0, -1):
+                if not is_too_hungry_to_sleep(game_manager, hours):
+                    return SLEEP, hours
+
+        return (HUNT,) if rng.random() < self.hunt_share[day_period] else (FISH,)
+
+    def choose_hunt_action(self, game_manager, animal, rng):
+        player = game_manager.player
+        return RUN if player.hp < player.max_hp * self.flee_below else FIGHT
+
+
+POLICIES = {
+    "random": RandomPolicy(),
+    "balanced": ThresholdPolicy("balanced"),
+    "hunting": ThresholdPolicy("hunting", hunt_share=1.0),
+    "fishing": ThresholdPolicy("fishing", hunt_share=0.0),
+}
@@ -0,0 +1,249 @@
+# This file implements the Monte Carlo survival simulator.
+# Complete games are played headlessly through `game.rules`, from a fresh player
+# until their HP reaches zero, with a policy making the decisions. Games are split
+# into shards run by a pool of worker processes. The seed of the simulation is split
+# into one seed sequence per player class and policy, keyed by their names, then one
+# per shard and one random generator per game, so every game is reproducible on its
+# own and a report is the same whatever the number of workers or the other classes
+# and policies simulated. The days survived of each game are gathered into one
+# histogram per player class and policy.
+
+import hashlib
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from game.game_manager import GameManager
+from game.player import Player
+from game.player_class.player_class import PlayerClass
+from game.rules import find_animal, resolve_eat, resolve_fish, resolve_hunt, resolve_sleep
+from game.simulation.policies import EAT, FISH, HUNT, SLEEP
+from utils.rng import SeedSequence
+
+PLAYER_CLASSES = ("Fisher", "Hunter")
+SIMULATED_NAME = "Simulated"
+MAX_DAYS = 1000
+SHARD_SIZE = 200
+
+
+def new_game(class_name, rng=None):
+    """
+    Creates the game of a new player, as the game does on character creation.
+
+    :param class_name: The name of the player class, e.g. "Hunter".
+    :type class_name: str
+    :param rng: The random generator of the game; a new unseeded one by default.
+    :type rng: random.Random
+    :return: The game manager of the new game.
+    :rtype: GameManager
+    """
+    player = Player(SIMULATED_NAME, PlayerClass.from_dict({"class_name": class_name}))
+    player.player_class.apply_buff(player)
+    return GameManager(player, rng=rng)
+
+
+def play_turn(game_manager, policy):
+    """
+    Plays the decision of a policy for one turn, drawing from the generator of the game.
+
+    :param game_manager: The game manager holding the game state.
+    :type game_manager: GameManager
+    :param policy: The policy making the decisions.
+    :type policy: Policy
+    :raises ValueError: If the policy made a decision that cannot be carried out.
+    """
+    rng = game_manager.rng
+    decision = policy.choose_action(game_manager, rng)
+    action = decision[0]
+    if action == HUNT:
+        animal = find_animal(game_manager, rng)
+        resolve_hunt(game_manager, animal, policy.choose_hunt_action(game_manager, animal, rng), rng)
+    elif action == FISH:
+        resolve_fish(game_manager, policy.react_to_fish(game_manager, rng), rng)
+    elif action == EAT:
+        resolve_eat(game_manager, decision[1], decision[2], rng)
+    elif action == SLEEP:
+        if resolve_sleep(game_manager, decision[1], rng).too_hungry:
+            raise ValueError(f"Policy '{policy.name}' chose to sleep while too hungry")
+    else:
+        raise ValueError(f"Policy '{policy.name}' chose an unknown action: {action}")
+
+
+def play_game(class_name, policy, rng, max_days=MAX_DAYS):
+    """
+    Plays a complete game until the player dies or survives max_days.
+
+    :param class_name: The name of the player class, e.g. "Hunter".
+    :type class_name: str
+    :param policy: The policy making the decisions.
+    :type policy: Policy
+    :param rng: The random generator of the game.
+    :type rng: random.Random
+    :param max_days: The number of days after which the game is stopped.
+    :type max_days: int
+    :return: The number of days survived.
+    :rtype: int
+    """
+    game_manager = new_game(class_name, rng)
+    while game_manager.player.hp > 0 and game_manager.days_survived < max_days:
+        play_turn(game_manager, policy)
+    return game_manager.days_survived
+
+
+def run_shard(task):
+    """
+    Plays the games of a task made by `make_shard_tasks`; runs in a worker process.
+
+    :param task: A tuple (class name, policy, number of games, seed sequence, max days).
+    :type task: tuple
+    :return: The class name, the policy name and the histogram of days survived.
+    :rtype: tuple
+    """
+    class_name, policy, games, seed_sequence, max_days = task
+    days = Counter(play_game(class_name, policy, game_seed.make_rng(), max_days)
+                   for game_seed in seed_sequence.spawn(games))
+    return class_name, policy.name, days
+
+
+def get_stream_key(class_name, policy_name):
+    """
+    Returns the spawn key identifying the random streams of a player class and policy.
+
+    The key only depends on the two names, so the games of a class and policy are
+    the same whatever other classes and policies are simulated alongside them.
+
+    :param class_name: The name of the player class.
+    :type class_name: str
+    :param policy_name: The name of the policy.
+    :type policy_name: str
+    :return: The spawn key.
+    :rtype: tuple
+    """
+    digest = hashlib.sha256(f"{class_name}:{policy_name}".encode("utf-8")).digest()
+    return (int.from_bytes(digest[:8], "little"),)
+
+
+def make_shard_tasks(class_name, policy, games, seed, max_days=MAX_DAYS, shard_size=SHARD_SIZE):
+    """
+    Splits the games of a player class and policy into the tasks run by `run_shard`.
+
+    :param class_name: The name of the player class.
+    :type class_name: str
+    :param policy: The policy making the decisions.
+    :type policy: Policy
+    :param games: The number of games.
+    :type games: int
+    :param seed: The seed of the simulation.
+    :type seed: int
+    :param max_days: The number of days after which a game is stopped.
+    :type max_days: int
+    :param shard_size: The number of games per task.
+    :type shard_size: int
+    :return: The tasks, one per shard.
+    :rtype: list
+    """
+    shards = range(0, games, shard_size)
+    shard_seeds = SeedSequence(seed, get_stream_key(class_name, policy.name)).spawn(len(shards))
+    return [(class_name, policy, min(shard_size, games - start), shard_seed, max_days)
+            for start, shard_seed in zip(shards, shard_seeds)]
+
+
+class SimulationReport:
+    """
+    Gathers the days survived by the simulated games, per player class and policy.
+    """
+    def __init__(self, max_days=MAX_DAYS):
+        """
+        Initializes an empty SimulationReport instance.
+
+        :param max_days: The number of days after which games were stopped.
+        :type max_days: int
+        """
+        self.max_days = max_days
+        self.histograms = {}
+
+    def add(self, class_name, policy_name, days):
+        """
+        Adds the results of a shard.
+
+        :param class_name: The name of the player class.
+        :type class_name: str
+        :param policy_name: The name of the policy.
+        :type policy_name: str
+        :param days: The histogram of days survived.
+        :type days: Counter
+        """
+        self.histograms.setdefault((class_name, policy_name), Counter()).update(days)
+
+    def summarize(self, class_name, policy_name):
+        """
+        Returns the statistics of the days survived for a player class and policy.
+
+        :return: A dictionary with the 'games', 'mean', 'stdev', 'min', 'p10',
+            'median', 'p90', 'max' and 'capped' (games stopped at max_days) values.
+        :rtype: dict
+        """
+        days = self.histograms[(class_name, policy_name)]
+        values = sorted(days)
+        games = sum(days.values())
+
+        def percentile(share):
+            rank = share * (games - 1)
+            seen = 0
+            for value in values:
+                seen += days[value]
+                if seen > rank:
+                    return value
+            return values[-1]
+
+        mean = sum(value * count for value, count in days.items()) / games
+        variance = sum(count * (value - mean) ** 2 for value, count in days.items()) / games
+        return {
+            "games": games,
+            "mean": mean,
+            "stdev": variance ** 0.5,
+            "min": values[0],
+            "p10": percentile(0.1),
+            "median": percentile(0.5),
+            "p90": percentile(0.9),
+            "max": values[-1],
+            "capped": days[self.max_days],
+        }
+
+
+def run_simulation(games, policies, class_names=PLAYER_CLASSES, workers=None, seed=0, max_days=MAX_DAYS,
+                   shard_size=SHARD_SIZE):
+    """
+    Simulates games for every combination of player class and policy.
+
+    :param games: The number of games per player class and policy.
+    :type games: int
+    :param policies: The policies to simulate.
+    :type policies: list
+    :param class_names: The names of the player classes to simulate.
+    :type class_names: tuple
+    :param workers: The number of worker processes, or None for one per core.
+    :type workers: int
+    :param seed: The seed of the simulation; the same seed and arguments give the same report.
+    :type seed: int
+    :param max_days: The number of days after which a game is stopped.
+    :type max_days: int
+    :param shard_size: The number of games played per worker task.
+    :type shard_size: int
+    :return: The report of the simulation.
+    :rtype: SimulationReport
+    """
+    if not isinstance(games, int) or games <= 0:
+        raise ValueError("games must be a positive integer")
+    if not isinstance(shard_size, int) or shard_size <= 0:
+        raise ValueError("shard_size must be a positive integer")
+
+    tasks = [task for class_name in class_names for policy in policies
+             for task in make_shard_tasks(class_name, policy, games, seed, max_days, shard_size)]
+
+    report = SimulationReport(max_days)
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for class_name, policy_name, days in executor.map(run_shard, tasks):
+            report.add(class_name, policy_name, days)
+    return report
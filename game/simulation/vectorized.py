@@ -0,0 +1,188 @@
+# This file implements the vectorized resolution of hunting encounters with NumPy.
+# `resolve_encounters` samples the species, success rates, outcomes, meat drops,
+# damage, experience and durations of N encounters at once, in a handful of array
+# operations instead of N calls to `game.rules.resolve_hunt`. The draws follow the
+# same distributions as the scalar rules, so batch simulations are statistically
+# equivalent to playing the encounters one by one. NumPy is only needed when these
+# functions are called.
+
+from game.Animal.encounter_table import ENCOUNTER_TABLES
+from game.Animal.registry import SPECIES
+from game.rules import ESCAPE_DURATION, FAILURE_EXP, HUNT_DURATION, RUN_DAMAGE_FACTOR, SUCCESS_EXP, SUCCESS_ROLL
+from utils.day_period import DayPeriod
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DAY_PERIODS = (DayPeriod.DAWN, DayPeriod.MORNING, DayPeriod.AFTERNOON, DayPeriod.NIGHT)
+
+
+def require_numpy():
+    """
+    Returns the numpy module.
+
+    :return: The numpy module.
+    :raises ImportError: If NumPy is not installed.
+    """
+    if numpy is None:
+        raise ImportError("The vectorized simulation requires NumPy, install it with: pip install numpy")
+    return numpy
+
+
+class SpeciesTable:
+    """
+    Holds the attributes of every species as arrays, indexed like `game.Animal.registry.SPECIES`.
+    """
+    def __init__(self):
+        """
+        Initializes a new SpeciesTable instance from the species prototypes.
+        """
+        np = require_numpy()
+        animals = SPECIES
+
+        self.names = [animal.name for animal in animals]
+        self.damage_min = np.array([a.damage.min for a in animals], dtype=float)
+        self.damage_max = np.array([a.damage.max for a in animals], dtype=float)
+        self.hunt_tax_min = np.array([a.hunt_success_rate_tax.min for a in animals], dtype=float)
+        self.hunt_tax_max = np.array([a.hunt_success_rate_tax.max for a in animals], dtype=float)
+        self.run_tax_min = np.array([a.run_success_rate_tax.min for a in animals], dtype=float)
+        self.run_tax_max = np.array([a.run_success_rate_tax.max for a in animals], dtype=float)
+        self.meat_min = np.array([a.meat_drop.min for a in animals], dtype=int)
+        self.meat_max = np.array([a.meat_drop.max for a in animals], dtype=int)
+        # One row of the alias tables of `ENCOUNTER_TABLES` per entry of DAY_PERIODS.
+        self.alias_probability = np.array([ENCOUNTER_TABLES[period].probability for period in DAY_PERIODS])
+        self.alias = np.array([ENCOUNTER_TABLES[period].alias for period in DAY_PERIODS], dtype=np.intp)
+
+
+_species_table = None
+
+
+def get_species_table():
+    """
+    Returns the process-wide SpeciesTable, building it on first use.
+
+    :return: The species table.
+    :rtype: SpeciesTable
+    """
+    global _species_table
+    if _species_table is None:
+        _species_table = SpeciesTable()
+    return _species_table
+
+
+def get_day_period_indexes(times):
+    """
+    Converts in-game times to indexes into DAY_PERIODS.
+
+    :param times: The in-game times, between 0 and 24.
+    :type times: numpy.ndarray
+    :return: The day period indexes.
+    :rtype: numpy.ndarray
+    """
+    np = require_numpy()
+    return np.minimum(np.asarray(times, dtype=float) // 6, 3).astype(np.intp)
+
+
+class EncounterBatch:
+    """
+    Holds the outcomes of N encounters as arrays.
+    """
+    def __init__(self, species, fight, success_rate, success, meat_drop, damage, exp_amount, duration):
+        """
+        Initializes a new EncounterBatch instance.
+
+        :param species: The species indexes, into `game.Animal.registry.SPECIES`.
+        :param fight: True where the player fought, False where they ran.
+        :param success_rate: The success probabilities that were rolled.
+        :param success: True where the animal was killed or escaped.
+        :param meat_drop: The meat gained.
+        :param damage: The HP lost.
+        :param exp_amount: The experience gained, in hunting where fighting, in running otherwise.
+        :param duration: The hours passed.
+        """
+        self.species = species
+        self.fight = fight
+        self.success_rate = success_rate
+        self.success = success
+        self.meat_drop = meat_drop
+        self.damage = damage
+        self.exp_amount = exp_amount
+        self.duration = duration
+
+    def __len__(self):
+        return len(self.species)
+
+
+def sample_species(day_periods, rng):
+    """
+    Samples the species met in N encounters from the alias tables of `Animal.get_random`.
+
+    :param day_periods: The day period indexes of the encounters.
+    :type day_periods: numpy.ndarray
+    :param rng: The NumPy random generator.
+    :type rng: numpy.random.Generator
+    :return: The species indexes.
+    :rtype: numpy.ndarray
+    """
+    np = require_numpy()
+    table = get_species_table()
+    size = len(table.names)
+    draws = rng.random(len(day_periods)) * size
+    columns = np.minimum(draws.astype(np.intp), size - 1)
+    keep = draws - columns < table.alias_probability[day_periods, columns]
+    return np.where(keep, columns, table.alias[day_periods, columns])
+
+
+def resolve_encounters(day_periods, fight, hunt_min, hunt_max, run_min, run_max, rng=None):
+    """
+    Resolves N hunting encounters at once, as `game.rules.resolve_hunt` does one by one.
+
+    Only the outcomes are computed; applying them to players, including leveling up
+    their skills, is up to the caller.
+
+    :param day_periods: The day period indexes of the encounters, see `get_day_period_indexes`.
+    :type day_periods: numpy.ndarray
+    :param fight: True where the player fights, False where they run.
+    :type fight: numpy.ndarray
+    :param hunt_min: The minimum of each player's hunt success rate.
+    :type hunt_min: numpy.ndarray
+    :param hunt_max: The maximum of each player's hunt success rate.
+    :type hunt_max: numpy.ndarray
+    :param run_min: The minimum of each player's run success rate.
+    :type run_min: numpy.ndarray
+    :param run_max: The maximum of each player's run success rate.
+    :type run_max: numpy.ndarray
+    :param rng: The NumPy random generator; a fresh unseeded one by default.
+    :type rng: numpy.random.Generator
+    :return: The outcomes of the encounters.
+    :rtype: EncounterBatch
+    """
+    np = require_numpy()
+    rng = rng if rng is not None else np.random.default_rng()
+    table = get_species_table()
+
+    day_periods = np.asarray(day_periods, dtype=np.intp)
+    fight = np.asarray(fight, dtype=bool)
+    count = len(day_periods)
+
+    species = sample_species(day_periods, rng)
+
+    low = np.where(fight, hunt_min - table.hunt_tax_min[species], run_min - table.run_tax_min[species])
+    high = np.where(fight, hunt_max - table.hunt_tax_max[species], run_max - table.run_tax_max[species])
+    success_rate = rng.uniform(low, high)
+    success = rng.uniform(SUCCESS_ROLL.min, SUCCESS_ROLL.max, count) <= success_rate
+
+    meat_drop = np.where(fight & success,
+                         rng.integers(table.meat_min[species], table.meat_max[species], endpoint=True), 0)
+
+    damage = rng.uniform(table.damage_min[species], table.damage_max[species])
+    damage = np.where(success, 0.0, np.where(fight, damage, damage * RUN_DAMAGE_FACTOR))
+
+    exp_amount = np.where(success, rng.uniform(SUCCESS_EXP.min, SUCCESS_EXP.max, count),
+                          rng.uniform(FAILURE_EXP.min, FAILURE_EXP.max, count))
+    duration = np.where(~fight & success, rng.uniform(ESCAPE_DURATION.min, ESCAPE_DURATION.max, count),
+                        rng.uniform(HUNT_DURATION.min, HUNT_DURATION.max, count))
+
+    return EncounterBatch(species, fight, success_rate, success, meat_drop, damage, exp_amount, duration)
@@ -1,6 +1,48 @@
 """Entry point for launching the game application."""
+import argparse
+
+from game.data.codec import FORMAT_JSON, SAVE_FORMATS
+from game.data.save import migrate_saves, set_save_format
 from game.game import launch_game
+from utils.input_backend import INPUT_BACKENDS, set_input_backend
+from utils.pacing import NORMAL, PACES, set_pace
+
+
+def parse_args():
+    """
+    Parses the command line options of the game.
+
+    :return: The parsed options.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Project Amazonia, a terminal survival game.")
+    parser.add_argument("--save-format", choices=SAVE_FORMATS, default=FORMAT_JSON,
+                        help="format used to write saves (default: %(default)s)")
+    parser.add_argument("--migrate-saves", action="store_true",
+                        help="re-encode every existing save to --save-format, then exit")
+    parser.add_argument("--input-backend", choices=INPUT_BACKENDS, default=None,
+                        help="how key presses are read: from the terminal, or from the keyboard device with "
+                             "the keyboard package (default: terminal, keyboard on Windows)")
+    parser.add_argument("--pace", choices=PACES, default=NORMAL,
+                        help="length of the pauses between messages: normal, fast (a quarter) or instant "
+                             "(none, for scripted runs) (default: %(default)s)")
+    parser.add_argument("--pace-scale", type=float, default=None,
+                        help="custom factor applied to the pauses, overriding the one of --pace")
+    args = parser.parse_args()
+    if args.pace_scale is not None and args.pace_scale < 0:
+        parser.error("--pace-scale must be a non-negative number")
+    return args
+
 
 if __name__ == "__main__":
-    # Launch_game method is called from main.py to start the game.
-    launch_game()
\ No newline at end of file
+    args = parse_args()
+    set_save_format(args.save_format)
+    set_pace(args.pace, args.pace_scale)
+    if args.input_backend:
+        set_input_backend(args.input_backend)
+
+    if args.migrate_saves:
+        print(f"Migrated {migrate_saves(args.save_format)} saves to {args.save_format}.")
+    else:
+        # Launch_game method is called from main.py to start the game.
+        launch_game()
@@ -0,0 +1,81 @@
+"""Entry point for importing, exporting and validating game saves as NDJSON."""
+import argparse
+import sys
+
+from game.data.ndjson import CHUNK_SIZE, export_ndjson, import_ndjson, validate_store
+
+
+def parse_args():
+    """
+    Parses the command line options of the saves tool.
+
+    :return: The parsed options.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Bulk import, export and validation of Project Amazonia saves.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: one per core)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="number of records per worker task (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="write every save as NDJSON")
+    export_parser.add_argument("output", nargs="?", default="-", help="output file (default: stdout)")
+    export_parser.add_argument("--prefix", default="", help="only export players starting with this prefix")
+
+    import_parser = commands.add_parser("import", help="import saves from NDJSON")
+    import_parser.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+    import_parser.add_argument("--dry-run", action="store_true", help="validate the records without importing them")
+
+    validate_parser = commands.add_parser("validate", help="validate every save of the store")
+    validate_parser.add_argument("--prefix", default="", help="only validate players starting with this prefix")
+    return parser.parse_args()
+
+
+def print_report(action, report):
+    """
+    Prints the corrupted entries and the summary of a bulk operation to stderr.
+
+    :param action: The past-tense name of the operation, e.g. "Imported".
+    :type action: str
+    :param report: The report of the operation.
+    :type report: BulkReport
+    """
+    for location, message in report.errors:
+        print(f"{location}: {message}", file=sys.stderr)
+    print(f"{action} {report.valid} of {report.processed} saves, {len(report.errors)} corrupted.", file=sys.stderr)
+
+
+def main():
+    """
+    Runs the command given on the command line and prints its report.
+
+    :return: The exit code, 1 if any record failed, 0 otherwise.
+    :rtype: int
+    """
+    args = parse_args()
+    options = {"workers": args.workers, "chunk_size": args.chunk_size}
+
+    if args.command == "export":
+        if args.output == "-":
+            report = export_ndjson(sys.stdout, args.prefix, **options)
+        else:
+            with open(args.output, "w") as f:
+                report = export_ndjson(f, args.prefix, **options)
+        print_report("Exported", report)
+    elif args.command == "import":
+        if args.input == "-":
+            report = import_ndjson(sys.stdin, dry_run=args.dry_run, **options)
+        else:
+            with open(args.input, "r") as f:
+                report = import_ndjson(f, dry_run=args.dry_run, **options)
+        print_report("Validated" if args.dry_run else "Imported", report)
+    else:
+        report = validate_store(args.prefix, **options)
+        print_report("Validated", report)
+
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Entry point for simulating complete games to measure the balance of the game."""
+import argparse
+import sys
+import time
+
+from game.simulation.optimizer import EVOLUTION, SEARCH_METHODS, Optimizer
+from game.simulation.policies import POLICIES
+from game.simulation.simulator import MAX_DAYS, PLAYER_CLASSES, SHARD_SIZE, run_simulation
+
+
+def parse_args():
+    """
+    Parses the command line options of the simulator.
+
+    :return: The parsed options.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Monte Carlo survival simulation of Project Amazonia.")
+    parser.add_argument("games", type=int, nargs="?", default=1000,
+                        help="number of games per player class and policy (default: %(default)s)")
+    parser.add_argument("--classes", nargs="+", choices=PLAYER_CLASSES, default=list(PLAYER_CLASSES),
+                        help="player classes to simulate (default: all)")
+    parser.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=sorted(POLICIES),
+                        help="policies to simulate (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the simulation (default: %(default)s)")
+    parser.add_argument("--max-days", type=int, default=MAX_DAYS,
+                        help="stop games surviving this many days (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: one per core)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE,
+                        help="number of games per worker task (default: %(default)s)")
+    parser.add_argument("--optimize", choices=SEARCH_METHODS, const=EVOLUTION, nargs="?", default=None,
+                        help="search the best policy of each class instead, scoring every candidate "
+                             "on GAMES games (method default: %(const)s)")
+    parser.add_argument("--budget", type=int, default=128,
+                        help="number of candidate policies tried per class when optimizing (default: %(default)s)")
+    parser.add_argument("--population", type=int, default=16,
+                        help="number of candidates scored in parallel when optimizing (default: %(default)s)")
+    args = parser.parse_args()
+    if args.games <= 0:
+        parser.error("games must be a positive integer")
+    if args.shard_size <= 0:
+        parser.error("--shard-size must be a positive integer")
+    if args.budget < 2:
+        parser.error("--budget must be at least 2")
+    if args.population < 2:
+        parser.error("--population must be at least 2")
+    return args
+
+
+def print_report(report, class_names, policy_names):
+    """
+    Prints the distribution of days survived per player class and policy.
+
+    :param report: The report of the simulation.
+    :type report: SimulationReport
+    :param class_names: The simulated player classes.
+    :type class_names: list
+    :param policy_names: The simulated policies.
+    :type policy_names: list
+    """
+    columns = ["games", "mean", "stdev", "min", "p10", "median", "p90", "max", "capped"]
+    print(f"{'class':<8}{'policy':<10}" + "".join(f"{column:>9}" for column in columns))
+    for class_name in class_names:
+        for policy_name in policy_names:
+            summary = report.summarize(class_name, policy_name)
+            cells = "".join(f"{summary[column]:>9.2f}" if isinstance(summary[column], float)
+                            else f"{summary[column]:>9}" for column in columns)
+            print(f"{class_name:<8}{policy_name:<10}{cells}")
+
+
+def print_optimization(result):
+    """
+    Prints the best policy found for a player class.
+
+    :param result: The result of the search.
+    :type result: OptimizationResult
+    """
+    print(f"{result.class_name} ({result.method}): {result.score:.2f} days on average, "
+          f"{result.validation_score:.2f} on fresh games "
+          f"({result.evaluations} candidates simulated, {result.cache_hits} cached)")
+    for name, value in result.values.items():
+        print(f"    {name:<24}{value}")
+
+
+def optimize(args):
+    """
+    Searches the best policy of each player class and prints them.
+
+    :param args: The parsed options.
+    :type args: argparse.Namespace
+    :return: The exit code.
+    :rtype: int
+    """
+    start = time.perf_counter()
+    with Optimizer(args.games, args.seed, args.max_days, args.workers, args.shard_size) as optimizer:
+        for class_name in args.classes:
+            print_optimization(optimizer.optimize(class_name, args.optimize, args.budget, args.population))
+    elapsed = time.perf_counter() - start
+    print(f"Simulated {optimizer.evaluations * args.games} games in {elapsed:.2f} s.", file=sys.stderr)
+    return 0
+
+
+def main():
+    """
+    Runs the simulation, or the policy search, and prints the report.
+
+    :return: The exit code.
+    :rtype: int
+    """
+    args = parse_args()
+    if args.optimize:
+        return optimize(args)
+    policies = [POLICIES[name] for name in args.policies]
+
+    start = time.perf_counter()
+    report = run_simulation(args.games, policies, args.classes, args.workers, args.seed, args.max_days,
+                            args.shard_size)
+    elapsed = time.perf_counter() - start
+
+    print_report(report, args.classes, args.policies)
+    total = args.games * len(args.classes) * len(policies)
+    print(f"Simulated {total} games in {elapsed:.2f} s ({total / elapsed:,.0f} games/s).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# This file defines the input backends, which wait for single key presses, as the
+# fishing minigame needs. The terminal backend reads the keys typed in the
+# controlling terminal with termios and select: it needs no privileges, and works
+# in containers and over SSH. The keyboard backend listens to the keyboard device
+# through the `keyboard` package, which needs root on Linux; the package is only
+# imported when that backend is selected. The terminal backend is the default on
+# POSIX systems, the keyboard backend on Windows, where termios is not available.
+
+import os
+import select
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+
+TERMINAL = "terminal"
+KEYBOARD = "keyboard"
+INPUT_BACKENDS = (TERMINAL, KEYBOARD)
+
+# The names the keyboard package gives to the keys that are not printable.
+KEYBOARD_KEY_NAMES = {" ": "space", "\n": "enter"}
+
+
+class InputBackend(ABC):
+    """
+    The abstract base class of the input backends.
+    """
+    name = None
+
+    @abstractmethod
+    def wait_for_key(self, key, timeout):
+        """
+        Blocks until a key is pressed or the timeout expires, without polling.
+
+        :param key: The key to wait for, as the character it types, e.g. " ".
+        :type key: str
+        :param timeout: The maximum time to wait, in seconds.
+        :type timeout: float
+        :return: The seconds elapsed until the key was pressed, or None on timeout.
+        :rtype: float
+        """
+        pass
+
+
+class TerminalBackend(InputBackend):
+    """
+    Reads the keys typed in the terminal of the standard input, one at a time.
+
+    The terminal is switched to cbreak mode while waiting, so keys are read as
+    soon as they are typed and are not echoed, and Ctrl+C still interrupts.
+    Keys typed before the wait started are discarded.
+    """
+    name = TERMINAL
+
+    def __init__(self, stream=None):
+        """
+        Initializes a new TerminalBackend instance.
+
+        :param stream: The stream to read the keys from; the standard input by default.
+        :type stream: io.TextIOBase
+        """
+        self.stream = stream or sys.stdin
+
+    def wait_for_key(self, key, timeout):
+        import termios
+        import tty
+
+        fd = self.stream.fileno()
+        is_terminal = os.isatty(fd)
+        if is_terminal:
+            settings = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+            termios.tcflush(fd, termios.TCIFLUSH)
+
+        expected = key.encode()
+        start = time.perf_counter()
+        deadline = start + timeout
+        try:
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                ready, _, _ = select.select([fd], [], [], remaining)
+                if ready:
+                    typed = os.read(fd, 1)
+                    if typed == expected:
+                        return time.perf_counter() - start
+                    if not typed:
+                        # The input was closed: no key can come anymore.
+                        time.sleep(max(0, deadline - time.perf_counter()))
+                        return None
+        finally:
+            if is_terminal:
+                termios.tcsetattr(fd, termios.TCSADRAIN, settings)
+
+
+class KeyboardBackend(InputBackend):
+    """
+    Listens to the keyboard device through the `keyboard` package.
+    """
+    name = KEYBOARD
+
+    def __init__(self):
+        """
+        Initializes a new KeyboardBackend instance, importing the keyboard package.
+
+        :raises ImportError: If the keyboard package is not installed.
+        """
+        try:
+            import keyboard
+        except ImportError as e:
+            raise ImportError("The keyboard input backend requires the keyboard package, "
+                              "install it with: pip install keyboard") from e
+        self.keyboard = keyboard
+
+    def wait_for_key(self, key, timeout):
+        pressed = threading.Event()
+        hook = self.keyboard.on_press_key(KEYBOARD_KEY_NAMES.get(key, key), lambda event: pressed.set())
+        start = time.perf_counter()
+        try:
+            if pressed.wait(timeout):
+                return time.perf_counter() - start
+            return None
+        finally:
+            self.keyboard.unhook(hook)
+
+
+_backend_name = KEYBOARD if os.name == "nt" else TERMINAL
+_backend = None
+
+
+def set_input_backend(name):
+    """
+    Sets the input backend used by this process.
+
+    :param name: The backend to use, one of INPUT_BACKENDS.
+    :type name: str
+    :raises ValueError: If the backend is unknown.
+    """
+    global _backend_name, _backend
+    if name not in INPUT_BACKENDS:
+        raise ValueError(f"Unknown input backend: {name}")
+    _backend_name = name
+    _backend = None
+
+
+def get_input_backend():
+    """
+    Returns the input backend of this process, creating it on first use.
+
+    :return: The input backend.
+    :rtype: InputBackend
+    :raises ImportError: If the keyboard backend is selected but not installed.
+    """
+    global _backend
+    if _backend is None:
+        _backend = KeyboardBackend() if _backend_name == KEYBOARD else TerminalBackend()
+    return _backend
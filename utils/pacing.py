@@ -0,0 +1,58 @@
+# This file defines the pacing of the game: the dramatic pauses between the
+# messages of an action all go through `pause`, which scales them according to the
+# pace chosen at launch. The normal pace keeps the pauses of the original game, the
+# fast pace shortens them, and the instant pace skips them, for scripted runs, demos
+# and tests. Pauses also flush the standard output, so the message before a pause is
+# always shown before the game waits.
+
+import sys
+import time
+
+NORMAL = "normal"
+FAST = "fast"
+INSTANT = "instant"
+PACES = (NORMAL, FAST, INSTANT)
+
+# The factor applied to the length of the pauses at each pace.
+PACE_SCALES = {NORMAL: 1.0, FAST: 0.25, INSTANT: 0.0}
+
+_scale = PACE_SCALES[NORMAL]
+
+
+def set_pace(pace, scale=None):
+    """
+    Sets the pace of the game for this process.
+
+    :param pace: The pace to use, one of PACES.
+    :type pace: str
+    :param scale: A custom factor applied to the pauses, instead of the one of the pace.
+    :type scale: float
+    :raises ValueError: If the pace is unknown or the scale is negative.
+    """
+    global _scale
+    if pace not in PACES:
+        raise ValueError(f"Unknown pace: {pace}")
+    if scale is not None and (not isinstance(scale, (int, float)) or scale < 0):
+        raise ValueError("scale must be a non-negative number")
+    _scale = PACE_SCALES[pace] if scale is None else scale
+
+
+def get_pace_scale():
+    """
+    Returns the factor currently applied to the pauses.
+
+    :rtype: float
+    """
+    return _scale
+
+
+def pause(seconds):
+    """
+    Pauses the game for dramatic effect, scaled by the current pace.
+
+    :param seconds: The length of the pause at the normal pace, in seconds.
+    :type seconds: float
+    """
+    sys.stdout.flush()
+    if _scale > 0:
+        time.sleep(seconds * _scale)
@@ -1,14 +1,19 @@
 # This file defines the Range class, a utility for handling numerical ranges.
 # It provides methods for getting random values within the range, performing
 # arithmetic operations, and serializing/deserializing the object.
+# Ranges are immutable values: arithmetic returns new ranges, so a range can be
+# shared freely, e.g. as a module-level constant or a default argument.
 
 import random
+from itertools import repeat
 
 
 class Range:
     """
-    Represents a numerical range with a minimum and maximum value.
+    Represents an immutable numerical range with a minimum and maximum value.
     """
+    __slots__ = ("min", "max")
+
     def __init__(self, min, max):
         """
         Initializes a new Range instance.
@@ -18,8 +23,28 @@ class Range:
         """
         if min > max:
             raise ValueError(f"min ({min}) must not be bigger than max ({max})")
-        self.min = min
-        self.max = max
+        _set_min(self, min)
+        _set_max(self, max)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Range is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Range is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self.min == other.min and self.max == other.max
+
+    def __hash__(self):
+        return hash((self.min, self.max))
+
+    def __reduce__(self):
+        return Range, (self.min, self.max)
+
+    def __repr__(self):
+        return f"Range({self.min!r}, {self.max!r})"
 
     def get_average(self):
         """
@@ -29,17 +54,28 @@ class Range:
         """
         return (self.min + self.max) / 2
 
-    def get_random(self, as_int=False):
+    def get_random(self, as_int=False, rng=None, n=None):
         """
-        Gets a random value within the range.
-
-        :param as_int: If True, returns a random integer; otherwise, a float.
-        :return: A random number.
-        :rtype: int or float
+        Gets a random value within the range, or a list of n random values.
+
+        :param as_int: If True, returns random integers; otherwise, floats.
+        :param rng: The random generator to draw from; defaults to the `random` module.
+        :type rng: random.Random
+        :param n: If given, the number of values to draw at once.
+        :type n: int
+        :return: A random number, or a list of n random numbers.
+        :rtype: int or float or list
         """
+        rng = rng or random
+        if n is None:
+            if as_int:
+                return rng.randint(self.min, self.max)
+            return rng.uniform(self.min, self.max)
+
         if as_int:
-            return random.randint(self.min, self.max)
-        return random.uniform(self.min, self.max)
+            return rng.choices(range(self.min, self.max + 1), k=n)
+        low, width, draw = self.min, self.max - self.min, rng.random
+        return [low + width * draw() for _ in repeat(None, n)]
 
     def subtract(self, other):
         """
@@ -84,4 +120,9 @@ class Range:
         """
         if "min" not in data or "max" not in data:
             raise KeyError("Dictionary must contain 'min' and 'max'")
-        return cls(data["min"], data["max"])
\ No newline at end of file
+        return cls(data["min"], data["max"])
+
+
+# The slot descriptors write the attributes without going through __setattr__.
+_set_min = Range.min.__set__
+_set_max = Range.max.__set__
@@ -0,0 +1,133 @@
+# This file defines FrameRenderer, which draws the screens of the game in place.
+# Everything printed after `Utils.clear_terminal` is composed in memory, as one
+# frame, until the game waits for the player: `input` flushes the standard output,
+# which emits the frame in a single write. On a terminal, the frame is drawn from
+# the top left corner with ANSI escape codes and only the lines that differ from the
+# previous frame are repainted, so screens change without forking `clear` and
+# without flicker. Output that is not a terminal receives every frame in full.
+
+import os
+import shutil
+import sys
+
+CURSOR_HOME = "\033[H"
+CLEAR_SCREEN = "\033[2J"
+CLEAR_LINE_END = "\033[K"
+CLEAR_SCREEN_END = "\033[J"
+
+
+class FrameRenderer:
+    """
+    Wraps a text stream, usually sys.stdout, to draw frames in place.
+
+    Outside of a frame, or once a frame was emitted, writes go straight to the
+    wrapped stream, so prompts, pauses and partial redraws behave as usual.
+    """
+    def __init__(self, stream, diff=None):
+        """
+        Initializes a new FrameRenderer instance.
+
+        :param stream: The text stream to draw on.
+        :type stream: io.TextIOBase
+        :param diff: If True, only repaints the lines that changed; by default, if the stream is a terminal.
+        :type diff: bool
+        """
+        self.stream = stream
+        self.diff = stream.isatty() if diff is None else diff
+        self._frame = None
+        self._previous = None
+        self._previous_size = None
+        # The rows used since the last frame; typed answers count as one per flush.
+        self._rows = 0
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def new_frame(self):
+        """
+        Starts composing a new frame; it replaces the current screen when it is flushed.
+        """
+        if self._frame is not None:
+            self._emit()
+        self._frame = []
+
+    def write(self, text):
+        """
+        Writes text to the current frame, or to the stream when no frame is being composed.
+
+        :param text: The text to write.
+        :type text: str
+        :return: The number of characters written.
+        :rtype: int
+        """
+        if self._frame is None:
+            self._rows += text.count("\n")
+            return self.stream.write(text)
+        self._frame.append(text)
+        return len(text)
+
+    def flush(self):
+        """
+        Emits the current frame, if any, and flushes the stream.
+        """
+        if self._frame is not None:
+            self._emit()
+        else:
+            self._rows += 1
+        self.stream.flush()
+
+    def _emit(self):
+        """
+        Writes the current frame to the stream in one call, then stops composing.
+        """
+        text = "".join(self._frame)
+        self._frame = None
+
+        if not self.diff:
+            self.stream.write(text)
+            return
+
+        lines = text.split("\n")
+        tail = lines.pop()
+        size = shutil.get_terminal_size()
+        # A frame taller or wider than the terminal scrolls or wraps, and lines no
+        # longer match rows: such frames, and the ones after them, are fully redrawn,
+        # as are frames following output that may have scrolled the screen.
+        fits = len(lines) < size.lines and all(len(line) <= size.columns for line in lines)
+        scrolled = self._rows >= size.lines
+
+        if self._previous is None or size != self._previous_size or scrolled or not fits:
+            self.stream.write(CURSOR_HOME + CLEAR_SCREEN + text)
+        else:
+            parts = [CURSOR_HOME]
+            for i, line in enumerate(lines):
+                if i < len(self._previous) and self._previous[i] == line:
+                    parts.append("\n")
+                else:
+                    parts.append(line + CLEAR_LINE_END + "\n")
+            parts.append(CLEAR_SCREEN_END + tail)
+            self.stream.write("".join(parts))
+
+        self._previous = lines if fits else None
+        self._previous_size = size
+        self._rows = len(lines)
+
+
+_renderer = None
+
+
+def get_renderer():
+    """
+    Returns the renderer of the standard output, installing it on first use.
+
+    :return: The renderer wrapping sys.stdout.
+    :rtype: FrameRenderer
+    """
+    global _renderer
+    if _renderer is None and os.name == "nt":
+        # Enables the ANSI escape codes in the Windows console.
+        os.system("")
+    if _renderer is None or sys.stdout is not _renderer:
+        _renderer = FrameRenderer(sys.stdout)
+        sys.stdout = _renderer
+    return _renderer
@@ -0,0 +1,75 @@
+# This file defines SeedSequence, a utility for deriving independent random seeds.
+# A sequence is identified by its root entropy and its spawn key, the path of child
+# indexes leading to it. Seeds are derived by hashing both, so every child stream is
+# statistically independent from its parent and siblings, and the same root entropy
+# always reproduces the same tree of streams, whatever process generates it.
+
+import hashlib
+import random
+import secrets
+
+
+class SeedSequence:
+    """
+    Derives reproducible, independent seeds for random generators.
+
+    Call `spawn` to split a sequence into children, e.g. one per simulation shard
+    and then one per game, and `make_rng` to get the generator of a sequence.
+    """
+    def __init__(self, entropy=None, spawn_key=()):
+        """
+        Initializes a new SeedSequence instance.
+
+        :param entropy: The root seed; a random one is drawn from the OS if None.
+        :type entropy: int
+        :param spawn_key: The child indexes leading from the root to this sequence.
+        :type spawn_key: tuple
+        """
+        if entropy is None:
+            entropy = secrets.randbits(128)
+        if not isinstance(entropy, int) or entropy < 0:
+            raise ValueError("entropy must be a non-negative integer")
+
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        self._spawned = 0
+
+    def spawn(self, count):
+        """
+        Creates child sequences; successive calls never return the same child twice.
+
+        :param count: The number of children to create.
+        :type count: int
+        :return: The list of child sequences.
+        :rtype: list
+        """
+        children = [SeedSequence(self.entropy, self.spawn_key + (self._spawned + i,)) for i in range(count)]
+        self._spawned += count
+        return children
+
+    def generate_seed(self):
+        """
+        Returns the 128-bit seed of this sequence.
+
+        :rtype: int
+        """
+        key = ":".join(str(part) for part in (self.entropy,) + self.spawn_key)
+        return int.from_bytes(hashlib.sha256(key.encode("ascii")).digest()[:16], "little")
+
+    def make_rng(self):
+        """
+        Returns a new random generator seeded by this sequence.
+
+        :rtype: random.Random
+        """
+        return random.Random(self.generate_seed())
+
+    def make_numpy_rng(self):
+        """
+        Returns a new NumPy random generator seeded by this sequence.
+
+        :rtype: numpy.random.Generator
+        :raises ImportError: If NumPy is not installed.
+        """
+        import numpy
+        return numpy.random.default_rng(self.generate_seed())
@@ -2,9 +2,10 @@
 # application. These helpers handle common tasks such as terminal manipulation,
 # user input validation, UI drawing, and data formatting.
 
-import os
 import sys
 
+from utils.renderer import get_renderer
+
 
 class Utils:
     """
@@ -15,9 +16,10 @@ class Utils:
         """
         Clears the console screen.
 
-        Works on both Windows ('cls') and Unix-based systems ('clear').
+        Starts a new frame of the renderer: what is printed next replaces the screen
+        when the game waits for the player, see `utils.renderer.FrameRenderer`.
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        get_renderer().new_frame()
 
     @staticmethod
     def get_input_int(min, max, label="Enter Int: ", out_of_range_msg="Out of range, try again."):
@@ -107,6 +109,20 @@ class Utils:
         :param label: An optional label to display within the bar.
         :param corners: Optional characters to use for the ends of the bar.
         """
+        print(Utils.format_bar(size, tile, label, corners))
+
+    @staticmethod
+    def format_bar(size, tile, label="", corners=""):
+        """
+        Returns a decorative bar as a string, as `draw_bar` prints it.
+
+        :param size: The total width of the bar.
+        :param tile: The character used to fill the bar.
+        :param label: An optional label to display within the bar.
+        :param corners: Optional characters to use for the ends of the bar.
+        :return: The bar, without a line break.
+        :rtype: str
+        """
         if size <= 0:
             raise ValueError(f"Size must be positive, got {size}.")
 
@@ -114,7 +130,7 @@ class Utils:
         if size < min_size:
             raise ValueError(f"Size too small! Must be at least {min_size}, got {size}.")
 
-        print(f"{corners}{label}{tile * (size - len(label) - 2 * len(corners))}{corners}")
+        return f"{corners}{label}{tile * (size - len(label) - 2 * len(corners))}{corners}"
 
     @staticmethod
     def format_time(time):
@@ -137,6 +153,25 @@ class Utils:
         minutes = int((time - hours) * 60)
         return f"{hours:02d}:{minutes:02d}"
 
+    @staticmethod
+    def format_duration(hours):
+        """
+        Formats a duration in hours into a HH:MM string, which may exceed 24 hours.
+
+        :param hours: The duration in hours (e.g., 30.5 for 30:30).
+        :type hours: float
+        :return: The formatted duration string.
+        :rtype: str
+        """
+        if not isinstance(hours, (int, float)):
+            raise TypeError("Duration must be a number.")
+        if hours < 0:
+            raise ValueError("Duration cannot be negative.")
+
+        whole_hours = int(hours)
+        minutes = int((hours - whole_hours) * 60)
+        return f"{whole_hours:02d}:{minutes:02d}"
+
     @staticmethod
     def format_float(value, decimals=2):
         """